@@ -1,5 +1,9 @@
 from django.contrib import admin
-from .models import Service, Reservation, Review, BusinessHours, Category, ServiceProvider, Notice
+from .models import (
+    Service, Reservation, Review, BusinessHours, BusinessHoursException, Category, ServiceProvider, Notice,
+    ProviderSchedule, ProviderBreak
+)
+from .events import publish_slot_change, slot_event
 from datetime import datetime
 
 
@@ -15,9 +19,19 @@ class CategoryAdmin(admin.ModelAdmin):
         js = ('admin/js/hide_save_buttons.js',)
 
 
+class ProviderScheduleInline(admin.TabularInline):
+    model = ProviderSchedule
+    extra = 0
+
+
+class ProviderBreakInline(admin.TabularInline):
+    model = ProviderBreak
+    extra = 0
+
+
 @admin.register(ServiceProvider)
 class ServiceProviderAdmin(admin.ModelAdmin):
-    list_display = ['name', 'username', 'phone', 'email', 'is_active', 'experience_years', 'created_at']
+    list_display = ['name', 'username', 'phone', 'email', 'is_active', 'experience_years', 'rating_avg', 'rating_count', 'created_at']
     list_filter = ['is_active', 'experience_years', 'created_at']
     search_fields = ['name', 'username', 'description', 'specialties', 'phone', 'email']
     list_editable = ['is_active']
@@ -44,6 +58,8 @@ class ServiceProviderAdmin(admin.ModelAdmin):
     )
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['name']
+    # 근무시간을 등록하지 않으면 가게 영업시간 전체에 근무하는 것으로 봄
+    inlines = [ProviderScheduleInline, ProviderBreakInline]
     
     def save_model(self, request, obj, form, change):
         """비밀번호를 해싱하여 저장"""
@@ -76,7 +92,7 @@ class ServiceProviderAdmin(admin.ModelAdmin):
 
 @admin.register(Service)
 class ServiceAdmin(admin.ModelAdmin):
-    list_display = ['name', 'category', 'provider', 'price', 'duration', 'is_active', 'is_featured', 'stock_quantity', 'created_at']
+    list_display = ['name', 'category', 'provider', 'price', 'duration', 'is_active', 'is_featured', 'stock_quantity', 'rating_avg', 'rating_count', 'created_at']
     list_filter = ['is_active', 'is_featured', 'category', 'provider', 'created_at']
     search_fields = ['name', 'description', 'category__name', 'provider__name']
     list_editable = ['is_active', 'is_featured', 'stock_quantity']
@@ -123,15 +139,25 @@ class ReservationAdmin(admin.ModelAdmin):
     
     def save_model(self, request, obj, form, change):
         """예약 상태 변경 시 시간대 업데이트 처리"""
+        slot_changed = not change
+        previous = None
         if change:  # 기존 객체 수정인 경우
             old_obj = self.model.objects.get(pk=obj.pk)
             old_status = old_obj.status
             new_status = obj.status
+            previous = slot_event(old_obj)
+            
+            # 날짜/시간/제공자/서비스가 바뀌면 이전 시간대와 새 시간대 모두 변경
+            if any(getattr(old_obj, field) != getattr(obj, field)
+                   for field in ('date', 'time', 'provider_id', 'service_id')):
+                slot_changed = True
             
             # 상태가 'pending' 또는 'confirmed'에서 변경되는 경우
             if (old_status != new_status and 
                 (old_status in ['pending', 'confirmed'] or new_status in ['pending', 'confirmed'])):
                 
+                slot_changed = True
+                
                 # 시간대 업데이트 정보를 세션에 저장 (프론트엔드에서 확인 가능하도록)
                 request.session['time_slot_update'] = {
                     'date': obj.date.strftime('%Y-%m-%d'),
@@ -142,6 +168,10 @@ class ReservationAdmin(admin.ModelAdmin):
                 }
         
         super().save_model(request, obj, form, change)
+        
+        # 이벤트 스트림 구독자에게 시간대 변경 알림
+        if slot_changed:
+            publish_slot_change(obj, previous)
     
     def response_change(self, request, obj):
         """상태 변경 후 메시지 표시"""
@@ -194,6 +224,17 @@ class BusinessHoursAdmin(admin.ModelAdmin):
         js = ('admin/js/hide_save_buttons.js',)
 
 
+@admin.register(BusinessHoursException)
+class BusinessHoursExceptionAdmin(admin.ModelAdmin):
+    list_display = ['date', 'is_closed', 'open_time', 'close_time', 'reason']
+    list_filter = ['is_closed']
+    search_fields = ['reason']
+    date_hierarchy = 'date'
+    
+    class Media:
+        js = ('admin/js/hide_save_buttons.js',)
+
+
 @admin.register(Notice)
 class NoticeAdmin(admin.ModelAdmin):
     list_display = ['title', 'priority', 'is_active', 'is_pinned', 'created_at']
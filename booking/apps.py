@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class BookingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'booking'
+
+    def ready(self):
+        # 카탈로그 캐시 무효화 시그널 등록
+        from . import signals  # noqa: F401
+        from .db import apply_sqlite_pragmas
+        connection_created.connect(apply_sqlite_pragmas)
@@ -0,0 +1,42 @@
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+from . import tokens
+
+
+class AccessTokenAuthentication(BaseAuthentication):
+    """
+    Authorization: Bearer <접근 토큰> 인증 (booking.tokens)
+
+    사용자 토큰은 토큰 정보로 만든 User를, 제공자 토큰은 익명 사용자와 함께 request.auth에
+    토큰 내용을 설정합니다. 요청마다 DB나 세션을 조회하지 않습니다.
+    """
+    keyword = b'bearer'
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword:
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed('토큰 헤더 형식이 올바르지 않습니다.')
+        try:
+            token = tokens.verify(auth[1].decode('ascii'))
+        except UnicodeError:
+            raise AuthenticationFailed('유효하지 않은 토큰입니다.')
+        except tokens.InvalidToken as exc:
+            raise AuthenticationFailed(str(exc))
+        if token.kind == tokens.PROVIDER:
+            return AnonymousUser(), token
+        return token.user(), token
+
+    def authenticate_header(self, request):
+        return 'Bearer realm="api"'
+
+
+def provider_id_for(request):
+    """제공자 토큰 또는 세션으로 로그인한 서비스 제공자 ID"""
+    token = request.auth
+    if isinstance(token, tokens.AccessToken):
+        return token.subject_id if token.kind == tokens.PROVIDER else None
+    return request.session.get('provider_id')
@@ -0,0 +1,268 @@
+"""
+예약 가능 시간 계산 엔진
+
+하루 영업시간을 30분 단위 슬롯으로 나누고, 제공자(쌤)의 예약 현황을
+슬롯당 1비트인 점유 비트맵(int)으로 표현합니다.
+서비스 소요시간에 맞는 시작 시간은 비트 연산(윈도우 OR)으로 한 번에 계산합니다.
+제공자의 예약 현황은 예약 변경 시 갱신되는 ProviderDaySlots 행 하나에서 읽습니다.
+"""
+from datetime import timedelta
+
+from django.db.models import Q
+
+from .business_calendar import business_calendar, provider_calendar
+from .conditional import make_etag
+from .models import ProviderDaySlots, Reservation
+
+
+SLOT_MINUTES = 30
+ACTIVE_STATUSES = ('pending', 'confirmed')
+
+
+def time_to_minutes(value):
+    """time 객체를 자정 기준 분 단위로 변환"""
+    return value.hour * 60 + value.minute
+
+
+def format_minutes(minutes):
+    """분 단위 값을 'HH:MM' 문자열로 변환"""
+    return '%02d:%02d' % divmod(minutes, 60)
+
+
+class DaySlots:
+    """
+    하루 예약 점유 비트맵 (슬롯 i = open_time + 30분 * i)
+
+    occupied는 예약된 슬롯, blocked는 제공자 근무시간 밖이거나 휴게시간인 슬롯입니다.
+    """
+
+    __slots__ = ('open_minutes', 'close_minutes', 'slot_count', 'occupied', 'blocked')
+
+    def __init__(self, open_time, close_time, occupied=0):
+        self.open_minutes = time_to_minutes(open_time)
+        self.close_minutes = time_to_minutes(close_time)
+        span = max(self.close_minutes - self.open_minutes, 0)
+        self.slot_count = -(-span // SLOT_MINUTES)
+        self.occupied = occupied
+        self.blocked = 0
+
+    def restrict(self, intervals):
+        """근무 구간((시작분, 종료분) 튜플들)에 완전히 포함되지 않는 슬롯을 차단 (None이면 제한 없음)"""
+        if intervals is None:
+            return self
+        blocked = (1 << self.slot_count) - 1
+        for index in range(self.slot_count):
+            slot_start = self.open_minutes + index * SLOT_MINUTES
+            slot_end = min(slot_start + SLOT_MINUTES, self.close_minutes)
+            for start, end in intervals:
+                if start <= slot_start and slot_end <= end:
+                    blocked &= ~(1 << index)
+                    break
+        self.blocked = blocked
+        return self
+
+    def slot_index(self, value):
+        """시간에 해당하는 슬롯 번호 (슬롯 경계가 아니거나 영업시간 밖이면 None)"""
+        return self.minutes_index(time_to_minutes(value))
+
+    def minutes_index(self, minutes):
+        """자정 기준 분 단위 시각에 해당하는 슬롯 번호"""
+        index, remainder = divmod(minutes - self.open_minutes, SLOT_MINUTES)
+        if remainder or not 0 <= index < self.slot_count:
+            return None
+        return index
+
+    def occupy(self, value):
+        """해당 시간의 슬롯을 예약됨으로 표시"""
+        self.occupy_minutes(time_to_minutes(value))
+
+    def occupy_minutes(self, minutes):
+        index = self.minutes_index(minutes)
+        if index is not None:
+            self.occupied |= 1 << index
+
+    def occupy_all(self, values):
+        for value in values:
+            self.occupy(value)
+        return self
+
+    def start_mask(self, duration, occupied=None):
+        """소요시간(분)의 서비스를 시작할 수 있는 슬롯 비트마스크"""
+        if occupied is None:
+            occupied = self.occupied
+        occupied |= self.blocked
+
+        # 서비스 종료 시간이 마감 시간을 넘지 않는 마지막 시작 슬롯
+        last_start = (self.close_minutes - self.open_minutes - duration) // SLOT_MINUTES
+        if last_start < 0:
+            return 0
+        valid = (1 << (min(last_start, self.slot_count - 1) + 1)) - 1
+
+        # 시작 슬롯부터 서비스가 차지하는 슬롯 수만큼 점유 여부를 OR로 펼침
+        width = -(-duration // SLOT_MINUTES)
+        if width <= 0:
+            return valid
+        blocked = occupied
+        covered = 1
+        while covered < width:
+            step = min(covered, width - covered)
+            blocked |= blocked >> step
+            covered += step
+
+        return valid & ~blocked
+
+    def available_times(self, duration, occupied=None):
+        """예약 가능한 시작 시간 목록 ('HH:MM')"""
+        mask = self.start_mask(duration, occupied)
+        times = []
+        while mask:
+            low = mask & -mask
+            index = low.bit_length() - 1
+            times.append(format_minutes(self.open_minutes + index * SLOT_MINUTES))
+            mask ^= low
+        return times
+
+
+def get_business_hours(target_date, calendar=None):
+    """해당 날짜의 영업시간 (휴무이거나 미등록이면 None, 영업 캘린더에서 쿼리 없이 조회)"""
+    return business_calendar.hours_for(target_date, calendar)
+
+
+def _scoped_reservations(provider_id=None, user=None):
+    """점유 계산 대상 예약 쿼리셋 (제공자 + 해당 사용자의 예약, 제공자가 없으면 전체)"""
+    reservations = Reservation.objects.all()
+    if provider_id is not None:
+        condition = Q(provider_id=provider_id)
+        if user is not None:
+            condition |= Q(user=user)
+        reservations = reservations.filter(condition)
+    return reservations
+
+
+def _active_reservations(provider_id=None, user=None):
+    """점유로 볼 예약 쿼리셋 (대기중/확정 상태)"""
+    return _scoped_reservations(provider_id, user).filter(status__in=ACTIVE_STATUSES)
+
+
+def load_day(target_date, provider_id=None, user=None, business_hours=None):
+    """
+    영업일의 점유 비트맵 구성
+
+    제공자가 있으면 ProviderDaySlots 행 하나를 읽고, user가 주어지면 해당 사용자의
+    다른 예약 시간도 함께 점유로 표시합니다 (쿼리 1~2회).
+    provider_id가 없으면 해당 날짜의 모든 예약을 점유로 봅니다.
+    영업하지 않는 날이면 None을 반환합니다.
+    """
+    if business_hours is None:
+        business_hours = get_business_hours(target_date)
+        if business_hours is None:
+            return None
+
+    day = DaySlots(business_hours.open_time, business_hours.close_time)
+    day.restrict(provider_calendar.working_intervals(provider_id, target_date.weekday()))
+    if provider_id is None:
+        reservations = _active_reservations(provider_id, user).filter(date=target_date)
+        return day.occupy_all(reservations.values_list('time', flat=True))
+
+    occupied = ProviderDaySlots.objects.filter(
+        provider_id=provider_id, date=target_date
+    ).values_list('occupied', flat=True).first()
+    for minutes in occupied or ():
+        day.occupy_minutes(minutes)
+    if user is not None:
+        user_reservations = Reservation.objects.filter(
+            user=user, date=target_date, status__in=ACTIVE_STATUSES
+        )
+        day.occupy_all(user_reservations.values_list('time', flat=True))
+    return day
+
+
+def load_range(start_date, end_date, provider_id=None, user=None):
+    """
+    기간 내 날짜별 점유 비트맵 구성 (점유 현황과 사용자 예약 각각 한 번의 쿼리)
+
+    {날짜: DaySlots} 형태로 반환하며, 영업하지 않는 날은 None입니다.
+    """
+    days = {}
+    calendar = business_calendar.state()
+    schedule = provider_calendar.state() if provider_id is not None else None
+    current = start_date
+    while current <= end_date:
+        business_hours = get_business_hours(current, calendar)
+        if business_hours is None:
+            days[current] = None
+        else:
+            days[current] = DaySlots(business_hours.open_time, business_hours.close_time).restrict(
+                provider_calendar.working_intervals(provider_id, current.weekday(), schedule)
+            )
+        current += timedelta(days=1)
+
+    if provider_id is None:
+        reservations = _active_reservations(provider_id, user)
+    else:
+        for row_date, occupied in ProviderDaySlots.objects.filter(
+            provider_id=provider_id, date__range=(start_date, end_date)
+        ).values_list('date', 'occupied'):
+            day = days.get(row_date)
+            if day is not None:
+                for minutes in occupied:
+                    day.occupy_minutes(minutes)
+        if user is None:
+            return days
+        reservations = Reservation.objects.filter(user=user, status__in=ACTIVE_STATUSES)
+
+    for reserved_date, reserved_time in reservations.filter(
+        date__range=(start_date, end_date)
+    ).values_list('date', 'time'):
+        day = days.get(reserved_date)
+        if day is not None:
+            day.occupy(reserved_time)
+
+    return days
+
+
+def bookable_slot_count(start_date, end_date, provider_id=None):
+    """기간 내 예약 가능한 슬롯 수 (영업시간과 제공자 근무시간 기준, 쿼리 없이 계산)"""
+    total = 0
+    calendar = business_calendar.state()
+    schedule = provider_calendar.state() if provider_id is not None else None
+    current = start_date
+    while current <= end_date:
+        business_hours = get_business_hours(current, calendar)
+        if business_hours is not None:
+            day = DaySlots(business_hours.open_time, business_hours.close_time).restrict(
+                provider_calendar.working_intervals(provider_id, current.weekday(), schedule)
+            )
+            total += day.slot_count - bin(day.blocked).count('1')
+        current += timedelta(days=1)
+    return total
+
+
+def availability_etag(service, target_date, day, user=None):
+    """서비스의 해당 날짜 예약 가능 시간 응답에 대한 ETag (점유 비트맵 내용 기준)"""
+    state = None
+    if day is not None:
+        state = (day.open_minutes, day.close_minutes, day.blocked, day.occupied)
+    return make_etag(
+        'available_times', service.pk, service.provider_id, service.duration, service.updated_at,
+        target_date, user.pk if user is not None else None, state,
+    )
+
+
+def available_times_for(service, target_date, user=None, business_hours=None):
+    """서비스의 해당 날짜 예약 가능 시간 목록 (영업하지 않으면 None)"""
+    day = load_day(
+        target_date, provider_id=service.provider_id, user=user, business_hours=business_hours
+    )
+    if day is None:
+        return None
+    return day.available_times(service.duration)
+
+
+def available_times_for_range(service, start_date, end_date, user=None):
+    """서비스의 기간 내 날짜별 예약 가능 시간 목록 (영업하지 않는 날은 빈 목록)"""
+    days = load_range(start_date, end_date, provider_id=service.provider_id, user=user)
+    return {
+        target_date: day.available_times(service.duration) if day is not None else []
+        for target_date, day in days.items()
+    }
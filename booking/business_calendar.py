@@ -0,0 +1,184 @@
+"""
+영업 캘린더
+
+주간 영업시간(BusinessHours)과 날짜별 예외(BusinessHoursException, 공휴일/특별 영업),
+제공자별 근무시간(ProviderSchedule)과 휴게시간(ProviderBreak)을 프로세스 메모리에
+한 번 읽어 두고 날짜별 영업/근무시간을 쿼리 없이 조회합니다.
+모델 변경 시그널로 캐시의 세대 번호를 올려 다시 읽으며, 공유 캐시를 사용하면
+다른 워커에서의 변경도 다음 조회 때 반영됩니다. 로컬 메모리 캐시처럼 세대 번호를
+공유하지 않는 경우에도 CALENDAR_STATE_MAX_AGE가 지나면 다시 읽습니다.
+"""
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import transaction
+
+from . import catalog
+from .models import BusinessHours, BusinessHoursException, ProviderBreak, ProviderSchedule
+
+
+OpenWindow = namedtuple('OpenWindow', ['open_time', 'close_time'])
+CalendarState = namedtuple('CalendarState', ['generation', 'weekly', 'exceptions'])
+ScheduleState = namedtuple('ScheduleState', ['generation', 'intervals'])
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def subtract_intervals(intervals, removed):
+    """분 단위 구간 목록(겹치면 합침)에서 removed 구간들을 뺀 정렬된 구간 튜플"""
+    result = []
+    for start, end in sorted(intervals):
+        if result and start <= result[-1][1]:
+            result[-1] = (result[-1][0], max(result[-1][1], end))
+        else:
+            result.append((start, end))
+    for remove_start, remove_end in removed:
+        remaining = []
+        for start, end in result:
+            if remove_end <= start or end <= remove_start:
+                remaining.append((start, end))
+                continue
+            if start < remove_start:
+                remaining.append((start, remove_start))
+            if remove_end < end:
+                remaining.append((remove_end, end))
+        result = remaining
+    return tuple(result)
+
+
+class GenerationCachedState:
+    """캐시의 세대 번호가 바뀔 때만 다시 읽는 프로세스 메모리 상태"""
+
+    generation_key = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None
+        self._loaded_at = 0
+
+    def _generation(self):
+        return catalog.get_cache().get(self.generation_key, 0)
+
+    def _load(self, generation):
+        raise NotImplementedError
+
+    def _is_stale(self, state, generation):
+        if state is None or state.generation != generation:
+            return True
+        return time.monotonic() - self._loaded_at >= settings.CALENDAR_STATE_MAX_AGE
+
+    def state(self):
+        generation = self._generation()
+        state = self._state
+        if self._is_stale(state, generation):
+            with self._lock:
+                state = self._state
+                if self._is_stale(state, generation):
+                    state = self._state = self._load(generation)
+                    self._loaded_at = time.monotonic()
+        return state
+
+    def invalidate(self):
+        """세대 번호를 올려 모든 프로세스가 다시 읽도록 함 (커밋 후 한 번 더)"""
+        self._state = None
+        self._bump()
+        transaction.on_commit(self._bump)
+
+    def _bump(self):
+        cache = catalog.get_cache()
+        cache.add(self.generation_key, 0, None)
+        try:
+            cache.incr(self.generation_key)
+        except ValueError:
+            # 증가 직전에 만료/삭제된 경우
+            cache.set(self.generation_key, 1, None)
+
+
+class BusinessCalendar(GenerationCachedState):
+    """날짜별 영업시간 조회 (휴무이거나 미등록이면 None)"""
+
+    generation_key = catalog.CACHE_PREFIX + 'calendar_generation'
+
+    def _load(self, generation):
+        """주간 영업시간 7행과 예외 날짜 전체를 두 번의 쿼리로 읽기"""
+        weekly = {}
+        for hours in BusinessHours.objects.order_by('day', 'id'):
+            if hours.day in weekly:
+                continue
+            weekly[hours.day] = None if hours.is_closed else OpenWindow(hours.open_time, hours.close_time)
+
+        exceptions = {}
+        for exception in BusinessHoursException.objects.all():
+            if exception.is_closed:
+                exceptions[exception.date] = None
+            elif exception.open_time is not None and exception.close_time is not None:
+                exceptions[exception.date] = OpenWindow(exception.open_time, exception.close_time)
+
+        return CalendarState(generation, weekly, exceptions)
+
+    def hours_for(self, target_date, state=None):
+        """
+        해당 날짜의 영업시간 OpenWindow (예외 날짜 우선)
+
+        여러 날짜를 조회할 때는 state()를 한 번 읽어 넘기면 날짜마다 세대 번호를 확인하지 않습니다.
+        """
+        state = state or self.state()
+        if target_date in state.exceptions:
+            return state.exceptions[target_date]
+        return state.weekly.get(target_date.weekday())
+
+
+class ProviderCalendar(GenerationCachedState):
+    """
+    제공자별 요일 근무 구간 (근무시간 - 휴게시간, 자정 기준 분 단위)
+
+    근무시간을 하나도 등록하지 않은 제공자는 None으로, 가게 영업시간 전체에 근무합니다.
+    """
+
+    generation_key = catalog.CACHE_PREFIX + 'provider_schedule_generation'
+
+    def _load(self, generation):
+        """전체 제공자의 근무시간/휴게시간을 두 번의 쿼리로 읽어 요일별 구간으로 컴파일"""
+        shifts = {}
+        for provider_id, day, start_time, end_time in ProviderSchedule.objects.values_list(
+            'provider_id', 'day', 'start_time', 'end_time'
+        ):
+            shifts.setdefault(provider_id, {}).setdefault(day, []).append(
+                (_minutes(start_time), _minutes(end_time))
+            )
+
+        breaks = {}
+        for provider_id, day, start_time, end_time in ProviderBreak.objects.values_list(
+            'provider_id', 'day', 'start_time', 'end_time'
+        ):
+            breaks.setdefault((provider_id, day), []).append((_minutes(start_time), _minutes(end_time)))
+
+        intervals = {
+            provider_id: {
+                day: subtract_intervals(day_shifts, breaks.get((provider_id, day), ()))
+                for day, day_shifts in days.items()
+            }
+            for provider_id, days in shifts.items()
+        }
+        return ScheduleState(generation, intervals)
+
+    def working_intervals(self, provider_id, weekday, state=None):
+        """
+        해당 요일의 근무 구간 튜플 (근무하지 않는 요일은 빈 튜플, 일정 미등록 제공자는 None)
+
+        여러 날짜를 조회할 때는 state()를 한 번 읽어 넘깁니다.
+        """
+        if provider_id is None:
+            return None
+        days = (state or self.state()).intervals.get(provider_id)
+        if days is None:
+            return None
+        return days.get(weekday, ())
+
+
+business_calendar = BusinessCalendar()
+provider_calendar = ProviderCalendar()
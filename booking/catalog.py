@@ -0,0 +1,113 @@
+"""
+공개 카탈로그 캐시 (서비스, 카테고리, 활성 제공자, 영업시간, 공지사항)
+
+모든 페이지에서 읽지만 관리자 화면에서만 바뀌는 목록의 직렬화 결과를
+Django 캐시에 저장합니다. 캐시 적중 시에는 ORM 조회와 직렬화 없이 응답하고,
+모델 저장/삭제 시그널로 관련 항목을 무효화합니다.
+
+캐시 백엔드는 settings.CATALOG_CACHE_ALIAS로 지정합니다. 기본값인 로컬 메모리 캐시는
+프로세스별로 따로 동작하므로, 여러 워커로 운영할 때는 Redis/Memcached 같은
+공유 캐시를 사용해야 다른 워커의 무효화가 반영됩니다.
+"""
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+from .conditional import conditional_response, make_etag
+
+
+CACHE_PREFIX = 'catalog:'
+
+# 모델별로 무효화할 카탈로그 항목 (서비스 응답에는 카테고리/제공자가 포함됨)
+INVALIDATION_MAP = {
+    'Service': ('services',),
+    'Category': ('categories', 'services'),
+    'ServiceProvider': ('providers_active', 'services'),
+    'BusinessHours': ('business_hours',),
+    'Notice': ('notices',),
+}
+CATALOG_NAMES = ('services', 'categories', 'providers_active', 'business_hours', 'notices')
+MAX_VARIANTS = 16
+
+
+class CacheStats:
+    """카탈로그 항목별 캐시 적중/실패 횟수 (프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def record(self, name, hit):
+        with self._lock:
+            counts = self._counts.setdefault(name, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+
+stats = CacheStats()
+
+
+def get_cache():
+    return caches[getattr(settings, 'CATALOG_CACHE_ALIAS', 'default')]
+
+
+def cache_key(name):
+    return CACHE_PREFIX + name
+
+
+def invalidate(*names):
+    """카탈로그 항목 삭제 (트랜잭션 커밋 후에도 한 번 더 삭제해 커밋 전 재적재를 방지)"""
+    keys = [cache_key(name) for name in names]
+    get_cache().delete_many(keys)
+    transaction.on_commit(lambda: get_cache().delete_many(keys))
+
+
+def invalidate_for_model(model):
+    names = INVALIDATION_MAP.get(model.__name__)
+    if names:
+        invalidate(*names)
+
+
+def clear():
+    """모든 카탈로그 항목 삭제"""
+    get_cache().delete_many([cache_key(name) for name in CATALOG_NAMES])
+
+
+def cached_response(request, name, build):
+    """
+    캐시된 카탈로그 응답 (ETag / If-None-Match 포함)
+
+    build()는 직렬화된 데이터를 반환하며 캐시 실패 시에만 호출됩니다.
+    이미지 필드는 요청 호스트 기준 절대 URL이 되고 ?fields= / ?expand=에 따라 응답 모양이
+    달라지므로, 항목 하나에 (호스트, fields, expand) 조합별 결과를 함께 저장합니다.
+    """
+    cache = get_cache()
+    key = cache_key(name)
+    variant = (request.get_host(), request.GET.get('fields', ''), request.GET.get('expand', ''))
+    entry = cache.get(key) or {}
+    cached = entry.get(variant)
+    hit = cached is not None
+    stats.record(name, hit)
+
+    if not hit:
+        data = list(build())
+        cached = {'etag': make_etag(name, variant, data), 'data': data}
+        # 임의의 조합으로 항목이 커지지 않도록 제한
+        if len(entry) >= MAX_VARIANTS:
+            entry = {}
+        entry[variant] = cached
+        cache.set(key, entry, getattr(settings, 'CATALOG_CACHE_TIMEOUT', 3600))
+
+    response = conditional_response(request, cached['etag'], lambda: Response(cached['data']))
+    response['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response
@@ -0,0 +1,59 @@
+"""
+조건부 GET (ETag / If-None-Match) 처리
+
+응답 본문 대신 가벼운 버전 정보(최종 수정 시각, 행 수 등)로 ETag를 만들고,
+클라이언트가 보낸 If-None-Match와 일치하면 직렬화 없이 304를 반환합니다.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
+
+
+def make_etag(*parts):
+    """버전 구성 요소들로 ETag 문자열 생성"""
+    digest = hashlib.md5(repr(parts).encode('utf-8')).hexdigest()
+    return '"%s"' % digest
+
+
+def queryset_version(queryset, *related):
+    """
+    쿼리셋의 버전 정보 (한 번의 집계 쿼리)
+
+    updated_at 최댓값과 행 수를 사용하며, related에 지정한 관계의
+    updated_at 최댓값과 연결 수도 함께 포함합니다.
+    """
+    aggregates = {
+        'updated_at': Max('updated_at'),
+        'count': Count('pk'),
+    }
+    for name in related:
+        aggregates[name + '_updated_at'] = Max(name + '__updated_at')
+        aggregates[name + '_count'] = Count(name)
+    version = queryset.order_by().aggregate(**aggregates)
+    return tuple(sorted(version.items()))
+
+
+def etag_matches(request, etag):
+    """If-None-Match 헤더가 ETag와 일치하는지 확인"""
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    # 압축 미들웨어가 약한 ETag(W/)로 바꿔 보내므로 약한 비교
+    etags = [tag[2:] if tag.startswith('W/') else tag for tag in parse_etags(header)]
+    return '*' in etags or etag in etags
+
+
+def conditional_response(request, etag, respond):
+    """ETag가 일치하면 304, 아니면 respond()의 응답에 ETag를 붙여 반환"""
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = respond()
+    response['ETag'] = etag
+    # 캐시는 하되 매번 서버에 재검증 (사용자별 응답이 있으므로 private)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,162 @@
+"""
+제공자 일별 점유 현황(ProviderDaySlots) 유지
+
+예약이 생성/수정/삭제될 때 영향을 받는 (제공자, 날짜) 행만 예약 테이블에서 다시 계산합니다.
+행을 먼저 잠근 뒤 계산하므로 같은 날짜의 동시 예약 변경도 순서대로 반영됩니다.
+"""
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .availability import ACTIVE_STATUSES, time_to_minutes
+from .models import ProviderDaySlots, Reservation
+
+
+def active_minutes(reservations):
+    """(제공자, 날짜)별 활성 예약 시작 시각(분) 정렬 목록"""
+    slots = {}
+    for provider_id, reserved_date, reserved_time in reservations.filter(
+        status__in=ACTIVE_STATUSES, provider__isnull=False
+    ).values_list('provider_id', 'date', 'time').iterator(chunk_size=2000):
+        slots.setdefault((provider_id, reserved_date), []).append(time_to_minutes(reserved_time))
+    return {key: sorted(minutes) for key, minutes in slots.items()}
+
+
+def _locked_row(provider_id, target_date):
+    queryset = ProviderDaySlots.objects.select_for_update()
+    try:
+        return queryset.get(provider_id=provider_id, date=target_date)
+    except ProviderDaySlots.DoesNotExist:
+        pass
+    try:
+        with transaction.atomic():
+            return ProviderDaySlots.objects.create(provider_id=provider_id, date=target_date)
+    except IntegrityError:
+        # 다른 트랜잭션이 먼저 만든 경우
+        return queryset.get(provider_id=provider_id, date=target_date)
+
+
+def refresh(provider_id, target_date):
+    """한 제공자의 한 날짜 점유 현황을 예약 테이블 기준으로 갱신"""
+    if provider_id is None:
+        return
+    with transaction.atomic():
+        row = _locked_row(provider_id, target_date)
+        occupied = sorted(
+            time_to_minutes(reserved_time)
+            for reserved_time in Reservation.objects.filter(
+                provider_id=provider_id, date=target_date, status__in=ACTIVE_STATUSES
+            ).values_list('time', flat=True)
+        )
+        if occupied != row.occupied:
+            row.occupied = occupied
+            row.save(update_fields=['occupied', 'updated_at'])
+
+
+def find_mismatches(start_date=None, end_date=None):
+    """
+    점유 현황과 예약 테이블의 차이 목록
+
+    [(provider_id, date, 저장된 목록, 예약 기준 목록)] 형태이며, 행이 없으면 저장된 목록은 None입니다.
+    """
+    reservations = Reservation.objects.all()
+    rows = ProviderDaySlots.objects.all()
+    if start_date is not None:
+        reservations = reservations.filter(date__gte=start_date)
+        rows = rows.filter(date__gte=start_date)
+    if end_date is not None:
+        reservations = reservations.filter(date__lte=end_date)
+        rows = rows.filter(date__lte=end_date)
+
+    expected = active_minutes(reservations)
+    stored = {
+        (provider_id, row_date): occupied
+        for provider_id, row_date, occupied in rows.values_list('provider_id', 'date', 'occupied')
+    }
+
+    mismatches = []
+    for key in sorted(set(expected) | set(stored), key=lambda item: (item[1], item[0])):
+        actual = stored.get(key)
+        wanted = expected.get(key, [])
+        # 행이 없는 날짜는 빈 점유로 보므로 예약이 없으면 정상
+        if (actual or []) != wanted:
+            mismatches.append((key[0], key[1], actual, wanted))
+    return mismatches
+
+
+def _sync(expected, existing, batch_size):
+    """계산한 점유 현황(expected)에 맞춰 잠근 행(existing)을 수정하고 없는 행을 생성"""
+    created = [
+        ProviderDaySlots(provider_id=provider_id, date=row_date, occupied=occupied)
+        for (provider_id, row_date), occupied in expected.items()
+        if (provider_id, row_date) not in existing
+    ]
+    ProviderDaySlots.objects.bulk_create(created, batch_size=batch_size)
+
+    changed = []
+    now = timezone.now()
+    for key, row in existing.items():
+        occupied = expected.get(key, [])
+        if row.occupied != occupied:
+            row.occupied = occupied
+            row.updated_at = now
+            changed.append(row)
+    ProviderDaySlots.objects.bulk_update(changed, ['occupied', 'updated_at'], batch_size=batch_size)
+    return {'created': len(created), 'updated': len(changed)}
+
+
+def refresh_many(keys, batch_size=1000):
+    """
+    여러 (제공자, 날짜) 점유 현황을 한 번에 갱신 (생성/수정 건수 반환)
+
+    일괄 등록처럼 많은 예약을 바꾼 경우 행마다 refresh를 호출하지 않고, 날짜 범위 전체를
+    rebuild하지도 않도록 바뀐 키만 날짜 묶음 단위로 다시 계산합니다.
+    """
+    by_date = {}
+    for provider_id, target_date in keys:
+        if provider_id is not None:
+            by_date.setdefault(target_date, set()).add(provider_id)
+    dates = sorted(by_date)
+
+    result = {'created': 0, 'updated': 0}
+    with transaction.atomic():
+        # IN 절 파라미터 수 제한(SQLite)을 넘지 않도록 날짜 500개씩 조회
+        for start in range(0, len(dates), 500):
+            chunk = dates[start:start + 500]
+            wanted = {(provider_id, target_date) for target_date in chunk for provider_id in by_date[target_date]}
+            provider_ids = {provider_id for provider_id, _ in wanted}
+            existing = {
+                (row.provider_id, row.date): row for row in ProviderDaySlots.objects.select_for_update().filter(
+                    provider_id__in=provider_ids, date__in=chunk
+                ).only('id', 'provider_id', 'date', 'occupied')
+                if (row.provider_id, row.date) in wanted
+            }
+            expected = {
+                key: occupied for key, occupied in active_minutes(
+                    Reservation.objects.filter(provider_id__in=provider_ids, date__in=chunk)
+                ).items() if key in wanted
+            }
+            counts = _sync(expected, existing, batch_size)
+            result['created'] += counts['created']
+            result['updated'] += counts['updated']
+    return result
+
+
+def rebuild(start_date=None, end_date=None, batch_size=1000):
+    """예약 테이블에서 점유 현황을 처음부터 다시 계산 (생성/수정 건수 반환)"""
+    reservations = Reservation.objects.all()
+    rows = ProviderDaySlots.objects.all()
+    if start_date is not None:
+        reservations = reservations.filter(date__gte=start_date)
+        rows = rows.filter(date__gte=start_date)
+    if end_date is not None:
+        reservations = reservations.filter(date__lte=end_date)
+        rows = rows.filter(date__lte=end_date)
+
+    with transaction.atomic():
+        expected = active_minutes(reservations)
+        existing = {
+            (row.provider_id, row.date): row for row in rows.select_for_update().only(
+                'id', 'provider_id', 'date', 'occupied'
+            )
+        }
+        return _sync(expected, existing, batch_size)
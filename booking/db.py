@@ -0,0 +1,31 @@
+"""
+데이터베이스 연결 설정
+
+SQLite 연결이 열릴 때 settings.SQLITE_PRAGMAS(캐시/mmap 등 연결 단위 설정)를 적용합니다.
+Django 4.2의 SQLite 백엔드에는 연결 초기화 명령 옵션이 없으므로 connection_created 시그널을 사용합니다.
+
+저널 모드(WAL)는 DB 파일에 기록되어 유지되므로 연결마다 바꾸지 않고 serve 명령이 시작할 때
+한 번 전환합니다. (manage.py 명령이나 테스트가 DB 파일을 WAL로 바꾸고 -wal/-shm 파일을 만들지 않음)
+"""
+from django.conf import settings
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    # 디버그 쿼리 기록을 거치지 않도록 DB-API 연결에서 직접 실행
+    raw = connection.connection
+    for name, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+        raw.execute(f'PRAGMA {name} = {value}')
+    # synchronous=NORMAL은 WAL 모드에서만 안전하므로 WAL로 전환된 파일에만 적용
+    if raw.execute('PRAGMA journal_mode').fetchone()[0] == 'wal':
+        raw.execute('PRAGMA synchronous = NORMAL')
+
+
+def set_journal_mode(connection, mode=None):
+    """SQLite DB 파일의 저널 모드 전환 (적용된 모드 반환, SQLite가 아니면 None)"""
+    if connection.vendor != 'sqlite':
+        return None
+    mode = mode or settings.SQLITE_JOURNAL_MODE
+    connection.ensure_connection()
+    return connection.connection.execute(f'PRAGMA journal_mode = {mode}').fetchone()[0]
@@ -0,0 +1,220 @@
+"""
+예약 시간대 변경 이벤트 (Server-Sent Events)
+
+예약이 생성/취소되거나 상태가 바뀌면 (서비스, 제공자, 날짜) 단위의
+시간대 변경 이벤트를 프로세스 내 브로커로 발행하고,
+ASGI로 실행 중일 때 /api/events/slots/ 스트림을 구독한 브라우저에 즉시 전달합니다.
+
+브로커는 프로세스 메모리에만 존재하므로 단일 프로세스(단일 노드) 배포를 전제로 합니다.
+"""
+import asyncio
+import json
+import threading
+from datetime import datetime
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.utils import timezone
+
+
+SLOT_EVENTS_PATH = '/api/events/slots/'
+KEEPALIVE_SECONDS = 15
+QUEUE_SIZE = 100
+
+
+class Subscription:
+    """구독 하나 (제공자/날짜 필터와 이벤트 큐)"""
+
+    def __init__(self, loop, provider_id=None, date=None):
+        self.loop = loop
+        self.provider_id = provider_id
+        self.date = date
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+    def matches(self, event):
+        if self.date is not None and event['date'] != self.date:
+            return False
+        # 제공자가 없는 서비스는 같은 날짜의 모든 예약에 영향을 받음
+        if self.provider_id is not None and event['provider_id'] != self.provider_id:
+            return False
+        return True
+
+    def deliver(self, event):
+        """이벤트 루프 스레드에서 호출됨 (큐가 가득 차면 버림)"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass
+
+
+class SlotEventBroker:
+    """프로세스 내 시간대 변경 이벤트 브로커"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = set()
+
+    def subscribe(self, provider_id=None, date=None):
+        subscription = Subscription(asyncio.get_running_loop(), provider_id, date)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscriptions)
+
+    def publish(self, event):
+        """이벤트 발행 (동기 뷰 스레드에서도 안전하게 호출 가능)"""
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.matches(event)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독
+                self.unsubscribe(subscription)
+        return len(targets)
+
+
+broker = SlotEventBroker()
+
+
+def slot_event(reservation, status=None):
+    """예약으로부터 시간대 변경 이벤트 생성"""
+    return {
+        'type': 'time_slot_update',
+        'service_id': reservation.service_id,
+        'provider_id': reservation.provider_id,
+        'date': reservation.date.strftime('%Y-%m-%d'),
+        'status': status or reservation.status,
+        'timestamp': timezone.now().isoformat(),
+    }
+
+
+def publish_slot_change(reservation, previous=None):
+    """
+    예약의 시간대 변경을 커밋 이후에 발행
+
+    previous는 수정 전 예약의 이벤트(slot_event)로, 날짜/제공자/서비스가 바뀌었으면
+    비게 된 이전 시간대의 구독자에게도 알립니다.
+    """
+    event = slot_event(reservation)
+    events = [event]
+    if previous is not None and any(
+        previous[key] != event[key] for key in ('service_id', 'provider_id', 'date')
+    ):
+        events.append(dict(previous, status=event['status'], timestamp=event['timestamp']))
+
+    def publish():
+        for item in events:
+            broker.publish(item)
+    transaction.on_commit(publish)
+
+
+def _get_service_provider_id(service_id):
+    from .models import Service
+    return Service.objects.filter(id=service_id).values_list('provider_id', flat=True).first()
+
+
+def _encode(event):
+    return ('event: %s\ndata: %s\n\n' % (
+        event['type'], json.dumps(event, ensure_ascii=False)
+    )).encode('utf-8')
+
+
+async def _send_json_error(send, status, message):
+    body = json.dumps({'error': message}, ensure_ascii=False).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json')],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def slot_events_app(scope, receive, send):
+    """
+    시간대 변경 이벤트 스트림 (ASGI 앱)
+
+    ?service=<id>&date=YYYY-MM-DD 로 구독 범위를 좁힐 수 있습니다.
+    service가 주어지면 해당 서비스 제공자의 예약 변경만 전달합니다.
+    """
+    params = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    date = params.get('date', [None])[0]
+    service_id = params.get('service', [None])[0]
+    provider_id = None
+
+    if date:
+        try:
+            datetime.strptime(date, '%Y-%m-%d')
+        except ValueError:
+            await _send_json_error(send, 400, '올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)')
+            return
+
+    if service_id:
+        if not service_id.isdigit():
+            await _send_json_error(send, 400, '올바른 서비스 ID가 아닙니다.')
+            return
+        provider_id = await sync_to_async(_get_service_provider_id)(int(service_id))
+
+    subscription = broker.subscribe(provider_id=provider_id, date=date)
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream; charset=utf-8'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': b': connected\n\n', 'more_body': True})
+
+        disconnect = asyncio.ensure_future(receive())
+        try:
+            while True:
+                next_event = asyncio.ensure_future(subscription.queue.get())
+                done, _ = await asyncio.wait(
+                    {next_event, disconnect},
+                    timeout=KEEPALIVE_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if next_event in done:
+                    body = _encode(next_event.result())
+                else:
+                    next_event.cancel()
+                    body = None if done else b': keepalive\n\n'
+
+                if disconnect in done:
+                    if disconnect.result()['type'] == 'http.disconnect':
+                        break
+                    disconnect = asyncio.ensure_future(receive())
+
+                if body:
+                    await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+        finally:
+            disconnect.cancel()
+    finally:
+        broker.unsubscribe(subscription)
+
+
+class SlotEventRouter:
+    """SSE 경로는 이벤트 스트림으로, 나머지는 Django ASGI 앱으로 전달"""
+
+    def __init__(self, application, path=SLOT_EVENTS_PATH):
+        self.application = application
+        self.path = path
+
+    async def __call__(self, scope, receive, send):
+        if (scope['type'] == 'http' and scope['path'] == self.path
+                and scope.get('method', 'GET') == 'GET'):
+            await slot_events_app(scope, receive, send)
+            return
+        await self.application(scope, receive, send)
@@ -0,0 +1,104 @@
+"""
+예약 내보내기 (CSV / JSONL)
+
+values()로 필요한 열만 조인해 조회하고 iterator(chunk_size)로 읽으면서 한 줄씩 만들어
+테이블 크기와 관계없이 일정한 메모리로 내보냅니다.
+ASGI에서는 동기 제너레이터를 Django가 끝까지 읽어 버퍼링하므로 비동기 이터레이터(aexport_lines)를 사용합니다.
+"""
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from .models import Reservation
+
+
+EXPORT_FIELDS = {
+    'id': 'id',
+    'date': 'date',
+    'time': 'time',
+    'status': 'status',
+    'username': 'user__username',
+    'user_name': 'user__first_name',
+    'user_email': 'user__email',
+    'service': 'service__name',
+    'price': 'service__price',
+    'provider': 'provider__name',
+    'notes': 'notes',
+    'created_at': 'created_at',
+}
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+
+
+def export_queryset(start_date=None, end_date=None, provider_id=None, statuses=None):
+    """필터를 적용한 내보내기용 values() 쿼리셋 (날짜/시간/ID 순)"""
+    queryset = Reservation.objects.all()
+    if start_date is not None:
+        queryset = queryset.filter(date__gte=start_date)
+    if end_date is not None:
+        queryset = queryset.filter(date__lte=end_date)
+    if provider_id is not None:
+        queryset = queryset.filter(provider_id=provider_id)
+    if statuses:
+        queryset = queryset.filter(status__in=statuses)
+    return queryset.order_by('date', 'time', 'id').values_list(*EXPORT_FIELDS.values())
+
+
+class _Line:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def _text(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Line())
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+    yield '\ufeff' + writer.writerow(EXPORT_FIELDS.keys())
+    for row in rows:
+        yield writer.writerow([_text(value) for value in row])
+
+
+def jsonl_lines(rows):
+    names = list(EXPORT_FIELDS)
+    for row in rows:
+        yield json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_text) + '\n'
+
+
+def export_lines(queryset, fmt='csv', chunk_size=2000):
+    """쿼리셋을 chunk_size 단위로 읽으면서 내보내기 줄을 생성"""
+    rows = queryset.iterator(chunk_size=chunk_size)
+    if fmt == 'jsonl':
+        return jsonl_lines(rows)
+    return csv_lines(rows)
+
+
+async def aexport_lines(queryset, fmt='csv', chunk_size=2000):
+    """
+    export_lines의 비동기 버전 (ASGI 스트리밍용)
+
+    DB 커서는 한 스레드에서만 읽어야 하므로 thread_sensitive로 같은 스레드에서 chunk_size 줄씩 가져옵니다.
+    """
+    lines = export_lines(queryset, fmt, chunk_size)
+    next_chunk = sync_to_async(lambda: list(islice(lines, chunk_size)), thread_sensitive=True)
+    while True:
+        chunk = await next_chunk()
+        if not chunk:
+            return
+        yield ''.join(chunk)
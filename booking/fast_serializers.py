@@ -0,0 +1,253 @@
+"""
+목록 API용 빠른 읽기 전용 직렬화
+
+DRF 시리얼라이저를 (fields, expand) 조합마다 한 번만 분석해
+필요한 열 목록과 행 변환 함수로 컴파일합니다. 요청 시에는 모델 인스턴스와
+시리얼라이저 필드 객체를 만들지 않고 .values() 행(dict)을 바로 응답 dict로 바꿉니다.
+응답 모양은 원래 시리얼라이저와 같으며(tests.py의 일치 테스트), 컴파일할 수 없는 필드가 있으면
+None을 반환해 호출하는 쪽에서 일반 시리얼라이저를 사용합니다.
+"""
+from functools import lru_cache
+from operator import itemgetter
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from rest_framework import fields as drf_fields
+from rest_framework import relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .models import Service
+from .serializers import requested_paths
+
+
+# 모델 속성(property)으로 계산되는 필드와 계산에 필요한 열
+COMPUTED_SOURCES = {
+    (Service, 'is_available'): ('is_active', 'stock_quantity'),
+}
+
+# to_representation이 DB 값을 그대로 돌려주는 필드
+PASSTHROUGH_FIELDS = (
+    drf_fields.BooleanField, drf_fields.CharField, drf_fields.ChoiceField, drf_fields.FloatField,
+    drf_fields.IntegerField, drf_fields.ReadOnlyField, relations.PrimaryKeyRelatedField,
+)
+
+
+class Unsupported(Exception):
+    """컴파일할 수 없는 시리얼라이저 필드"""
+
+
+def _is_iso(field, default):
+    output_format = getattr(field, 'format', default)
+    return output_format is not None and output_format.lower() == drf_fields.ISO_8601
+
+
+def _datetime(value, tz):
+    value = value.astimezone(tz).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+class Plan:
+    """컴파일된 시리얼라이저 (선택할 열과 필드별 변환 단계)"""
+
+    def __init__(self, columns, steps):
+        self.columns = columns
+        self.steps = steps
+
+    def values(self, queryset, *extra):
+        """필요한 열만 조회하는 .values() 쿼리셋 (extra는 페이지네이션 정렬 열 등)"""
+        return queryset.values(*dict.fromkeys(self.columns + list(extra)))
+
+    def row_function(self, request=None):
+        """요청 기준(이미지 절대 URL, 현재 시간대)으로 행 변환 함수 생성"""
+        tz = timezone.get_current_timezone()
+
+        def bind(steps):
+            getters = []
+            for key, kind, column, payload in steps:
+                if kind == 'value':
+                    getter = itemgetter(column)
+                elif kind == 'nested':
+                    getter = _nested(column, bind(payload))
+                elif kind == 'computed':
+                    getter = _computed(column, *payload)
+                else:
+                    getter = _converter(column, _convert(kind, payload, tz, request))
+                getters.append((key, getter))
+            return getters
+
+        getters = bind(self.steps)
+
+        def to_dict(row):
+            return {key: getter(row) for key, getter in getters}
+
+        return to_dict
+
+    def serialize(self, rows, request=None):
+        to_dict = self.row_function(request)
+        return [to_dict(row) for row in rows]
+
+
+def _nested(presence_column, getters):
+    def get(row):
+        if row[presence_column] is None:
+            return None
+        return {key: getter(row) for key, getter in getters}
+    return get
+
+
+def _computed(columns, fget, names):
+    """모델 속성 코드를 필요한 열만 가진 객체에 대해 실행"""
+    def get(row):
+        return fget(SimpleNamespace(**{name: row[column] for name, column in zip(names, columns)}))
+    return get
+
+
+def _converter(column, convert):
+    def get(row):
+        value = row[column]
+        return None if value is None else convert(value)
+    return get
+
+
+def _convert(kind, payload, tz, request):
+    if kind == 'date' or kind == 'time':
+        return lambda value: value.isoformat()
+    if kind == 'datetime':
+        return lambda value: _datetime(value, tz)
+    if kind == 'display':
+        return lambda value: str(payload.get(value, value))
+    if kind == 'file':
+        def file_url(name):
+            if not name:
+                return None
+            url = payload.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+        return file_url
+    # 그 밖의 필드는 DRF 필드의 변환을 그대로 사용
+    return payload
+
+
+def _compile(serializer, prefix=''):
+    """시리얼라이저 인스턴스를 (열 목록, 단계 목록)으로 변환"""
+    model = serializer.Meta.model
+    columns = []
+    steps = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        source_attrs = field.source_attrs
+        path = prefix + '__'.join(source_attrs)
+
+        if isinstance(field, serializers.BaseSerializer):
+            if isinstance(field, serializers.ListSerializer) or not hasattr(field, 'Meta'):
+                raise Unsupported(name)
+            # 관계가 없으면(NULL) 중첩 객체 대신 None
+            nested_columns, nested_steps = _compile(field, path + '__')
+            columns.append(path)
+            columns.extend(nested_columns)
+            steps.append((name, 'nested', path, nested_steps))
+            continue
+
+        if len(source_attrs) == 1 and source_attrs[0].startswith('get_') and source_attrs[0].endswith('_display'):
+            field_name = source_attrs[0][4:-8]
+            column = prefix + field_name
+            choices = dict(model._meta.get_field(field_name).flatchoices)
+            columns.append(column)
+            steps.append((name, 'display', column, choices))
+            continue
+
+        if len(source_attrs) == 1 and (model, source_attrs[0]) in COMPUTED_SOURCES:
+            names = COMPUTED_SOURCES[(model, source_attrs[0])]
+            dependency_columns = [prefix + dependency for dependency in names]
+            columns.extend(dependency_columns)
+            steps.append((name, 'computed', dependency_columns, (getattr(model, source_attrs[0]).fget, names)))
+            continue
+
+        # 관계를 따라가는 소스는 모델 필드로 확인 (속성/메서드는 열이 아님)
+        target_model = model
+        for attr in source_attrs[:-1]:
+            try:
+                target_model = target_model._meta.get_field(attr).related_model
+            except FieldDoesNotExist:
+                raise Unsupported(name)
+            if target_model is None:
+                raise Unsupported(name)
+        try:
+            model_field = target_model._meta.get_field(source_attrs[-1])
+        except FieldDoesNotExist:
+            raise Unsupported(name)
+
+        columns.append(path)
+        if isinstance(field, drf_fields.DateTimeField) and _is_iso(field, api_settings.DATETIME_FORMAT):
+            steps.append((name, 'datetime', path, None))
+        elif isinstance(field, drf_fields.DateField) and _is_iso(field, api_settings.DATE_FORMAT):
+            steps.append((name, 'date', path, None))
+        elif isinstance(field, drf_fields.TimeField) and _is_iso(field, api_settings.TIME_FORMAT):
+            steps.append((name, 'time', path, None))
+        elif isinstance(field, drf_fields.FileField):
+            if not getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL):
+                steps.append((name, 'value', path, None))
+            else:
+                steps.append((name, 'file', path, model_field.storage))
+        elif isinstance(field, PASSTHROUGH_FIELDS):
+            steps.append((name, 'value', path, None))
+        else:
+            steps.append((name, 'field', path, field.to_representation))
+    return columns, steps
+
+
+@lru_cache(maxsize=128)
+def _compiled(serializer_class, fields, expand):
+    serializer = serializer_class(
+        fields=set(fields) if fields is not None else None, expand=set(expand), context={}
+    )
+    try:
+        columns, steps = _compile(serializer)
+    except Unsupported:
+        return None
+    return Plan(columns, steps)
+
+
+def plan_for(serializer_class, request=None):
+    """요청의 ?fields= / ?expand=에 맞게 컴파일된 Plan (지원하지 않으면 None)"""
+    fields, expand = requested_paths(request) if request is not None else (None, set())
+    return _compiled(
+        serializer_class, frozenset(fields) if fields is not None else None, frozenset(expand)
+    )
+
+
+def fast_data(view, queryset):
+    """뷰의 시리얼라이저 모양으로 직렬화한 목록 (페이지네이션 없음)"""
+    plan = plan_for(view.get_serializer_class(), view.request)
+    if plan is None:
+        return view.get_serializer(queryset, many=True).data
+    return plan.serialize(plan.values(queryset), view.request)
+
+
+def fast_list(view, queryset, paginator=None):
+    """
+    뷰의 시리얼라이저 모양으로 목록 응답 (페이지네이션 포함)
+
+    컴파일할 수 없으면 일반 시리얼라이저로 응답합니다.
+    """
+    request = view.request
+    paginator = paginator if paginator is not None else view.paginator
+    plan = plan_for(view.get_serializer_class(), request)
+    if plan is None:
+        page = paginator.paginate_queryset(queryset, request, view=view) if paginator else None
+        if page is not None:
+            return paginator.get_paginated_response(view.get_serializer(page, many=True).data)
+        return Response(fast_data(view, queryset))
+
+    # 커서 페이지네이션은 정렬 열의 값으로 다음 위치를 계산하므로 함께 조회
+    ordering = [name.lstrip('-') for name in getattr(paginator, 'ordering', ()) or ()]
+    rows = plan.values(queryset, *ordering)
+    if paginator is not None:
+        page = paginator.paginate_queryset(rows, request, view=view)
+        if page is not None:
+            return paginator.get_paginated_response(plan.serialize(page, request))
+    return Response(plan.serialize(rows, request))
@@ -0,0 +1,256 @@
+import json
+import random
+import statistics
+import time as timer
+from datetime import time, timedelta
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from booking import day_slots, ratings
+from booking.models import Reservation, Review, Service, ServiceProvider
+
+
+class Command(BaseCommand):
+    help = '테스트 DB에 대량 데이터를 만들고 주요 API의 쿼리 수, 응답 시간, 응답 크기를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=2000, help='생성할 사용자 수')
+        parser.add_argument('--reservations', type=int, default=20000, help='생성할 예약 수')
+        parser.add_argument('--months', type=int, default=6, help='예약을 분산할 기간(개월)')
+        parser.add_argument('--iterations', type=int, default=20, help='엔드포인트별 반복 횟수')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (없으면 표준 출력)')
+        parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일 경로')
+        parser.add_argument(
+            '--max-query-increase', type=int, default=0,
+            help='기준 대비 허용할 쿼리 수 증가량'
+        )
+        parser.add_argument(
+            '--max-latency-regression', type=float, default=0.5,
+            help='기준 대비 허용할 p95 응답 시간 증가 비율 (0.5 = 50%%)'
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        # 운영 DB를 건드리지 않도록 별도의 테스트 DB에서 실행
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            random.seed(options['seed'])
+            dataset = self.seed(options)
+            results = self.run_benchmarks(dataset, options['iterations'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            'dataset': {key: value for key, value in dataset.items() if key.endswith('_count')},
+            'iterations': options['iterations'],
+            'endpoints': results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+        if baseline:
+            regressions = self.compare(baseline, report, options)
+            if regressions:
+                raise CommandError('성능 저하 감지:\n' + '\n'.join(regressions))
+            self.stderr.write(self.style.SUCCESS('기준 대비 성능 저하 없음'))
+
+    def seed(self, options):
+        """load_initial_data의 카탈로그 위에 사용자/예약/리뷰를 대량 생성"""
+        started = timer.perf_counter()
+        call_command('load_initial_data', stdout=StringIO())
+
+        providers = list(ServiceProvider.objects.all())
+        services = list(Service.objects.exclude(provider=None))
+
+        password = make_password('password123')
+        User.objects.bulk_create(
+            [
+                User(username=f'user{i:06d}', first_name=f'사용자{i}', email=f'user{i}@example.com', password=password)
+                for i in range(options['users'])
+            ],
+            batch_size=1000,
+        )
+        user_ids = list(User.objects.values_list('id', flat=True))
+
+        # 지난 기간에 예약을 분산 (과거는 완료/취소, 최근은 대기/확정 위주)
+        today = timezone.localdate()
+        start = today - timedelta(days=30 * options['months'])
+        days = (today - start).days + 30
+        slots = [time(hour, minute) for hour in range(7, 19) for minute in (0, 30)]
+
+        reservations = []
+        active_slots = set()
+        for _ in range(options['reservations']):
+            service = random.choice(services)
+            reserved_date = start + timedelta(days=random.randrange(days))
+            reserved_time = random.choice(slots)
+            if reserved_date < today:
+                status = random.choice(['completed', 'completed', 'completed', 'cancelled'])
+            elif (service.provider_id, reserved_date, reserved_time) in active_slots:
+                # 같은 제공자의 같은 시간대에는 활성 예약이 하나만 존재할 수 있음
+                status = 'cancelled'
+            else:
+                status = random.choice(['pending', 'confirmed'])
+                active_slots.add((service.provider_id, reserved_date, reserved_time))
+            reservations.append(Reservation(
+                user_id=random.choice(user_ids),
+                service=service,
+                provider_id=service.provider_id,
+                date=reserved_date,
+                time=reserved_time,
+                status=status,
+                notes='벤치마크 데이터',
+            ))
+        Reservation.objects.bulk_create(reservations, batch_size=1000)
+        # bulk_create는 시그널을 보내지 않으므로 점유 현황을 한 번에 계산
+        day_slots.rebuild()
+
+        completed_ids = list(
+            Reservation.objects.filter(status='completed').values_list('id', flat=True)
+        )
+        Review.objects.bulk_create(
+            [
+                Review(reservation_id=reservation_id, rating=random.randint(1, 5), comment='좋은 레슨이었습니다.')
+                for reservation_id in completed_ids[::3]
+            ],
+            batch_size=1000,
+        )
+        ratings.rebuild()
+
+        self.stderr.write(f'데이터 생성 완료 ({timer.perf_counter() - started:.1f}초)')
+
+        busiest = Reservation.objects.filter(status__in=['pending', 'confirmed']).values_list(
+            'service_id', 'date'
+        ).first() or (services[0].id, today)
+
+        return {
+            'providers': providers,
+            'services': services,
+            'user': User.objects.get(id=random.choice(user_ids)),
+            'busy_service_id': busiest[0],
+            'busy_date': busiest[1],
+            'user_count': len(user_ids),
+            'provider_count': len(providers),
+            'service_count': len(services),
+            'reservation_count': Reservation.objects.count(),
+            'review_count': Review.objects.count(),
+        }
+
+    def run_benchmarks(self, dataset, iterations):
+        customer = Client()
+        customer.force_login(dataset['user'])
+
+        provider = dataset['providers'][0]
+        provider_client = Client()
+        session = provider_client.session
+        session['provider_id'] = provider.id
+        session.save()
+
+        service_id = dataset['busy_service_id']
+        reviewed_service_id = Review.objects.values_list(
+            'reservation__service_id', flat=True
+        ).first() or service_id
+
+        # 예약 생성은 매 반복마다 겹치지 않는 미래 시간대를 사용
+        future = timezone.localdate() + timedelta(days=400)
+        create_slots = iter(
+            (future + timedelta(days=day), time(hour, minute))
+            for day in range(iterations * 2)
+            for hour in range(7, 19)
+            for minute in (0, 30)
+        )
+
+        def create_request():
+            reserved_date, reserved_time = next(create_slots)
+            return customer.post('/api/reservations/', data=json.dumps({
+                'service_id': service_id,
+                'date': reserved_date.isoformat(),
+                'time': reserved_time.strftime('%H:%M'),
+                'notes': '',
+            }), content_type='application/json')
+
+        endpoints = {
+            'services': lambda: customer.get('/api/services/'),
+            'available_times': lambda: customer.get(
+                f'/api/services/{service_id}/available_times/?date={dataset["busy_date"]}'
+            ),
+            'reservations_history': lambda: customer.get('/api/reservations/history/'),
+            # 화면에서 사용하는 펼친 응답 (?expand=)
+            'reservations_history_expanded': lambda: customer.get('/api/reservations/history/?expand=service'),
+            'provider_reservations': lambda: provider_client.get('/api/provider-reservations/'),
+            'provider_reservations_expanded': lambda: provider_client.get(
+                '/api/provider-reservations/?expand=user,service'
+            ),
+            'service_reviews': lambda: customer.get(
+                f'/api/reviews/service_reviews/?service_id={reviewed_service_id}'
+            ),
+            'reservation_create': create_request,
+        }
+
+        results = {}
+        for name, request in endpoints.items():
+            latencies = []
+            queries = 0
+            size = 0
+            status_code = None
+            for _ in range(iterations):
+                with CaptureQueriesContext(connection) as context:
+                    started = timer.perf_counter()
+                    response = request()
+                    latencies.append((timer.perf_counter() - started) * 1000)
+                queries = max(queries, len(context.captured_queries))
+                size = len(response.content)
+                status_code = response.status_code
+
+            latencies.sort()
+            results[name] = {
+                'status': status_code,
+                'queries': queries,
+                'bytes': size,
+                'p50_ms': round(statistics.median(latencies), 3),
+                'p95_ms': round(latencies[max(int(len(latencies) * 0.95) - 1, 0)], 3),
+                'mean_ms': round(statistics.fmean(latencies), 3),
+            }
+            self.stderr.write(
+                f'{name}: {queries} queries, p50 {results[name]["p50_ms"]}ms, '
+                f'p95 {results[name]["p95_ms"]}ms, {size} bytes'
+            )
+        return results
+
+    def compare(self, baseline, report, options):
+        """기준 결과 대비 쿼리 수/응답 시간 저하 목록"""
+        regressions = []
+        for name, current in report['endpoints'].items():
+            previous = baseline.get('endpoints', {}).get(name)
+            if not previous:
+                continue
+            if current['queries'] > previous['queries'] + options['max_query_increase']:
+                regressions.append(
+                    f'{name}: 쿼리 수 {previous["queries"]} -> {current["queries"]}'
+                )
+            limit = previous['p95_ms'] * (1 + options['max_latency_regression'])
+            if current['p95_ms'] > limit:
+                regressions.append(
+                    f'{name}: p95 {previous["p95_ms"]}ms -> {current["p95_ms"]}ms'
+                )
+        return regressions
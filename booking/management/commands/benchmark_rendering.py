@@ -0,0 +1,100 @@
+import json
+import random
+import statistics
+import time as timer
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.renderers import JSONRenderer as DRFJSONRenderer
+
+from booking import catalog, renderers
+from booking.management.commands.benchmark_api import Command as ApiBenchmark
+
+
+ENCODINGS = {'identity': '', 'gzip': 'gzip', 'br': 'br, gzip'}
+
+
+class Command(BaseCommand):
+    help = (
+        '테스트 DB에 대량 데이터를 만들고 카탈로그/예약 내역 응답의 JSON 렌더링 시간(표준 json vs orjson)과 '
+        '압축 방식별(없음/gzip/brotli) 응답 크기, 응답 시간을 측정합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=2000, help='생성할 사용자 수')
+        parser.add_argument('--reservations', type=int, default=20000, help='생성할 예약 수')
+        parser.add_argument('--months', type=int, default=6, help='예약을 분산할 기간(개월)')
+        parser.add_argument('--iterations', type=int, default=20, help='경우별 반복 횟수')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (없으면 표준 출력)')
+
+    def handle(self, *args, **options):
+        # 운영 DB를 건드리지 않도록 별도의 테스트 DB에서 실행
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            random.seed(options['seed'])
+            dataset = ApiBenchmark(stdout=self.stdout, stderr=self.stderr).seed(options)
+            results = self.run_benchmarks(dataset, options['iterations'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        output = json.dumps(
+            {'orjson': renderers.orjson is not None, 'iterations': options['iterations'], 'endpoints': results},
+            ensure_ascii=False, indent=2,
+        )
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def run_benchmarks(self, dataset, iterations):
+        customer = Client()
+        customer.force_login(dataset['user'])
+        # 전체 예약 내역을 한 페이지(200건) 가득 조회하도록 관리자로 측정
+        staff = Client()
+        staff.force_login(User.objects.create_user('benchmark_staff', is_staff=True))
+        endpoints = {
+            # 카탈로그 캐시 적중 응답 (렌더링/압축 비용만 남음)
+            'services': (customer, '/api/services/?expand=category,provider'),
+            'reservations_history': (customer, '/api/reservations/history/?expand=service'),
+            'reservations_history_full_page': (staff, '/api/reservations/history/?expand=service&page_size=200'),
+        }
+        catalog.clear()
+
+        results = {}
+        for name, (client, url) in endpoints.items():
+            data = client.get(url).data
+            result = {
+                'render_stdlib_ms': self.measure(lambda: DRFJSONRenderer().render(data), iterations),
+                'render_fast_ms': self.measure(lambda: renderers.JSONRenderer().render(data), iterations),
+            }
+            for encoding, header in ENCODINGS.items():
+                response = client.get(url, HTTP_ACCEPT_ENCODING=header)
+                result[f'{encoding}_encoding'] = response.get('Content-Encoding', 'identity')
+                result[f'{encoding}_bytes'] = len(response.content)
+                result[f'{encoding}_p50_ms'] = self.measure(
+                    lambda: client.get(url, HTTP_ACCEPT_ENCODING=header), iterations
+                )
+            results[name] = result
+            self.stderr.write(
+                f'{name}: 렌더링 {result["render_stdlib_ms"]}ms -> {result["render_fast_ms"]}ms, '
+                f'크기 {result["identity_bytes"]} / gzip {result["gzip_bytes"]} / br {result["br_bytes"]} bytes, '
+                f'p50 {result["identity_p50_ms"]} / {result["gzip_p50_ms"]} / {result["br_p50_ms"]}ms'
+            )
+        return results
+
+    def measure(self, func, iterations):
+        """반복 실행한 소요 시간의 중앙값(ms)"""
+        latencies = []
+        for _ in range(iterations):
+            started = timer.perf_counter()
+            func()
+            latencies.append((timer.perf_counter() - started) * 1000)
+        return round(statistics.median(latencies), 3)
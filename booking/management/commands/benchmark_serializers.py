@@ -0,0 +1,107 @@
+import json
+import random
+import time as timer
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.test import APIRequestFactory
+
+from booking.fast_serializers import plan_for
+from booking.management.commands.benchmark_api import Command as ApiBenchmark
+from booking.models import Reservation, Service
+from booking.serializers import (
+    ReservationSerializer, ServiceProviderReservationSerializer, ServiceSerializer, requested_paths
+)
+
+
+class Command(BaseCommand):
+    help = (
+        '테스트 DB에 대량 데이터를 만들고 목록 직렬화 속도(행/초)를 '
+        'DRF 시리얼라이저와 values() 기반 빠른 직렬화로 비교합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=2000, help='생성할 사용자 수')
+        parser.add_argument('--reservations', type=int, default=20000, help='생성할 예약 수')
+        parser.add_argument('--months', type=int, default=6, help='예약을 분산할 기간(개월)')
+        parser.add_argument('--rows', type=int, default=2000, help='한 번에 직렬화할 예약 행 수')
+        parser.add_argument('--iterations', type=int, default=5, help='경우별 반복 횟수')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (없으면 표준 출력)')
+
+    def handle(self, *args, **options):
+        # 운영 DB를 건드리지 않도록 별도의 테스트 DB에서 실행
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            random.seed(options['seed'])
+            ApiBenchmark(stdout=self.stdout, stderr=self.stderr).seed(options)
+            results = self.run_benchmarks(options['rows'], options['iterations'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        output = json.dumps(
+            {'rows': options['rows'], 'iterations': options['iterations'], 'cases': results},
+            ensure_ascii=False, indent=2,
+        )
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def run_benchmarks(self, rows, iterations):
+        reservations = Reservation.objects.order_by('-date', '-time', '-id')
+        provider_id = reservations.exclude(provider=None).values_list('provider_id', flat=True).first()
+        cases = {
+            'reservations': (ReservationSerializer, reservations, ''),
+            'reservations_expanded': (ReservationSerializer, reservations, '?expand=service'),
+            'provider_reservations': (
+                ServiceProviderReservationSerializer, reservations.filter(provider_id=provider_id), ''
+            ),
+            'provider_reservations_expanded': (
+                ServiceProviderReservationSerializer, reservations.filter(provider_id=provider_id),
+                '?expand=user,service',
+            ),
+            'services_expanded': (ServiceSerializer, Service.objects.order_by('id'), '?expand=category,provider'),
+        }
+
+        results = {}
+        for name, (serializer_class, queryset, query) in cases.items():
+            request = APIRequestFactory().get('/api/' + query)
+            queryset = queryset[:rows]
+            # 뷰와 같은 조인으로 조회 (예약은 리뷰 ID 포함)
+            _, expand = requested_paths(request)
+            related = serializer_class.related_paths(expand)
+            if serializer_class is ReservationSerializer:
+                related = ['review', *related]
+
+            def drf():
+                return serializer_class(
+                    queryset.select_related(*related), many=True, context={'request': request}
+                ).data
+
+            def fast():
+                plan = plan_for(serializer_class, request)
+                return plan.serialize(plan.values(queryset), request)
+
+            result = {}
+            for label, serialize in (('drf', drf), ('fast', fast)):
+                elapsed = 0
+                count = 0
+                for _ in range(iterations):
+                    started = timer.perf_counter()
+                    count += len(serialize())
+                    elapsed += timer.perf_counter() - started
+                result[f'{label}_rows_per_sec'] = round(count / elapsed) if elapsed else 0
+            result['rows'] = count // iterations
+            result['speedup'] = round(result['fast_rows_per_sec'] / (result['drf_rows_per_sec'] or 1), 2)
+            results[name] = result
+            self.stderr.write(
+                f'{name}: {result["rows"]}행, DRF {result["drf_rows_per_sec"]}행/초, '
+                f'빠른 직렬화 {result["fast_rows_per_sec"]}행/초 ({result["speedup"]}배)'
+            )
+        return results
@@ -0,0 +1,99 @@
+import json
+import random
+import statistics
+import time as timer
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext, override_settings, setup_test_environment, teardown_test_environment
+)
+
+from booking.management.commands.benchmark_api import Command as ApiBenchmark
+
+
+class Command(BaseCommand):
+    help = (
+        '테스트 DB에 대량 데이터를 만들고 세션 저장소(db, cached_db, signed_cookies)별로 '
+        '제공자 예약 목록(/api/provider-reservations/)과 예약 내역의 요청당 DB 쿼리 수, 응답 시간을 측정합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=2000, help='생성할 사용자 수')
+        parser.add_argument('--reservations', type=int, default=20000, help='생성할 예약 수')
+        parser.add_argument('--months', type=int, default=6, help='예약을 분산할 기간(개월)')
+        parser.add_argument('--iterations', type=int, default=20, help='경우별 반복 횟수')
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (없으면 표준 출력)')
+
+    def handle(self, *args, **options):
+        # 운영 DB를 건드리지 않도록 별도의 테스트 DB에서 실행
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            random.seed(options['seed'])
+            dataset = ApiBenchmark(stdout=self.stdout, stderr=self.stderr).seed(options)
+            results = {}
+            for backend, engine in settings.SESSION_BACKENDS.items():
+                caches[settings.SESSION_CACHE_ALIAS].clear()
+                with override_settings(SESSION_ENGINE=engine):
+                    results[backend] = self.run_benchmarks(dataset, options['iterations'])
+                for name, result in results[backend].items():
+                    self.stderr.write(
+                        f'{backend} {name}: {result["queries"]} queries '
+                        f'(세션 {result["session_queries"]}), p50 {result["p50_ms"]}ms'
+                    )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        output = json.dumps(
+            {'iterations': options['iterations'], 'backends': results}, ensure_ascii=False, indent=2
+        )
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stderr.write(f'결과 저장: {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def run_benchmarks(self, dataset, iterations):
+        # 클라이언트마다 현재 SESSION_ENGINE으로 미들웨어를 구성
+        customer = Client()
+        customer.force_login(dataset['user'])
+        provider_client = Client()
+        session = provider_client.session
+        session['provider_id'] = dataset['providers'][0].id
+        session.save()
+        provider_client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+        endpoints = {
+            'provider_reservations': lambda: provider_client.get('/api/provider-reservations/'),
+            'reservations_history': lambda: customer.get('/api/reservations/history/'),
+        }
+        results = {}
+        for name, request in endpoints.items():
+            # 첫 요청(캐시 적재)은 제외하고 반복 요청의 최대 쿼리 수 측정
+            request()
+            latencies = []
+            queries = 0
+            session_queries = 0
+            for _ in range(iterations):
+                with CaptureQueriesContext(connection) as context:
+                    started = timer.perf_counter()
+                    response = request()
+                    latencies.append((timer.perf_counter() - started) * 1000)
+                queries = max(queries, len(context.captured_queries))
+                session_queries = max(session_queries, sum(
+                    'django_session' in query['sql'] for query in context.captured_queries
+                ))
+            results[name] = {
+                'status': response.status_code,
+                'queries': queries,
+                'session_queries': session_queries,
+                'p50_ms': round(statistics.median(latencies), 3),
+            }
+        return results
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from booking import day_slots
+from booking.availability import format_minutes
+from booking.management.commands.rebuild_day_slots import parse_date
+
+
+class Command(BaseCommand):
+    help = '제공자 일별 점유 현황(ProviderDaySlots)이 예약 테이블과 일치하는지 확인합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=parse_date, help='시작 날짜 (YYYY-MM-DD, 없으면 전체)')
+        parser.add_argument('--end', type=parse_date, help='종료 날짜 (YYYY-MM-DD, 없으면 전체)')
+        parser.add_argument('--fix', action='store_true', help='불일치한 날짜를 다시 계산')
+
+    def handle(self, *args, **options):
+        mismatches = day_slots.find_mismatches(options['start'], options['end'])
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS('점유 현황이 예약 테이블과 일치합니다.'))
+            return
+
+        for provider_id, target_date, stored, expected in mismatches:
+            stored_text = ', '.join(map(format_minutes, stored)) if stored is not None else '(행 없음)'
+            expected_text = ', '.join(map(format_minutes, expected)) or '(없음)'
+            self.stdout.write(self.style.WARNING(
+                f'제공자 #{provider_id} {target_date}: 저장 [{stored_text}] / 예약 [{expected_text}]'
+            ))
+
+        if options['fix']:
+            for provider_id, target_date, _, _ in mismatches:
+                day_slots.refresh(provider_id, target_date)
+            self.stdout.write(self.style.SUCCESS(f'{len(mismatches)}개 날짜를 다시 계산했습니다.'))
+            return
+
+        raise CommandError(f'{len(mismatches)}개 날짜의 점유 현황이 예약 테이블과 다릅니다.')
@@ -0,0 +1,101 @@
+import re
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from booking.availability import ACTIVE_STATUSES
+from booking.models import ProviderDaySlots, Reservation
+
+
+# 실행 계획에서 인덱스 사용/전체 스캔을 판별하는 패턴 (SQLite, PostgreSQL)
+INDEX_PATTERNS = [
+    re.compile(r'USING (?:COVERING )?INDEX (\w+)'),
+    re.compile(r'Index (?:Only )?Scan (?:Backward )?using (\w+)'),
+    re.compile(r'Bitmap Index Scan on (\w+)'),
+]
+FULL_SCAN_PATTERNS = [
+    re.compile(r'\bSCAN (?:TABLE )?booking_(?:reservation|providerdayslots)\b(?! USING)'),
+    re.compile(r'Seq Scan on booking_(?:reservation|providerdayslots)'),
+]
+
+
+class Command(BaseCommand):
+    help = '예약 조회 핫 쿼리들의 실행 계획(EXPLAIN)을 확인하고 인덱스 사용 여부를 보고합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='전체 실행 계획 출력')
+        parser.add_argument('--strict', action='store_true', help='인덱스를 사용하지 않는 쿼리가 있으면 실패')
+
+    def handle(self, *args, **options):
+        sample = Reservation.objects.order_by().values('provider_id', 'service_id', 'user_id', 'date').first()
+        if sample is None:
+            sample = {'provider_id': 1, 'service_id': 1, 'user_id': 1, 'date': timezone.localdate()}
+        provider_id = sample['provider_id'] or 1
+        service_id = sample['service_id']
+        user_id = sample['user_id']
+        target_date = sample['date']
+        slot_time = '10:00'
+
+        active = Reservation.objects.filter(status__in=ACTIVE_STATUSES)
+        queries = {
+            # 예약 가능 시간 (제공자 일별 점유 현황 + 로그인 사용자 예약)
+            'availability_day_slots': ProviderDaySlots.objects.filter(
+                provider_id=provider_id, date=target_date
+            ).values_list('occupied', flat=True),
+            'availability_user_day': active.filter(user_id=user_id, date=target_date).values_list('time', flat=True),
+            # 제공자가 없는 서비스 (해당 날짜 전체 예약)
+            'availability_day_all': active.filter(date=target_date).values_list('time', flat=True),
+            # 기간별 예약 가능 시간
+            'availability_range': ProviderDaySlots.objects.filter(
+                provider_id=provider_id, date__range=(target_date, target_date + timedelta(days=30))
+            ).values_list('date', 'occupied'),
+            # 점유 현황 갱신
+            'day_slots_refresh': active.filter(
+                provider_id=provider_id, date=target_date
+            ).values_list('time', flat=True),
+            # 예약 생성 시 중복 확인
+            'create_user_duplicate': active.filter(
+                user_id=user_id, service_id=service_id, date=target_date, time=slot_time
+            ),
+            'create_service_duplicate': active.filter(
+                service_id=service_id, date=target_date, time=slot_time
+            ),
+            'create_provider_duplicate': active.filter(
+                provider_id=provider_id, date=target_date, time=slot_time
+            ),
+            # 예약 내역 / 제공자 대시보드
+            'user_history': Reservation.objects.filter(user_id=user_id).order_by('-date', '-time'),
+            'provider_reservations': Reservation.objects.filter(
+                provider_id=provider_id
+            ).order_by('-date', '-time'),
+            # 최근 변경된 예약 (time_slot_updates)
+            'time_slot_updates': active.filter(
+                provider_id=provider_id, updated_at__gte=timezone.now() - timedelta(hours=1)
+            ).order_by('-updated_at'),
+        }
+
+        self.stdout.write(f'데이터베이스: {connection.vendor}')
+        missing = []
+        for name, queryset in queries.items():
+            plan = queryset.explain()
+            indexes = sorted({
+                match for pattern in INDEX_PATTERNS for match in pattern.findall(plan)
+            })
+            full_scan = any(pattern.search(plan) for pattern in FULL_SCAN_PATTERNS)
+
+            if indexes and not full_scan:
+                self.stdout.write(self.style.SUCCESS(f'[INDEX] {name}: {", ".join(indexes)}'))
+            else:
+                missing.append(name)
+                used = f' (일부 인덱스: {", ".join(indexes)})' if indexes else ''
+                self.stdout.write(self.style.WARNING(f'[SCAN]  {name}{used}'))
+
+            if options['verbose_plans']:
+                for line in plan.splitlines():
+                    self.stdout.write(f'          {line}')
+
+        if missing and options['strict']:
+            raise CommandError(f'인덱스를 사용하지 않는 쿼리: {", ".join(missing)}')
+        self.stdout.write(f'총 {len(queries)}개 쿼리 중 {len(queries) - len(missing)}개가 인덱스를 사용합니다.')
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from booking.exports import FORMATS, export_lines, export_queryset
+from booking.management.commands.rebuild_day_slots import parse_date
+
+
+class Command(BaseCommand):
+    help = '예약을 CSV/JSONL로 내보냅니다. (사용자/서비스/제공자 이름 포함, 일정한 메모리 사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', help='출력 파일 경로 (없으면 표준 출력)')
+        parser.add_argument('--format', choices=sorted(FORMATS), default='csv', help='출력 형식')
+        parser.add_argument('--start', type=parse_date, help='시작 날짜 (YYYY-MM-DD)')
+        parser.add_argument('--end', type=parse_date, help='종료 날짜 (YYYY-MM-DD)')
+        parser.add_argument('--provider', type=int, help='서비스 제공자 ID')
+        parser.add_argument('--status', action='append', help='예약 상태 (여러 번 지정 가능)')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 읽을 행 수')
+
+    def handle(self, *args, **options):
+        queryset = export_queryset(options['start'], options['end'], options['provider'], options['status'])
+        lines = export_lines(queryset, options['format'], chunk_size=options['chunk_size'])
+
+        output = open(options['output'], 'w', encoding='utf-8', newline='') if options['output'] else None
+        write = output.write if output else lambda line: self.stdout.write(line, ending='')
+        count = -1 if options['format'] == 'csv' else 0
+        try:
+            for line in lines:
+                write(line)
+                count += 1
+        finally:
+            if output:
+                output.close()
+
+        if options['output']:
+            self.stderr.write(self.style.SUCCESS(f'{count}건을 {options["output"]}에 저장했습니다.'))
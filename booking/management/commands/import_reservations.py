@@ -0,0 +1,267 @@
+import csv
+import json
+import sys
+import time as timer
+from datetime import date, datetime, time
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from booking import day_slots
+from booking.availability import ACTIVE_STATUSES
+from booking.models import Reservation, Service, ServiceProvider
+
+
+STATUSES = {value for value, _ in Reservation.STATUS_CHOICES}
+
+
+class RowError(Exception):
+    """검증에 실패한 입력 행"""
+
+
+class Command(BaseCommand):
+    help = (
+        'CSV/JSONL 파일의 예약 데이터를 스트리밍으로 읽어 일괄 등록합니다. '
+        '열: user, service, provider(선택), date, time, status(선택), notes(선택), email(선택)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="입력 파일 경로 ('-'이면 표준 입력)")
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='입력 형식 (없으면 확장자로 판단)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='한 트랜잭션에서 검증/등록할 행 수')
+        parser.add_argument('--default-status', choices=sorted(STATUSES), default='pending', help='status가 없는 행의 상태')
+        parser.add_argument('--create-users', action='store_true', help='없는 사용자는 로그인 불가 계정으로 생성')
+        parser.add_argument('--dry-run', action='store_true', help='검증만 하고 등록하지 않음')
+        parser.add_argument('--strict', action='store_true', help='잘못된 행이 있으면 중단 (이미 등록한 배치는 유지)')
+        parser.add_argument('--max-errors', type=int, default=20, help='출력할 오류 행 수')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] <= 0:
+            raise CommandError('--batch-size는 1 이상이어야 합니다.')
+        self.options = options
+        fmt = options['format'] or ('jsonl' if options['path'].endswith(('.jsonl', '.json')) else 'csv')
+
+        # 조회용 메모리 맵 (행마다 쿼리하지 않음)
+        self.users = dict(User.objects.values_list('username', 'id'))
+        self.services = {}
+        self.service_providers = {}
+        for service_id, name, provider_id in Service.objects.values_list('id', 'name', 'provider_id'):
+            self.services[str(service_id)] = service_id
+            self.services.setdefault(name, service_id)
+            self.service_providers[service_id] = provider_id
+        self.providers = {}
+        for provider_id, username, name in ServiceProvider.objects.values_list('id', 'username', 'name'):
+            self.providers[str(provider_id)] = provider_id
+            if username:
+                self.providers.setdefault(username, provider_id)
+            self.providers.setdefault(name, provider_id)
+
+        self.stats = {'read': 0, 'imported': 0, 'invalid': 0, 'users_created': 0}
+        started = timer.perf_counter()
+
+        stream = sys.stdin if options['path'] == '-' else open(options['path'], encoding='utf-8-sig', newline='')
+        try:
+            rows = self.read_rows(stream, fmt)
+            while True:
+                batch = list(islice(rows, options['batch_size']))
+                if not batch:
+                    break
+                self.import_batch(batch)
+                elapsed = timer.perf_counter() - started
+                self.stderr.write(
+                    f'  {self.stats["read"]}행 처리, {self.stats["imported"]}건 등록 '
+                    f'({self.stats["read"] / elapsed if elapsed else 0:.0f}행/초)'
+                )
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        elapsed = timer.perf_counter() - started
+        prefix = '[dry-run] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}{self.stats["read"]}행 중 {self.stats["imported"]}건 등록, '
+            f'{self.stats["invalid"]}건 오류, 사용자 {self.stats["users_created"]}명 생성 '
+            f'({elapsed:.2f}초, {self.stats["read"] / elapsed if elapsed else 0:.0f}행/초)'
+        ))
+
+    def read_rows(self, stream, fmt):
+        """(행 dict, 오류 메시지) 스트림"""
+        if fmt == 'csv':
+            for row in csv.DictReader(stream):
+                yield row, None
+            return
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line), None
+            except ValueError as exc:
+                yield None, f'JSON 형식 오류 ({exc})'
+
+    def import_batch(self, batch):
+        """배치 검증 후 한 트랜잭션으로 등록"""
+        if self.options['create_users']:
+            self.create_missing_users(row for row, _ in batch)
+
+        parsed = []
+        for row, error in batch:
+            self.stats['read'] += 1
+            line_number = self.stats['read']
+            if error is None:
+                try:
+                    parsed.append((line_number, self.parse_row(row)))
+                    continue
+                except RowError as exc:
+                    error = str(exc)
+            self.report_error(f'{line_number}번째 행: {error}')
+
+        if not parsed:
+            return
+
+        # 같은 시간대의 활성 예약 중복 확인 (배치 날짜 범위의 기존 예약을 한 번에 조회)
+        dates = {reservation.date for _, reservation in parsed if reservation.status in ACTIVE_STATUSES}
+        taken = self.taken_slots(dates)
+
+        accepted = []
+        for line_number, reservation in parsed:
+            if reservation.status in ACTIVE_STATUSES:
+                keys = [('service', reservation.service_id, reservation.date, reservation.time)]
+                if reservation.provider_id is not None:
+                    keys.append(('provider', reservation.provider_id, reservation.date, reservation.time))
+                if any(key in taken for key in keys):
+                    self.report_error(f'{line_number}번째 행: 같은 시간에 이미 활성 예약이 있습니다.')
+                    continue
+                taken.update(keys)
+            accepted.append((line_number, reservation))
+
+        if self.options['dry_run']:
+            self.stats['imported'] += len(accepted)
+            return
+
+        # 등록과 점유 현황 갱신을 한 트랜잭션으로 커밋
+        # (bulk_create는 시그널을 보내지 않으며, 이후 배치가 실패해도 커밋된 배치의 점유 현황은 일치)
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    Reservation.objects.bulk_create([reservation for _, reservation in accepted], batch_size=1000)
+                created = [reservation for _, reservation in accepted]
+            except IntegrityError:
+                # 중복 확인 이후 다른 요청이 같은 시간대를 예약한 경우 행 단위로 다시 등록
+                created = self.create_each(accepted)
+            # 이 배치가 예약을 추가한 (제공자, 날짜)만 갱신
+            day_slots.refresh_many({
+                (reservation.provider_id, reservation.date)
+                for reservation in created if reservation.status in ACTIVE_STATUSES
+            })
+        self.stats['imported'] += len(created)
+
+    def taken_slots(self, dates):
+        """해당 날짜들의 활성 예약이 차지한 (service|provider, ID, 날짜, 시간) 집합"""
+        taken = set()
+        if not dates:
+            return taken
+        for provider_id, service_id, reserved_date, reserved_time in Reservation.objects.filter(
+            status__in=ACTIVE_STATUSES, date__range=(min(dates), max(dates))
+        ).values_list('provider_id', 'service_id', 'date', 'time'):
+            taken.add(('service', service_id, reserved_date, reserved_time))
+            if provider_id is not None:
+                taken.add(('provider', provider_id, reserved_date, reserved_time))
+        return taken
+
+    def create_each(self, accepted):
+        """행마다 저장점을 두고 등록 (중복 행은 오류로 보고하고 건너뜀)"""
+        created = []
+        for line_number, reservation in accepted:
+            try:
+                with transaction.atomic():
+                    Reservation.objects.bulk_create([reservation])
+            except IntegrityError:
+                self.report_error(f'{line_number}번째 행: 같은 시간에 이미 활성 예약이 있습니다.')
+                continue
+            created.append(reservation)
+        return created
+
+    def create_missing_users(self, rows):
+        missing = {}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            username = str(row.get('user') or '').strip()
+            if username and username not in self.users and username not in missing:
+                missing[username] = str(row.get('email') or '').strip()
+        if not missing:
+            return
+        if not self.options['dry_run']:
+            password = make_password(None)
+            User.objects.bulk_create(
+                [User(username=username, email=email, password=password) for username, email in missing.items()],
+                batch_size=1000, ignore_conflicts=True,
+            )
+            self.users.update(User.objects.filter(username__in=missing).values_list('username', 'id'))
+        else:
+            # dry-run에서는 생성될 사용자로 간주
+            self.users.update({username: None for username in missing})
+        self.stats['users_created'] += len(missing)
+
+    def parse_row(self, row):
+        if not isinstance(row, dict):
+            raise RowError('행 형식이 올바르지 않습니다.')
+
+        def field(name):
+            value = row.get(name)
+            return str(value).strip() if value is not None else ''
+
+        username = field('user')
+        if username not in self.users:
+            raise RowError(f'사용자를 찾을 수 없습니다: {username or "(없음)"}')
+
+        service_id = self.services.get(field('service'))
+        if service_id is None:
+            raise RowError(f'서비스를 찾을 수 없습니다: {field("service") or "(없음)"}')
+
+        provider_key = field('provider')
+        if provider_key:
+            provider_id = self.providers.get(provider_key)
+            if provider_id is None:
+                raise RowError(f'서비스 제공자를 찾을 수 없습니다: {provider_key}')
+        else:
+            provider_id = self.service_providers[service_id]
+
+        # fromisoformat이 strptime보다 훨씬 빠르므로 먼저 시도
+        date_text = field('date')
+        try:
+            reserved_date = date.fromisoformat(date_text)
+        except ValueError:
+            raise RowError(f'올바른 날짜 형식이 아닙니다. (YYYY-MM-DD): {date_text}')
+        time_text = field('time')
+        try:
+            reserved_time = time.fromisoformat(time_text)
+        except ValueError:
+            try:
+                reserved_time = datetime.strptime(time_text, '%H:%M').time()
+            except ValueError:
+                raise RowError(f'올바른 시간 형식이 아닙니다. (HH:MM): {time_text}')
+
+        status = field('status') or self.options['default_status']
+        if status not in STATUSES:
+            raise RowError(f'알 수 없는 상태입니다: {status}')
+
+        return Reservation(
+            user_id=self.users[username],
+            service_id=service_id,
+            provider_id=provider_id,
+            date=reserved_date,
+            time=reserved_time,
+            status=status,
+            notes=field('notes') or None,
+        )
+
+    def report_error(self, message):
+        self.stats['invalid'] += 1
+        if self.options['strict']:
+            raise CommandError(message)
+        if self.stats['invalid'] <= self.options['max_errors']:
+            self.stderr.write(self.style.WARNING(message))
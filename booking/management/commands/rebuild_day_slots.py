@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from booking import day_slots
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise CommandError(f'올바른 날짜 형식이 아닙니다. (YYYY-MM-DD): {value}')
+
+
+class Command(BaseCommand):
+    help = '예약 테이블에서 제공자 일별 점유 현황(ProviderDaySlots)을 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=parse_date, help='시작 날짜 (YYYY-MM-DD, 없으면 전체)')
+        parser.add_argument('--end', type=parse_date, help='종료 날짜 (YYYY-MM-DD, 없으면 전체)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='일괄 저장 단위')
+
+    def handle(self, *args, **options):
+        self.stdout.write('제공자 일별 점유 현황을 다시 계산하는 중...')
+        result = day_slots.rebuild(options['start'], options['end'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'생성 {result["created"]}건, 수정 {result["updated"]}건 완료!'
+        ))
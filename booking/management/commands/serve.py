@@ -0,0 +1,160 @@
+import os
+import sys
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from booking.db import set_journal_mode
+
+
+WSGI_APP = 'reservation_system.wsgi:application'
+ASGI_APP = 'reservation_system.asgi:application'
+SERVERS = ('gunicorn', 'uvicorn', 'waitress')
+
+
+def local_caches():
+    """프로세스마다 따로 존재하는(워커 간에 공유되지 않는) 캐시 별칭 목록"""
+    aliases = {settings.CATALOG_CACHE_ALIAS}
+    if settings.SESSION_ENGINE in (
+        'django.contrib.sessions.backends.cache', 'django.contrib.sessions.backends.cached_db'
+    ):
+        aliases.add(settings.SESSION_CACHE_ALIAS)
+    return sorted(alias for alias in aliases if settings.CACHES[alias]['BACKEND'].endswith('LocMemCache'))
+
+
+def default_workers():
+    """공유 캐시면 CPU 수 * 2 + 1, 로컬 메모리 캐시면 1 (워커 대신 스레드로 동시 처리)"""
+    if local_caches():
+        return 1
+    return (os.cpu_count() or 1) * 2 + 1
+
+
+class Command(BaseCommand):
+    help = (
+        '운영용 서버로 실행합니다. Linux는 gunicorn(WSGI, 멀티 워커), Windows는 waitress(WSGI, 멀티 스레드), '
+        '--server uvicorn은 ASGI 단일 프로세스(실시간 이벤트 스트림 사용)로 실행합니다. '
+        '옵션 기본값은 SERVER_* 환경 변수로 지정할 수 있습니다.'
+    )
+
+    def add_arguments(self, parser):
+        env = os.environ.get
+        parser.add_argument(
+            '--server', choices=('auto',) + SERVERS, default=env('SERVER_BACKEND', 'auto'),
+            help='서버 종류 (auto: Windows는 waitress, 그 외 gunicorn)',
+        )
+        parser.add_argument('--host', default=env('SERVER_HOST', '0.0.0.0'), help='바인드 주소')
+        parser.add_argument('--port', type=int, default=int(env('SERVER_PORT', '8000')), help='포트')
+        parser.add_argument(
+            '--workers', type=int, default=int(env('SERVER_WORKERS', '0')),
+            help='gunicorn 워커 프로세스 수 (0이면 공유 캐시는 CPU 수 * 2 + 1, 로컬 메모리 캐시는 1)',
+        )
+        parser.add_argument(
+            '--threads', type=int, default=int(env('SERVER_THREADS', '4')),
+            help='워커당 스레드 수 (waitress는 단일 프로세스의 전체 스레드 수)',
+        )
+        parser.add_argument(
+            '--timeout', type=int, default=int(env('SERVER_TIMEOUT', '30')), help='요청 처리 제한 시간(초)'
+        )
+        parser.add_argument('--no-collectstatic', action='store_true', help='시작 전 collectstatic 생략')
+
+    def handle(self, *args, **options):
+        server = options['server']
+        if server == 'auto':
+            server = 'waitress' if sys.platform == 'win32' else 'gunicorn'
+
+        if settings.SECRET_KEY == settings.INSECURE_SECRET_KEY:
+            # 저장소에 공개된 키로는 누구나 관리자 토큰을 만들 수 있음
+            raise CommandError(
+                '개발용 SECRET_KEY로는 실행할 수 없습니다. DJANGO_SECRET_KEY 또는 DJANGO_SECRET_KEY_FILE을 지정하세요.'
+            )
+        if settings.DEBUG:
+            self.stderr.write(self.style.WARNING(
+                'DEBUG가 켜져 있습니다. 운영 모드에서는 DJANGO_DEBUG=0 환경 변수로 실행하세요.'
+            ))
+        if 'whitenoise.middleware.WhiteNoiseMiddleware' not in settings.MIDDLEWARE:
+            self.stderr.write(self.style.WARNING(
+                'whitenoise가 설치되지 않아 정적 파일(관리자 화면 CSS 등)이 제공되지 않습니다. '
+                '(pip install whitenoise brotli)'
+            ))
+
+        workers = options['workers'] or default_workers()
+        shared_required = local_caches()
+        if server == 'gunicorn' and workers > 1 and shared_required:
+            # 카탈로그/세션 캐시와 영업 캘린더 세대 번호, 토큰 폐기 목록이 워커마다 따로 관리되어
+            # 변경(로그아웃, 토큰 폐기 포함)이 다른 워커에 반영되지 않음
+            raise CommandError(
+                f'로컬 메모리 캐시({", ".join(shared_required)})는 워커 간에 공유되지 않습니다. '
+                'DJANGO_CACHE_BACKEND / DJANGO_SESSION_CACHE_BACKEND로 파일/Redis 캐시를 지정하거나 '
+                '--workers 1로 실행하세요.'
+            )
+
+        if not options['no_collectstatic']:
+            call_command('collectstatic', interactive=False, verbosity=0)
+
+        # SQLite는 DB 파일을 WAL 모드로 전환 (파일에 유지되므로 시작할 때 한 번)
+        journal_mode = set_journal_mode(connections['default'])
+        if journal_mode is not None:
+            self.stdout.write(f'SQLite 저널 모드: {journal_mode}')
+
+        # 워커가 부모 프로세스의 DB 연결을 물려받지 않도록 닫고 시작
+        connections.close_all()
+
+        bind = f'{options["host"]}:{options["port"]}'
+        self.stdout.write(self.style.SUCCESS(f'{server} 서버 시작: http://{bind}'))
+        getattr(self, f'run_{server}')(options)
+
+    def require(self, module):
+        try:
+            return __import__(module)
+        except ImportError:
+            raise CommandError(f'{module} 패키지가 설치되어 있지 않습니다. (pip install {module})')
+
+    def run_gunicorn(self, options):
+        self.require('gunicorn')
+        from gunicorn.app.base import BaseApplication
+
+        config = {
+            'bind': f'{options["host"]}:{options["port"]}',
+            'workers': options['workers'] or default_workers(),
+            'threads': options['threads'],
+            'worker_class': 'gthread',
+            'timeout': options['timeout'],
+            # 메모리 누수/단편화 대비 워커 주기적 재시작
+            'max_requests': 2000,
+            'max_requests_jitter': 200,
+        }
+
+        class Application(BaseApplication):
+            def load_config(self):
+                for key, value in config.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                return import_string(WSGI_APP.replace(':', '.'))
+
+        Application().run()
+
+    def run_uvicorn(self, options):
+        uvicorn = self.require('uvicorn')
+        if options['workers'] > 1:
+            # 시간대 변경 이벤트 브로커(booking.events)는 프로세스 메모리에만 존재
+            self.stderr.write(self.style.WARNING(
+                '실시간 이벤트 스트림은 단일 프로세스에서만 동작하므로 uvicorn은 워커 1개로 실행합니다.'
+            ))
+        uvicorn.run(
+            ASGI_APP, host=options['host'], port=options['port'], workers=1,
+            lifespan='off', timeout_keep_alive=5, access_log=False, log_level='info',
+        )
+
+    def run_waitress(self, options):
+        waitress = self.require('waitress')
+        waitress.serve(
+            import_string(WSGI_APP.replace(':', '.')),
+            listen=f'{options["host"]}:{options["port"]}',
+            threads=options['threads'],
+            channel_timeout=options['timeout'],
+            ident='GolfPro',
+        )
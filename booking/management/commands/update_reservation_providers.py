@@ -1,24 +1,88 @@
-from django.core.management.base import BaseCommand
+import time as timer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from django.db.models import OuterRef, Subquery
+
+from booking import day_slots
+from booking.availability import ACTIVE_STATUSES
 from booking.models import Reservation, Service
 
 
 class Command(BaseCommand):
     help = '기존 예약 데이터에 provider 정보를 업데이트합니다.'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 업데이트할 예약 수')
+        parser.add_argument('--dry-run', action='store_true', help='변경하지 않고 대상 건수만 확인')
+
     def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size <= 0:
+            raise CommandError('--batch-size는 1 이상이어야 합니다.')
+
         self.stdout.write('예약 데이터의 provider 정보를 업데이트하는 중...')
 
-        # provider가 없는 예약들을 찾아서 서비스의 provider로 업데이트
-        reservations_without_provider = Reservation.objects.filter(provider__isnull=True)
-        
+        # provider가 없고, 서비스에는 provider가 있는 예약
+        candidates = Reservation.objects.filter(provider__isnull=True, service__provider__isnull=False)
+        total = candidates.count()
+        if options['dry_run']:
+            self.stdout.write(f'[dry-run] 업데이트 대상 예약: {total}개')
+            return
+
+        service_provider = Subquery(
+            Service.objects.filter(pk=OuterRef('service_id')).values('provider_id')[:1]
+        )
+
+        started = timer.perf_counter()
         updated_count = 0
-        for reservation in reservations_without_provider:
-            if reservation.service and reservation.service.provider:
-                reservation.provider = reservation.service.provider
-                reservation.save()
-                updated_count += 1
-                self.stdout.write(f'예약 #{reservation.id} 업데이트: {reservation.service.provider.name}')
-        
+        skipped_ids = []
+        active_dates = set()
+        last_id = 0
+        while True:
+            # id 순서로 배치를 나눠 짧은 트랜잭션으로 커밋 (쓰기 잠금을 오래 잡지 않음)
+            batch = list(
+                candidates.filter(id__gt=last_id).order_by('id').values_list('id', 'date', 'status')[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+            ids = [reservation_id for reservation_id, _, _ in batch]
+            active_dates.update(date for _, date, status in batch if status in ACTIVE_STATUSES)
+
+            try:
+                with transaction.atomic():
+                    updated_count += Reservation.objects.filter(id__in=ids).update(provider_id=service_provider)
+            except IntegrityError:
+                # 같은 제공자/시간의 활성 예약이 생기는 행은 건너뛰고 나머지만 업데이트
+                for reservation_id in ids:
+                    try:
+                        with transaction.atomic():
+                            updated_count += Reservation.objects.filter(id=reservation_id).update(
+                                provider_id=service_provider
+                            )
+                    except IntegrityError:
+                        skipped_ids.append(reservation_id)
+
+            elapsed = timer.perf_counter() - started
+            self.stdout.write(
+                f'  {updated_count + len(skipped_ids)}/{total} 처리 '
+                f'({updated_count / elapsed if elapsed else 0:.0f}건/초)'
+            )
+
+        # update()는 시그널을 보내지 않으므로 영향받은 기간의 점유 현황을 다시 계산
+        # (평점은 제공자가 없는 예약을 이미 서비스의 제공자 기준으로 집계하므로 바뀌지 않음)
+        if active_dates:
+            day_slots.rebuild(min(active_dates), max(active_dates))
+
+        elapsed = timer.perf_counter() - started
+        for reservation_id in skipped_ids:
+            self.stdout.write(self.style.WARNING(
+                f'예약 #{reservation_id}: 같은 제공자의 같은 시간에 활성 예약이 있어 건너뜀'
+            ))
         self.stdout.write(
-            self.style.SUCCESS(f'총 {updated_count}개의 예약이 업데이트되었습니다!')
-        ) 
\ No newline at end of file
+            self.style.SUCCESS(
+                f'총 {updated_count}개의 예약이 업데이트되었습니다! '
+                f'({elapsed:.2f}초, {updated_count / elapsed if elapsed else 0:.0f}건/초, 건너뜀 {len(skipped_ids)}개)'
+            )
+        )
@@ -0,0 +1,90 @@
+"""
+응답 압축 미들웨어
+
+Accept-Encoding을 확인해 brotli(설치된 경우) 또는 gzip으로 압축합니다.
+COMPRESSION_MIN_SIZE보다 작은 응답은 압축 비용이 이득보다 크므로 그대로 보내고,
+스트리밍 응답(내보내기, 이벤트 스트림)은 버퍼링되지 않도록 압축하지 않습니다.
+"""
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = (
+    'text/', 'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+)
+
+
+def accepted_encodings(header):
+    """Accept-Encoding 헤더에서 q=0이 아닌 인코딩 이름 집합"""
+    accepted = set()
+    for part in header.lower().split(','):
+        name, _, params = part.partition(';')
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name.strip():
+            accepted.add(name.strip())
+    return accepted
+
+
+def choose_encoding(header):
+    """응답에 사용할 압축 방식 ('br', 'gzip' 또는 None)"""
+    accepted = accepted_encodings(header)
+    if brotli is not None and ('br' in accepted or '*' in accepted):
+        return 'br'
+    if 'gzip' in accepted or '*' in accepted:
+        return 'gzip'
+    return None
+
+
+class CompressionMiddleware:
+    """크기 기준 이상인 응답을 brotli/gzip으로 압축"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.brotli_quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        content_type = response.get('Content-Type', '').lower()
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return response
+        # 응답 크기와 관계없이 캐시가 인코딩별로 구분하도록 Vary 지정
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < self.min_size:
+            return response
+
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+        if encoding == 'br':
+            compressed = brotli.compress(
+                response.content, mode=brotli.MODE_TEXT, quality=self.brotli_quality
+            )
+        else:
+            # BREACH 공격 완화를 위해 Django GZipMiddleware와 같이 임의 길이의 바이트 추가
+            compressed = compress_string(response.content, max_random_bytes=100)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # 압축된 표현은 바이트 단위로 다르므로 강한 ETag를 약한 ETag로 변경
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
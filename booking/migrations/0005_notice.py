@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0004_serviceprovider_password_serviceprovider_username'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200, verbose_name='제목')),
+                ('content', models.TextField(verbose_name='내용')),
+                ('priority', models.CharField(choices=[('low', '낮음'), ('medium', '보통'), ('high', '높음')], default='medium', max_length=10, verbose_name='우선순위')),
+                ('is_active', models.BooleanField(default=True, verbose_name='활성화 여부')),
+                ('is_pinned', models.BooleanField(default=False, verbose_name='상단 고정')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='작성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '공지사항',
+                'verbose_name_plural': '공지사항들',
+                'ordering': ['-is_pinned', '-priority', '-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0005_notice'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['provider', 'date', 'status'], name='reservation_provider_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['service', 'date', 'time'], name='reservation_service_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['user', 'date', 'time'], name='reservation_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['provider', 'updated_at'], name='reservation_provider_upd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['date', 'status'], name='reservation_date_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'confirmed'])), fields=['provider', 'date', 'time'], name='reservation_active_slot_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:26
+
+from django.db import migrations, models
+
+
+def check_duplicate_active_reservations(apps, schema_editor):
+    """
+    제약 조건 추가 전, 같은 시간대에 활성 예약이 둘 이상 있으면 중단하고 예약 ID를 출력
+
+    어느 예약을 남길지는 운영자가 직접 정해야 하므로 자동으로 취소하지 않습니다.
+    충돌한 예약을 취소하거나 시간을 옮긴 후 다시 migrate를 실행하세요.
+    """
+    Reservation = apps.get_model('booking', 'Reservation')
+    active = Reservation.objects.filter(status__in=['pending', 'confirmed']).order_by('created_at', 'id')
+
+    slots = {}
+    for reservation_id, provider_id, service_id, date, time in active.values_list(
+        'id', 'provider_id', 'service_id', 'date', 'time'
+    ):
+        slots.setdefault(('서비스', service_id, date, time), []).append(reservation_id)
+        if provider_id is not None:
+            slots.setdefault(('제공자', provider_id, date, time), []).append(reservation_id)
+
+    conflicts = [
+        f'{kind} {target_id} {date} {time}: 예약 {", ".join(map(str, ids))}'
+        for (kind, target_id, date, time), ids in slots.items() if len(ids) > 1
+    ]
+    if conflicts:
+        raise RuntimeError(
+            '같은 시간대에 활성(대기/확정) 예약이 중복되어 제약 조건을 추가할 수 없습니다. '
+            '아래 예약을 정리한 후 다시 실행하세요.\n' + '\n'.join(conflicts)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0006_reservation_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_active_reservations, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='reservation',
+            name='reservation_active_slot_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='reservation',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'confirmed'])), fields=('provider', 'date', 'time'), name='unique_active_provider_slot'),
+        ),
+        migrations.AddConstraint(
+            model_name='reservation',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'confirmed'])), fields=('service', 'date', 'time'), name='unique_active_service_slot'),
+        ),
+    ]
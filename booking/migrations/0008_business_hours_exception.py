@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0007_reservation_unique_active_slot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessHoursException',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='날짜')),
+                ('is_closed', models.BooleanField(default=True, verbose_name='휴무일')),
+                ('open_time', models.TimeField(blank=True, null=True, verbose_name='오픈 시간')),
+                ('close_time', models.TimeField(blank=True, null=True, verbose_name='마감 시간')),
+                ('reason', models.CharField(blank=True, max_length=100, verbose_name='사유')),
+            ],
+            options={
+                'verbose_name': '영업시간 예외',
+                'verbose_name_plural': '영업시간 예외',
+                'ordering': ['date'],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0008_business_hours_exception'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.IntegerField(choices=[(0, '월요일'), (1, '화요일'), (2, '수요일'), (3, '목요일'), (4, '금요일'), (5, '토요일'), (6, '일요일')], verbose_name='요일')),
+                ('start_time', models.TimeField(verbose_name='시작 시간')),
+                ('end_time', models.TimeField(verbose_name='종료 시간')),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedules', to='booking.serviceprovider', verbose_name='서비스 제공자')),
+            ],
+            options={
+                'verbose_name': '제공자 근무시간',
+                'verbose_name_plural': '제공자 근무시간',
+                'ordering': ['provider', 'day', 'start_time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProviderBreak',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.IntegerField(choices=[(0, '월요일'), (1, '화요일'), (2, '수요일'), (3, '목요일'), (4, '금요일'), (5, '토요일'), (6, '일요일')], verbose_name='요일')),
+                ('start_time', models.TimeField(verbose_name='시작 시간')),
+                ('end_time', models.TimeField(verbose_name='종료 시간')),
+                ('reason', models.CharField(blank=True, max_length=100, verbose_name='사유')),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='breaks', to='booking.serviceprovider', verbose_name='서비스 제공자')),
+            ],
+            options={
+                'verbose_name': '제공자 휴게시간',
+                'verbose_name_plural': '제공자 휴게시간',
+                'ordering': ['provider', 'day', 'start_time'],
+            },
+        ),
+    ]
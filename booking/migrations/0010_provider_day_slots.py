@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_provider_day_slots(apps, schema_editor):
+    """기존 활성 예약으로 제공자 일별 점유 현황 생성"""
+    Reservation = apps.get_model('booking', 'Reservation')
+    ProviderDaySlots = apps.get_model('booking', 'ProviderDaySlots')
+
+    slots = {}
+    for provider_id, date, time in Reservation.objects.filter(
+        status__in=['pending', 'confirmed'], provider__isnull=False
+    ).values_list('provider_id', 'date', 'time').iterator(chunk_size=2000):
+        slots.setdefault((provider_id, date), []).append(time.hour * 60 + time.minute)
+
+    ProviderDaySlots.objects.bulk_create(
+        [
+            ProviderDaySlots(provider_id=provider_id, date=date, occupied=sorted(minutes))
+            for (provider_id, date), minutes in slots.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0009_provider_schedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderDaySlots',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('occupied', models.JSONField(default=list, verbose_name='점유 시작 시각(분)')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='day_slots', to='booking.serviceprovider', verbose_name='서비스 제공자')),
+            ],
+            options={
+                'verbose_name': '제공자 일별 점유 현황',
+                'verbose_name_plural': '제공자 일별 점유 현황',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='providerdayslots',
+            constraint=models.UniqueConstraint(fields=('provider', 'date'), name='unique_provider_day_slots'),
+        ),
+        migrations.RunPython(build_provider_day_slots, migrations.RunPython.noop),
+    ]
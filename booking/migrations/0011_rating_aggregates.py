@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:43
+
+from django.db import migrations, models
+
+
+def build_rating_aggregates(apps, schema_editor):
+    """기존 리뷰로 서비스/제공자 평점 계산"""
+    Review = apps.get_model('booking', 'Review')
+    Service = apps.get_model('booking', 'Service')
+    ServiceProvider = apps.get_model('booking', 'ServiceProvider')
+
+    services = {}
+    providers = {}
+    for service_id, provider_id, service_provider_id, rating in Review.objects.values_list(
+        'reservation__service_id', 'reservation__provider_id', 'reservation__service__provider_id', 'rating'
+    ).iterator(chunk_size=2000):
+        services.setdefault(service_id, []).append(rating)
+        provider_id = provider_id if provider_id is not None else service_provider_id
+        if provider_id is not None:
+            providers.setdefault(provider_id, []).append(rating)
+
+    for model, ratings in [(Service, services), (ServiceProvider, providers)]:
+        for pk, values in ratings.items():
+            model.objects.filter(pk=pk).update(rating_avg=sum(values) / len(values), rating_count=len(values))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0010_provider_day_slots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='rating_avg',
+            field=models.FloatField(default=0, editable=False, verbose_name='평균 평점'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='리뷰 수'),
+        ),
+        migrations.AddField(
+            model_name='serviceprovider',
+            name='rating_avg',
+            field=models.FloatField(default=0, editable=False, verbose_name='평균 평점'),
+        ),
+        migrations.AddField(
+            model_name='serviceprovider',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='리뷰 수'),
+        ),
+        migrations.RunPython(build_rating_aggregates, migrations.RunPython.noop),
+    ]
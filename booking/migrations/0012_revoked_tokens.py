@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0011_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jti', models.CharField(max_length=32, unique=True, verbose_name='토큰 ID')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='만료 시각')),
+                ('revoked_at', models.DateTimeField(auto_now_add=True, verbose_name='폐기 시각')),
+            ],
+            options={
+                'verbose_name': '폐기한 토큰',
+                'verbose_name_plural': '폐기한 토큰들',
+            },
+        ),
+    ]
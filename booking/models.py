@@ -31,6 +31,8 @@ class ServiceProvider(models.Model):
     is_active = models.BooleanField(default=True, verbose_name="활성화 여부")
     specialties = models.TextField(blank=True, null=True, verbose_name="전문 분야")
     experience_years = models.PositiveIntegerField(default=0, verbose_name="경력 연차")
+    rating_avg = models.FloatField(default=0, editable=False, verbose_name="평균 평점")
+    rating_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="리뷰 수")
     # 로그인 정보 추가
     username = models.CharField(max_length=50, unique=True, null=True, blank=True, verbose_name="로그인 아이디")
     password = models.CharField(max_length=128, null=True, blank=True, verbose_name="비밀번호")
@@ -60,6 +62,8 @@ class Service(models.Model):
     stock_quantity = models.PositiveIntegerField(default=0, verbose_name="재고 수량")
     min_advance_booking = models.PositiveIntegerField(default=0, verbose_name="최소 예약 가능 시간(시간)")
     max_advance_booking = models.PositiveIntegerField(default=30, verbose_name="최대 예약 가능 시간(일)")
+    rating_avg = models.FloatField(default=0, editable=False, verbose_name="평균 평점")
+    rating_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="리뷰 수")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
@@ -100,6 +104,31 @@ class Reservation(models.Model):
         verbose_name = "예약"
         verbose_name_plural = "예약들"
         ordering = ['-date', '-time']
+        indexes = [
+            # 제공자 일정/대시보드 조회, 제공자별 중복 예약 확인
+            models.Index(fields=['provider', 'date', 'status'], name='reservation_provider_date_idx'),
+            # 서비스별 중복 예약 확인
+            models.Index(fields=['service', 'date', 'time'], name='reservation_service_date_idx'),
+            # 사용자 예약 내역/다가오는 예약 (-date, -time 정렬)
+            models.Index(fields=['user', 'date', 'time'], name='reservation_user_date_idx'),
+            # 최근 변경된 예약 (time_slot_updates)
+            models.Index(fields=['provider', 'updated_at'], name='reservation_provider_upd_idx'),
+            # 제공자가 없는 서비스의 날짜별 점유 조회
+            models.Index(fields=['date', 'status'], name='reservation_date_status_idx'),
+        ]
+        constraints = [
+            # 같은 제공자/서비스의 같은 시간대에는 대기중/확정 예약이 하나만 존재 (DB에서 중복 예약 차단)
+            models.UniqueConstraint(
+                fields=['provider', 'date', 'time'],
+                condition=models.Q(status__in=['pending', 'confirmed']),
+                name='unique_active_provider_slot',
+            ),
+            models.UniqueConstraint(
+                fields=['service', 'date', 'time'],
+                condition=models.Q(status__in=['pending', 'confirmed']),
+                name='unique_active_service_slot',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.service.name} ({self.date})"
@@ -130,6 +159,28 @@ class Review(models.Model):
         return f"{self.reservation.user.username}의 리뷰 - {self.rating}점"
 
 
+class ProviderDaySlots(models.Model):
+    """
+    제공자 날짜별 예약 점유 현황 (예약 변경 시 갱신되는 비정규화 테이블)
+
+    occupied는 대기중/확정 예약의 시작 시각을 자정 기준 분 단위로 정렬한 목록입니다.
+    """
+    provider = models.ForeignKey(ServiceProvider, on_delete=models.CASCADE, related_name='day_slots', verbose_name="서비스 제공자")
+    date = models.DateField(verbose_name="날짜")
+    occupied = models.JSONField(default=list, verbose_name="점유 시작 시각(분)")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "제공자 일별 점유 현황"
+        verbose_name_plural = "제공자 일별 점유 현황"
+        constraints = [
+            models.UniqueConstraint(fields=['provider', 'date'], name='unique_provider_day_slots'),
+        ]
+
+    def __str__(self):
+        return f"{self.provider_id} {self.date} ({len(self.occupied)}건)"
+
+
 class BusinessHours(models.Model):
     """영업시간 모델"""
     DAY_CHOICES = [
@@ -158,6 +209,73 @@ class BusinessHours(models.Model):
         return f"{self.get_day_display()} - {self.open_time} ~ {self.close_time}"
 
 
+class ProviderSchedule(models.Model):
+    """제공자 요일별 근무시간 모델 (한 요일에 여러 구간 등록 가능)"""
+    provider = models.ForeignKey(ServiceProvider, on_delete=models.CASCADE, related_name='schedules', verbose_name="서비스 제공자")
+    day = models.IntegerField(choices=BusinessHours.DAY_CHOICES, verbose_name="요일")
+    start_time = models.TimeField(verbose_name="시작 시간")
+    end_time = models.TimeField(verbose_name="종료 시간")
+
+    class Meta:
+        verbose_name = "제공자 근무시간"
+        verbose_name_plural = "제공자 근무시간"
+        ordering = ['provider', 'day', 'start_time']
+
+    def clean(self):
+        from django.core.exceptions import ValidationError
+        if self.start_time >= self.end_time:
+            raise ValidationError("종료 시간은 시작 시간보다 늦어야 합니다.")
+
+    def __str__(self):
+        return f"{self.provider} {self.get_day_display()} {self.start_time} ~ {self.end_time}"
+
+
+class ProviderBreak(models.Model):
+    """제공자 요일별 휴게시간 모델"""
+    provider = models.ForeignKey(ServiceProvider, on_delete=models.CASCADE, related_name='breaks', verbose_name="서비스 제공자")
+    day = models.IntegerField(choices=BusinessHours.DAY_CHOICES, verbose_name="요일")
+    start_time = models.TimeField(verbose_name="시작 시간")
+    end_time = models.TimeField(verbose_name="종료 시간")
+    reason = models.CharField(max_length=100, blank=True, verbose_name="사유")
+
+    class Meta:
+        verbose_name = "제공자 휴게시간"
+        verbose_name_plural = "제공자 휴게시간"
+        ordering = ['provider', 'day', 'start_time']
+
+    def clean(self):
+        from django.core.exceptions import ValidationError
+        if self.start_time >= self.end_time:
+            raise ValidationError("종료 시간은 시작 시간보다 늦어야 합니다.")
+
+    def __str__(self):
+        return f"{self.provider} {self.get_day_display()} {self.start_time} ~ {self.end_time} 휴게"
+
+
+class BusinessHoursException(models.Model):
+    """특정 날짜 영업시간 예외 모델 (공휴일 휴무, 특별 영업시간)"""
+    date = models.DateField(unique=True, verbose_name="날짜")
+    is_closed = models.BooleanField(default=True, verbose_name="휴무일")
+    open_time = models.TimeField(null=True, blank=True, verbose_name="오픈 시간")
+    close_time = models.TimeField(null=True, blank=True, verbose_name="마감 시간")
+    reason = models.CharField(max_length=100, blank=True, verbose_name="사유")
+
+    class Meta:
+        verbose_name = "영업시간 예외"
+        verbose_name_plural = "영업시간 예외"
+        ordering = ['date']
+
+    def clean(self):
+        from django.core.exceptions import ValidationError
+        if not self.is_closed and (self.open_time is None or self.close_time is None):
+            raise ValidationError("특별 영업일은 오픈 시간과 마감 시간이 필요합니다.")
+
+    def __str__(self):
+        if self.is_closed:
+            return f"{self.date} - 휴무"
+        return f"{self.date} - {self.open_time} ~ {self.close_time}"
+
+
 class Notice(models.Model):
     """공지사항 모델"""
     PRIORITY_CHOICES = [
@@ -181,3 +299,17 @@ class Notice(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class RevokedToken(models.Model):
+    """폐기한 API 토큰 ID (booking.tokens, 만료 시각이 지나면 정리)"""
+    jti = models.CharField(max_length=32, unique=True, verbose_name="토큰 ID")
+    expires_at = models.DateTimeField(db_index=True, verbose_name="만료 시각")
+    revoked_at = models.DateTimeField(auto_now_add=True, verbose_name="폐기 시각")
+
+    class Meta:
+        verbose_name = "폐기한 토큰"
+        verbose_name_plural = "폐기한 토큰들"
+
+    def __str__(self):
+        return self.jti
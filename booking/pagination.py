@@ -0,0 +1,40 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.settings import api_settings
+
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_MAX_PAGE_SIZE = 200
+
+
+class BaseCursorPagination(CursorPagination):
+    """
+    커서 페이지네이션 공통 설정
+
+    기본 크기는 REST_FRAMEWORK['PAGE_SIZE'](없으면 50건)이며, ?page_size= 로
+    REST_FRAMEWORK['MAX_PAGE_SIZE'](없으면 200건)까지 조정할 수 있습니다.
+    """
+    page_size_query_param = 'page_size'
+
+    def __init__(self):
+        # 페이지네이터는 요청마다 만들어지므로 설정 변경(override_settings 포함)이 바로 반영됨
+        self.page_size = api_settings.PAGE_SIZE or DEFAULT_PAGE_SIZE
+        self.max_page_size = api_settings.user_settings.get('MAX_PAGE_SIZE') or DEFAULT_MAX_PAGE_SIZE
+
+
+class ReservationCursorPagination(BaseCursorPagination):
+    """예약 목록 커서 페이지네이션 (최신 날짜/시간 순)"""
+    # DRF 커서는 정렬의 첫 필드(date) 값을 위치로 쓰고, 같은 날짜 안에서만 건너뛴 행 수(offset)를 더함
+    # 따라서 전체 COUNT 없이 date 인덱스로 다음 페이지를 찾으며, OFFSET은 한 날짜의 예약 수를 넘지 않음
+    # (time, id는 같은 날짜 안에서 순서를 고정해 페이지 간 중복/누락을 막는 용도)
+    ordering = ('-date', '-time', '-id')
+
+
+class UpcomingReservationCursorPagination(ReservationCursorPagination):
+    """다가오는 예약 커서 페이지네이션 (가까운 날짜/시간 순)"""
+    ordering = ('date', 'time', 'id')
+
+
+class ReviewCursorPagination(BaseCursorPagination):
+    """리뷰 목록 커서 페이지네이션 (최신순)"""
+    # created_at은 거의 겹치지 않으므로 OFFSET은 사실상 0
+    ordering = ('-created_at', '-id')
@@ -0,0 +1,87 @@
+"""
+서비스/제공자 평점 집계 (rating_avg, rating_count)
+
+리뷰가 생성/수정/삭제될 때 해당 서비스와 제공자의 평점을 리뷰 테이블 기준
+상관 서브쿼리 UPDATE 한 번씩으로 다시 계산합니다. 목록 API는 리뷰를 조회하지 않고
+저장된 값을 그대로 직렬화합니다.
+제공자 평점은 예약에 지정된 제공자, 없으면 서비스의 제공자 기준으로 집계합니다.
+리뷰가 달린 예약의 서비스/제공자가 바뀌거나 서비스의 제공자가 바뀌면 이전과 새 대상을 모두 갱신합니다.
+시그널 없이 update()로 예약을 바꾸는 일괄 작업은 집계 대상이 바뀌는 경우 rebuild()를 실행해야 합니다.
+"""
+from django.db import transaction
+from django.db.models import F, FloatField, Func, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from . import catalog
+from .models import Reservation, Review, Service, ServiceProvider
+
+
+def _rating_values(reviews):
+    """리뷰 쿼리셋의 (평균, 개수) 서브쿼리 식 (GROUP BY 없이 집계하도록 Func 사용)"""
+    reviews = reviews.order_by()
+    average = reviews.values(value=Func(F('rating'), function='AVG', output_field=FloatField()))
+    count = reviews.values(value=Func(F('id'), function='COUNT', output_field=IntegerField()))
+    return {
+        'rating_avg': Coalesce(Subquery(average), Value(0.0)),
+        'rating_count': Coalesce(Subquery(count), Value(0)),
+    }
+
+
+def service_rating_values():
+    return _rating_values(Review.objects.filter(reservation__service_id=OuterRef('pk')))
+
+
+def provider_rating_values():
+    return _rating_values(Review.objects.filter(
+        Q(reservation__provider_id=OuterRef('pk'))
+        | Q(reservation__provider__isnull=True, reservation__service__provider_id=OuterRef('pk'))
+    ))
+
+
+def refresh(service_id=None, provider_id=None):
+    """한 서비스/제공자의 평점을 다시 계산하고 카탈로그 캐시 무효화"""
+    with transaction.atomic():
+        if service_id is not None:
+            Service.objects.filter(pk=service_id).update(**service_rating_values())
+        if provider_id is not None:
+            ServiceProvider.objects.filter(pk=provider_id).update(**provider_rating_values())
+    # update()는 시그널을 보내지 않으므로 직접 무효화
+    catalog.invalidate('services', 'providers_active')
+
+
+def refresh_for_reservation(reservation_id):
+    """리뷰가 달린 예약의 서비스와 제공자 평점 갱신 (예약이 이미 삭제되었으면 무시)"""
+    row = Reservation.objects.filter(pk=reservation_id).values_list(
+        'service_id', 'provider_id', 'service__provider_id'
+    ).first()
+    if row is None:
+        return
+    service_id, provider_id, service_provider_id = row
+    refresh(service_id, provider_id if provider_id is not None else service_provider_id)
+
+
+def refresh_reassigned(reservation_id, service_id, provider_id):
+    """리뷰가 달린 예약의 서비스/제공자가 바뀐 경우 이전 대상과 새 대상의 평점 갱신"""
+    if not Review.objects.filter(reservation_id=reservation_id).exists():
+        return
+    refresh(service_id, provider_id)
+    refresh_for_reservation(reservation_id)
+
+
+def refresh_service_provider(service_id, previous_provider_id, provider_id):
+    """서비스의 제공자가 바뀐 경우 (제공자가 지정되지 않은 예약의 리뷰가 옮겨감) 두 제공자 평점 갱신"""
+    if not Review.objects.filter(
+        reservation__service_id=service_id, reservation__provider__isnull=True
+    ).exists():
+        return
+    with transaction.atomic():
+        for target_id in (previous_provider_id, provider_id):
+            refresh(provider_id=target_id)
+
+
+def rebuild():
+    """전체 서비스/제공자 평점을 리뷰 테이블에서 다시 계산"""
+    with transaction.atomic():
+        Service.objects.update(**service_rating_values())
+        ServiceProvider.objects.update(**provider_rating_values())
+    catalog.invalidate('services', 'providers_active')
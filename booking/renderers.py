@@ -0,0 +1,62 @@
+"""
+JSON 렌더러/파서
+
+orjson이 설치되어 있으면 C 구현으로 인코딩/디코딩하고, 없거나 orjson이 처리하지 못하는 값
+(64비트를 넘는 정수 등)이 있으면 DRF 기본 구현(표준 json)을 그대로 사용합니다.
+출력은 DRF 기본 설정(UNICODE_JSON, COMPACT_JSON)과 같은 UTF-8 압축 형식입니다.
+"""
+from django.conf import settings
+from rest_framework import parsers, renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LINE_SEPARATOR = '\u2028'.encode('utf-8')
+PARAGRAPH_SEPARATOR = '\u2029'.encode('utf-8')
+
+if orjson is not None:
+    # 정수 키 dict 허용, UTC 시각은 DRF와 같이 'Z'로 표기
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    # Decimal, 지연 번역 문자열 등 orjson이 모르는 타입은 DRF 인코더 규칙으로 변환
+    _default = JSONEncoder().default
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """orjson을 사용하는 JSON 렌더러"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # 들여쓰기 요청(Accept의 indent 매개변수)과 ASCII/공백 포함 출력 설정은 기본 구현 사용
+        if orjson is None or self.ensure_ascii or not self.compact or self.get_indent(
+            accepted_media_type or '', renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # DRF와 같이 JavaScript 문자열에서 줄바꿈으로 해석되는 문자를 이스케이프
+        if LINE_SEPARATOR in ret or PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b'\\u2028').replace(PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
+
+
+class JSONParser(parsers.JSONParser):
+    """orjson을 사용하는 JSON 파서"""
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+        try:
+            # orjson은 NaN/Infinity를 허용하지 않으므로 STRICT_JSON과 같은 동작
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
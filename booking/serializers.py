@@ -4,13 +4,112 @@ from django.contrib.auth.password_validation import validate_password
 from .models import Service, Reservation, Review, BusinessHours, Category, ServiceProvider, Notice
 
 
-class CategorySerializer(serializers.ModelSerializer):
+def parse_paths(value):
+    """'a,b.c' 형식의 필드 경로를 집합으로 변환 (None이면 None)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    return {path.strip() for path in value if path.strip()}
+
+
+def split_paths(paths):
+    """{'service.provider', 'user'} -> {'service': {'provider'}, 'user': set()}"""
+    tree = {}
+    for path in paths or ():
+        name, _, rest = path.partition('.')
+        children = tree.setdefault(name, set())
+        if rest:
+            children.add(rest)
+    return tree
+
+
+def requested_paths(request):
+    """요청의 ?fields= / ?expand= 값 (중첩 필드를 고르면 해당 관계도 펼침)"""
+    params = getattr(request, 'query_params', None) or getattr(request, 'GET', {})
+    fields = parse_paths(params.get('fields'))
+    expand = parse_paths(params.get('expand')) or set()
+    for path in fields or ():
+        parts = path.split('.')[:-1]
+        expand.update('.'.join(parts[:index]) for index in range(1, len(parts) + 1))
+    return fields, expand
+
+
+class DynamicFieldsMixin:
+    """
+    필드 선택(?fields=)과 관계 펼치기(?expand=)
+
+    expandable_fields의 관계는 기본적으로 ID로 응답하고, expand에 이름이 있을 때만
+    중첩 객체로 직렬화합니다. 'service.provider'처럼 점으로 중첩 관계를 펼치거나
+    'id,service.name'처럼 중첩 필드를 고를 수 있습니다.
+    최상위 시리얼라이저는 요청 쿼리에서, 중첩 시리얼라이저는 생성자 인자에서 값을 읽습니다.
+    """
+
+    # 이름: (시리얼라이저 클래스, 추가 인자)
+    expandable_fields = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 펼치지 않은 관계는 ID (모델 필드가 아닌 이름도 쓸 수 있도록 선언 필드로 등록)
+        for name, (_, options) in cls.expandable_fields.items():
+            if name not in cls._declared_fields:
+                cls._declared_fields[name] = serializers.PrimaryKeyRelatedField(
+                    read_only=True, source=options.get('source')
+                )
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        self._requested_fields = parse_paths(fields)
+        self._requested_expand = parse_paths(expand)
+        super().__init__(*args, **kwargs)
+
+    def requested(self):
+        fields, expand = self._requested_fields, self._requested_expand
+        if expand is not None:
+            return fields, expand
+        parent = self.parent
+        is_root = parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+        request = self.context.get('request')
+        if is_root and request is not None:
+            return requested_paths(request)
+        return fields, set()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        only, expand = self.requested()
+        only_tree = split_paths(only)
+        for name, children in split_paths(expand).items():
+            if name not in self.expandable_fields or name not in fields:
+                continue
+            serializer_class, options = self.expandable_fields[name]
+            fields[name] = serializer_class(
+                read_only=True, fields=only_tree.get(name) or None, expand=children, **options
+            )
+        if only is not None:
+            fields = {name: field for name, field in fields.items() if name in only_tree}
+        return fields
+
+    @classmethod
+    def related_paths(cls, expand):
+        """expand 경로를 select_related 경로로 변환"""
+        paths = []
+        for name, children in split_paths(expand).items():
+            if name not in cls.expandable_fields:
+                continue
+            serializer_class, options = cls.expandable_fields[name]
+            path = options.get('source', name).replace('.', '__')
+            paths.append(path)
+            if issubclass(serializer_class, DynamicFieldsMixin):
+                paths.extend(f'{path}__{child}' for child in serializer_class.related_paths(children))
+        return paths
+
+
+class CategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = '__all__'
 
 
-class ServiceProviderSerializer(serializers.ModelSerializer):
+class ServiceProviderSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ServiceProvider
         fields = '__all__'
@@ -32,7 +131,7 @@ class ServiceProviderSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+class UserRegistrationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, validators=[validate_password])
     password2 = serializers.CharField(write_only=True)
     full_name = serializers.CharField(write_only=True, required=False)
@@ -57,7 +156,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     full_name = serializers.CharField(source='first_name', read_only=True)
     
     class Meta:
@@ -65,10 +164,12 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ['id', 'username', 'email', 'full_name']
 
 
-class ServiceSerializer(serializers.ModelSerializer):
-    category = CategorySerializer(read_only=True)
+class ServiceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        'category': (CategorySerializer, {}),
+        'provider': (ServiceProviderSerializer, {}),
+    }
     category_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
-    provider = ServiceProviderSerializer(read_only=True)
     provider_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
     is_available = serializers.ReadOnlyField()
     
@@ -77,12 +178,12 @@ class ServiceSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'category', 'category_id', 'provider', 'provider_id', 'name', 'description', 'price', 
             'duration', 'image', 'is_active', 'is_featured', 'stock_quantity',
-            'min_advance_booking', 'max_advance_booking', 'is_available',
+            'min_advance_booking', 'max_advance_booking', 'is_available', 'rating_avg', 'rating_count',
             'created_at', 'updated_at'
         ]
 
 
-class BusinessHoursSerializer(serializers.ModelSerializer):
+class BusinessHoursSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     day_display = serializers.CharField(source='get_day_display', read_only=True)
 
     class Meta:
@@ -90,14 +191,16 @@ class BusinessHoursSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class NoticeSerializer(serializers.ModelSerializer):
+class NoticeSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Notice
         fields = ['id', 'title', 'content', 'priority', 'is_active', 'is_pinned', 'created_at', 'updated_at']
 
 
-class ReviewSerializer(serializers.ModelSerializer):
-    user = UserSerializer(source='reservation.user', read_only=True)
+class ReviewSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        'user': (UserSerializer, {'source': 'reservation.user'}),
+    }
     service_name = serializers.CharField(source='reservation.service.name', read_only=True)
 
     class Meta:
@@ -105,14 +208,21 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ['id', 'reservation', 'rating', 'comment', 'created_at', 'user', 'service_name']
 
 
-class ReservationSerializer(serializers.ModelSerializer):
-    user = UserSerializer(read_only=True)
-    service = ServiceSerializer(read_only=True)
+def service_provider_id(service_id):
+    """서비스의 담당 제공자 ID (제공자를 지정하지 않은 예약의 기본값)"""
+    return Service.objects.filter(id=service_id).values_list('provider_id', flat=True).first()
+
+
+class ReservationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        'user': (UserSerializer, {}),
+        'service': (ServiceSerializer, {}),
+        'provider': (ServiceProviderSerializer, {}),
+        'review': (ReviewSerializer, {}),
+    }
     service_id = serializers.IntegerField(write_only=True)
-    provider = ServiceProviderSerializer(read_only=True)
     provider_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
-    review = ReviewSerializer(read_only=True)
 
     class Meta:
         model = Reservation
@@ -127,31 +237,23 @@ class ReservationSerializer(serializers.ModelSerializer):
         provider_id = validated_data.pop('provider_id', None)
         
         validated_data['service_id'] = service_id
+        provider_id = provider_id or service_provider_id(service_id)
         if provider_id:
             validated_data['provider_id'] = provider_id
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
     def validate(self, data):
-        # 예약 날짜가 과거가 아닌지 확인
+        # 예약 날짜가 과거가 아닌지 확인 (날짜를 바꾸는 경우에만)
+        # 같은 시간대 중복 예약은 제공자/서비스별 DB 제약 조건이 저장 시 차단 (409)
         from django.utils import timezone
-        if data['date'] < timezone.now().date():
+        if 'date' in data and data['date'] < timezone.now().date():
             raise serializers.ValidationError("과거 날짜는 예약할 수 없습니다.")
         
-        # 같은 시간에 중복 예약이 없는지 확인
-        existing_reservation = Reservation.objects.filter(
-            date=data['date'],
-            time=data['time'],
-            status__in=['pending', 'confirmed']
-        ).first()
-        
-        if existing_reservation:
-            raise serializers.ValidationError("해당 시간에 이미 예약이 있습니다.")
-        
         return data
 
 
-class ReservationCreateSerializer(serializers.ModelSerializer):
+class ReservationCreateSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     service_id = serializers.IntegerField()
     provider_id = serializers.IntegerField(required=False, allow_null=True)
 
@@ -164,21 +266,24 @@ class ReservationCreateSerializer(serializers.ModelSerializer):
         provider_id = validated_data.pop('provider_id', None)
         
         validated_data['service_id'] = service_id
+        provider_id = provider_id or service_provider_id(service_id)
         if provider_id:
             validated_data['provider_id'] = provider_id
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
 
-class ServiceProviderLoginSerializer(serializers.Serializer):
+class ServiceProviderLoginSerializer(DynamicFieldsMixin, serializers.Serializer):
     username = serializers.CharField()
     password = serializers.CharField(write_only=True)
 
 
-class ServiceProviderReservationSerializer(serializers.ModelSerializer):
+class ServiceProviderReservationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """서비스 제공자용 예약 시리얼라이저"""
-    user = UserSerializer(read_only=True)
-    service = ServiceSerializer(read_only=True)
+    expandable_fields = {
+        'user': (UserSerializer, {}),
+        'service': (ServiceSerializer, {}),
+    }
     status_display = serializers.CharField(source='get_status_display', read_only=True)
 
     class Meta:
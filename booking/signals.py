@@ -0,0 +1,117 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import catalog, day_slots, ratings
+from .business_calendar import business_calendar, provider_calendar
+from .models import (
+    BusinessHours, BusinessHoursException, Category, Notice, ProviderBreak, ProviderSchedule, Reservation,
+    Review, Service, ServiceProvider,
+)
+
+# 제공자 일별 점유 현황에 영향을 주는 예약 필드
+DAY_SLOT_FIELDS = {'provider', 'provider_id', 'date', 'time', 'status'}
+# 평점 집계 대상(서비스, 제공자)을 정하는 예약 필드
+RATING_FIELDS = {'service', 'service_id', 'provider', 'provider_id'}
+
+
+@receiver([post_save, post_delete], sender=Service)
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=ServiceProvider)
+@receiver([post_save, post_delete], sender=BusinessHours)
+@receiver([post_save, post_delete], sender=Notice)
+def invalidate_catalog(sender, **kwargs):
+    """카탈로그 모델 변경 시 캐시 무효화"""
+    catalog.invalidate_for_model(sender)
+
+
+@receiver([post_save, post_delete], sender=BusinessHours)
+@receiver([post_save, post_delete], sender=BusinessHoursException)
+def invalidate_business_calendar(sender, **kwargs):
+    """영업시간/예외 변경 시 영업 캘린더 다시 읽기"""
+    business_calendar.invalidate()
+
+
+@receiver([post_save, post_delete], sender=ProviderSchedule)
+@receiver([post_save, post_delete], sender=ProviderBreak)
+def invalidate_provider_calendar(sender, **kwargs):
+    """제공자 근무시간/휴게시간 변경 시 근무 구간 다시 컴파일"""
+    provider_calendar.invalidate()
+
+
+@receiver(pre_save, sender=Service)
+def remember_service_provider(sender, instance, **kwargs):
+    """저장 후 평점을 옮길 수 있도록 변경 전 제공자 기록"""
+    instance._previous_provider_id = None
+    if not instance._state.adding and instance.pk is not None:
+        instance._previous_provider_id = Service.objects.filter(pk=instance.pk).values_list(
+            'provider_id', flat=True
+        ).first()
+
+
+@receiver(post_save, sender=Service)
+def refresh_service_provider_ratings(sender, instance, created, **kwargs):
+    """서비스의 제공자가 바뀌면 이전/새 제공자 평점 갱신"""
+    previous = getattr(instance, '_previous_provider_id', None)
+    if not created and previous != instance.provider_id:
+        ratings.refresh_service_provider(instance.pk, previous, instance.provider_id)
+    instance._previous_provider_id = None
+
+
+@receiver(pre_save, sender=Reservation)
+def remember_reservation_day_slots(sender, instance, update_fields=None, **kwargs):
+    """
+    저장 후 점유 현황을 갱신할 (제공자, 날짜) 목록과 평점을 다시 계산할 이전 (서비스, 제공자)를
+    변경 전 값과 비교해 기록
+    """
+    current = (instance.provider_id, instance.date)
+    instance._rating_targets = None
+    if instance._state.adding or instance.pk is None:
+        instance._day_slot_keys = {current}
+        return
+    if update_fields is not None and not (DAY_SLOT_FIELDS | RATING_FIELDS).intersection(update_fields):
+        instance._day_slot_keys = set()
+        return
+
+    previous = Reservation.objects.filter(pk=instance.pk).values_list(
+        'provider_id', 'date', 'time', 'status', 'service_id', 'service__provider_id'
+    ).first()
+    if previous is None:
+        instance._day_slot_keys = {current}
+        return
+    provider_id, previous_date, previous_time, previous_status, service_id, service_provider_id = previous
+    if (provider_id, previous_date, previous_time, previous_status) == (
+        instance.provider_id, instance.date, instance.time, instance.status
+    ):
+        instance._day_slot_keys = set()
+    else:
+        instance._day_slot_keys = {current, (provider_id, previous_date)}
+    if (service_id, provider_id) != (instance.service_id, instance.provider_id):
+        instance._rating_targets = (service_id, provider_id if provider_id is not None else service_provider_id)
+
+
+@receiver(post_save, sender=Reservation)
+def refresh_reservation_day_slots(sender, instance, **kwargs):
+    """예약 생성/변경 시 제공자 일별 점유 현황 갱신 (서비스/제공자가 바뀌면 평점도 갱신)"""
+    keys = getattr(instance, '_day_slot_keys', {(instance.provider_id, instance.date)})
+    for provider_id, target_date in keys:
+        day_slots.refresh(provider_id, target_date)
+    instance._day_slot_keys = set()
+
+    rating_targets = getattr(instance, '_rating_targets', None)
+    if rating_targets is not None:
+        ratings.refresh_reassigned(instance.pk, *rating_targets)
+        instance._rating_targets = None
+
+
+@receiver(post_delete, sender=Reservation)
+def refresh_deleted_reservation_day_slots(sender, instance, origin=None, **kwargs):
+    """예약 삭제 시 제공자 일별 점유 현황 갱신 (제공자 삭제로 함께 지워지는 경우 제외)"""
+    if isinstance(origin, ServiceProvider) or getattr(origin, 'model', None) is ServiceProvider:
+        return
+    day_slots.refresh(instance.provider_id, instance.date)
+
+
+@receiver([post_save, post_delete], sender=Review)
+def refresh_review_ratings(sender, instance, **kwargs):
+    """리뷰 작성/수정/삭제 시 서비스와 제공자 평점 갱신"""
+    ratings.refresh_for_reservation(instance.reservation_id)
@@ -1,3 +1,1515 @@
-from django.test import TestCase
+import asyncio
+import csv
+import gzip
+import json
+import os
+import queue
+import tempfile
+import threading
+from datetime import time, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from random import Random
+from unittest import mock, skipIf
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, connections
+from django.test import AsyncClient, Client, TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer as DRFJSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from . import catalog, day_slots, events, middleware, ratings, renderers, tokens
+from .db import set_journal_mode
+from .availability import DaySlots, bookable_slot_count, load_day, load_range
+from .business_calendar import business_calendar, provider_calendar, subtract_intervals
+from .fast_serializers import plan_for
+from .management.commands.benchmark_api import Command as ApiBenchmark
+from .management.commands.explain_queries import FULL_SCAN_PATTERNS, INDEX_PATTERNS
+from .management.commands.import_reservations import Command as ImportReservations
+from .management.commands.serve import default_workers, local_caches
+from .models import (
+    Service, Reservation, Review, Category, ServiceProvider, Notice, BusinessHours, BusinessHoursException,
+    ProviderSchedule, ProviderBreak, ProviderDaySlots, RevokedToken,
+)
+from .serializers import ReservationSerializer, ServiceProviderReservationSerializer, ServiceSerializer
+
+
+class QueryCountTestCase(TestCase):
+    """목록 API의 쿼리 수가 행 수와 무관하게 일정한지 확인"""
+
+    def setUp(self):
+        catalog.clear()
+        self.staff = User.objects.create_user('staff', password='password123', is_staff=True)
+        self.user = User.objects.create_user('customer', password='password123')
+        self.category = Category.objects.create(name='기초 레슨')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='공통 레슨', description='설명', price=50000, duration=60,
+            category=self.category, provider=self.provider,
+        )
+        self.date = timezone.localdate() + timedelta(days=1)
+        self.created = 0
+
+    def add_rows(self, count):
+        """서비스/예약/리뷰를 count개씩 추가"""
+        for _ in range(count):
+            self.created += 1
+            service = Service.objects.create(
+                name=f'레슨 {self.created}', description='설명', price=50000, duration=60,
+                category=self.category, provider=self.provider, is_featured=True, stock_quantity=5,
+            )
+            # 새 서비스와 공통 서비스(self.service) 양쪽에 예약/리뷰 추가
+            for reserved_service, status in [
+                (service, 'pending'), (service, 'completed'), (self.service, 'completed'),
+            ]:
+                reservation = Reservation.objects.create(
+                    user=self.user, service=reserved_service, provider=self.provider,
+                    date=self.date + timedelta(days=self.created), time=time(10), status=status,
+                )
+                if status == 'completed':
+                    Review.objects.create(reservation=reservation, rating=5, comment='좋아요')
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(context.captured_queries)
+
+    def assertConstantQueries(self, url_func):
+        """행을 늘려도 쿼리 수가 그대로인지 확인"""
+        self.add_rows(1)
+        baseline = self.count_queries(url_func())
+        self.add_rows(5)
+        self.assertEqual(self.count_queries(url_func()), baseline, url_func())
+
+    def login_provider(self):
+        session = self.client.session
+        session['provider_id'] = self.provider.id
+        session.save()
+
+    def test_reservations(self):
+        self.client.force_login(self.user)
+        self.assertConstantQueries(lambda: '/api/reservations/')
+        self.assertConstantQueries(lambda: '/api/reservations/history/')
+        self.assertConstantQueries(lambda: '/api/reservations/upcoming/')
+        self.assertConstantQueries(lambda: '/api/reservations/?expand=user,service.provider,provider,review.user')
+
+    def test_staff_reservations(self):
+        self.client.force_login(self.staff)
+        self.assertConstantQueries(lambda: '/api/reservations/')
+
+    def test_provider_reservations(self):
+        self.login_provider()
+        self.assertConstantQueries(lambda: '/api/provider-reservations/')
+        self.assertConstantQueries(lambda: '/api/provider-reservations/?expand=user,service.category')
+
+    def test_services(self):
+        self.assertConstantQueries(lambda: '/api/services/')
+        self.assertConstantQueries(lambda: '/api/services/featured/')
+        self.assertConstantQueries(lambda: f'/api/services/by_category/?category_id={self.category.id}')
+
+    def test_reviews(self):
+        self.client.force_login(self.user)
+        self.assertConstantQueries(lambda: '/api/reviews/')
+        self.assertConstantQueries(
+            lambda: f'/api/reviews/service_reviews/?service_id={self.service.id}'
+        )
+
+
+class CursorPaginationTestCase(TestCase):
+    """예약 목록 커서 페이지의 경계와 페이지 간 순서 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('customer', password='password123')
+        provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        service = Service.objects.create(name='레슨', description='설명', price=50000, duration=60, provider=provider)
+        today = timezone.localdate()
+        # 같은 날짜에 여러 건, 같은 날짜/시간에 취소된 예약을 섞어 정렬 첫 필드(date)가 겹치도록 구성
+        for offset in range(4):
+            for hour in (9, 10, 11):
+                for status in ('cancelled', 'pending'):
+                    Reservation.objects.create(
+                        user=self.user, service=service, provider=provider,
+                        date=today + timedelta(days=offset), time=time(hour), status=status,
+                    )
+        self.client.force_login(self.user)
+
+    def walk(self, url):
+        """next 링크를 따라 모든 페이지의 예약 ID와 페이지 크기 목록"""
+        ids, sizes = [], []
+        while url:
+            data = self.client.get(url).json()
+            sizes.append(len(data['results']))
+            ids.extend(row['id'] for row in data['results'])
+            url = data['next']
+        return ids, sizes
+
+    def test_pages_cover_all_rows_in_order(self):
+        expected = list(Reservation.objects.order_by('-date', '-time', '-id').values_list('id', flat=True))
+        for page_size in (1, 5, 6, 7, 24, 25):
+            ids, sizes = self.walk(f'/api/reservations/history/?page_size={page_size}')
+            self.assertEqual(ids, expected, page_size)
+            self.assertTrue(all(size == page_size for size in sizes[:-1]), page_size)
+            self.assertEqual(len(sizes), -(-len(expected) // page_size), page_size)
+
+        upcoming = list(
+            Reservation.objects.filter(status='pending').order_by('date', 'time', 'id').values_list('id', flat=True)
+        )
+        self.assertEqual(self.walk('/api/reservations/upcoming/?page_size=5')[0], upcoming)
+
+    def test_previous_page_and_limits(self):
+        first = self.client.get('/api/reservations/history/?page_size=5').json()
+        self.assertIsNone(first['previous'])
+        second = self.client.get(first['next']).json()
+        previous = self.client.get(second['previous']).json()
+        self.assertEqual([row['id'] for row in previous['results']], [row['id'] for row in first['results']])
+
+        # 이미 받은 페이지의 예약이 수정되어도 다음 페이지는 그대로
+        Reservation.objects.filter(id=first['results'][0]['id']).update(notes='수정')
+        again = self.client.get(first['next']).json()
+        self.assertEqual([row['id'] for row in again['results']], [row['id'] for row in second['results']])
+
+        self.assertEqual(len(self.client.get('/api/reservations/history/').json()['results']), 24)
+        response = self.client.get('/api/reservations/history/?page_size=1000')
+        self.assertEqual(len(response.json()['results']), 24)
+
+    def test_page_size_settings(self):
+        rest_framework = {**settings.REST_FRAMEWORK, 'PAGE_SIZE': 4, 'MAX_PAGE_SIZE': 10}
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            self.assertEqual(len(self.client.get('/api/reservations/history/').json()['results']), 4)
+            response = self.client.get('/api/reservations/history/?page_size=1000')
+            self.assertEqual(len(response.json()['results']), 10)
+
+
+class CatalogCacheTestCase(TestCase):
+    """공개 카탈로그 캐시 적중과 시그널 무효화 확인"""
+
+    def setUp(self):
+        catalog.clear()
+        catalog.stats.reset()
+        self.category = Category.objects.create(name='기초 레슨')
+        Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, category=self.category,
+        )
+        Notice.objects.create(title='공지', content='내용')
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response, len(context.captured_queries)
+
+    def test_hit_without_queries(self):
+        for url in ['/api/services/', '/api/notices/', '/api/business-hours/', '/api/providers/active/']:
+            miss, _ = self.get(url)
+            hit, queries = self.get(url)
+            self.assertEqual(hit['X-Cache'], 'HIT', url)
+            self.assertEqual(queries, 0, url)
+            self.assertEqual(hit.json(), miss.json(), url)
+        self.assertEqual(catalog.stats.snapshot()['services'], {'hits': 1, 'misses': 1})
+
+    def test_invalidated_by_related_save(self):
+        self.get('/api/services/?expand=category')
+        self.category.name = '심화 레슨'
+        self.category.save()
+        response, _ = self.get('/api/services/?expand=category')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()[0]['category']['name'], '심화 레슨')
+
+    def test_not_modified_from_cache(self):
+        response, _ = self.get('/api/notices/')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/notices/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(context.captured_queries), 0)
+
+
+class DynamicFieldsTestCase(TestCase):
+    """?fields= / ?expand= 응답 모양 확인"""
+
+    def setUp(self):
+        catalog.clear()
+        self.user = User.objects.create_user('customer', password='password123', first_name='홍길동')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        self.reservation = Reservation.objects.create(
+            user=self.user, service=self.service, provider=self.provider,
+            date=timezone.localdate() + timedelta(days=1), time=time(10),
+        )
+        self.client.force_login(self.user)
+
+    def test_ids_by_default(self):
+        reservation = self.client.get('/api/reservations/').json()['results'][0]
+        self.assertEqual(
+            (reservation['user'], reservation['service'], reservation['provider'], reservation['review']),
+            (self.user.id, self.service.id, self.provider.id, None),
+        )
+
+    def test_expand_and_fields(self):
+        reservation = self.client.get(
+            '/api/reservations/?expand=user&fields=id,user.full_name,service.provider.name'
+        ).json()['results'][0]
+        self.assertEqual(reservation, {
+            'id': self.reservation.id,
+            'user': {'full_name': '홍길동'},
+            'service': {'provider': {'name': '김태호'}},
+        })
+
+        # 카탈로그 캐시도 조합별로 따로 저장
+        self.assertEqual(self.client.get('/api/services/').json()[0]['provider'], self.provider.id)
+        service = self.client.get('/api/services/?expand=provider').json()[0]
+        self.assertEqual(service['provider']['name'], '김태호')
+
+
+class FastSerializerParityTestCase(TestCase):
+    """values() 기반 빠른 직렬화가 DRF 시리얼라이저와 같은 JSON을 만드는지 확인"""
+
+    def setUp(self):
+        user = User.objects.create_user('customer', password='password123', first_name='홍길동', email='a@b.c')
+        provider = ServiceProvider.objects.create(
+            name='김태호', username='kimtaeho', password='x', image='providers/kim.jpg',
+        )
+        category = Category.objects.create(name='골프')
+        with_provider = Service.objects.create(
+            name='레슨', description='설명', price='50000.50', duration=60, provider=provider,
+            category=category, image='services/lesson.jpg', stock_quantity=5,
+        )
+        without_provider = Service.objects.create(
+            name='연습장', description='설명', price=10000, duration=30, stock_quantity=0,
+        )
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        reviewed = Reservation.objects.create(
+            user=user, service=with_provider, provider=provider, date=tomorrow, time=time(10),
+            status='completed', notes='메모',
+        )
+        Review.objects.create(reservation=reviewed, rating=5, comment='좋아요')
+        Reservation.objects.create(user=user, service=without_provider, date=tomorrow, time=time(11, 30))
+
+    def assertParity(self, serializer_class, queryset, query=''):
+        request = APIRequestFactory().get('/api/' + query)
+        expected = serializer_class(queryset, many=True, context={'request': request}).data
+        plan = plan_for(serializer_class, request)
+        self.assertIsNotNone(plan)
+        actual = plan.serialize(plan.values(queryset), request)
+        self.assertEqual(DRFJSONRenderer().render(actual), DRFJSONRenderer().render(expected))
+
+    def test_parity(self):
+        reservations = Reservation.objects.order_by('id')
+        services = Service.objects.order_by('id')
+        for query in ('', '?expand=user,service,provider,review', '?fields=id,status_display,service.provider.name'):
+            with self.subTest(query=query):
+                self.assertParity(ReservationSerializer, reservations, query)
+                self.assertParity(ServiceProviderReservationSerializer, reservations, query.replace(',provider,review', ''))
+        for query in ('', '?expand=category,provider', '?fields=id,is_available,image,provider.image'):
+            with self.subTest(query=query):
+                self.assertParity(ServiceSerializer, services, query)
+
+
+class CompressionTestCase(TestCase):
+    """JSON 렌더러 출력과 응답 압축 확인"""
+
+    def setUp(self):
+        catalog.clear()
+        Notice.objects.create(title='공지', content='예약 변경은 하루 전까지 가능합니다. ' * 100)
+
+    def test_renderer_matches_drf(self):
+        data = {
+            'name': '레슨\u2028', 'price': Decimal('50000.50'), 1: [None, True, 1.5],
+            'created_at': timezone.now(), 'date': timezone.localdate(),
+        }
+        self.assertEqual(renderers.JSONRenderer().render(data), DRFJSONRenderer().render(data))
+        self.assertEqual(renderers.JSONParser().parse(BytesIO('{"a": ["가", 1]}'.encode())), {'a': ['가', 1]})
+
+    def test_compression(self):
+        plain = self.client.get('/api/notices/')
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        response = self.client.get('/api/notices/', HTTP_ACCEPT_ENCODING='gzip, deflate, br;q=0')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertLess(len(response.content), len(plain.content))
+
+        # 압축으로 약해진 ETag로도 재검증
+        response = self.client.get(
+            '/api/notices/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, 304)
+
+        # 기준 크기 미만은 압축하지 않음
+        response = self.client.get('/api/business-hours/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    @skipIf(middleware.brotli is None, 'brotli 미설치')
+    def test_brotli(self):
+        response = self.client.get('/api/notices/', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(middleware.brotli.decompress(response.content), self.client.get('/api/notices/').content)
+
+
+class ServeCommandTestCase(TestCase):
+    """serve 명령이 워커 간에 공유되지 않는 캐시로 여러 워커를 실행하지 않는지 확인"""
+
+    def shared_caches(self):
+        return {
+            alias: {**config, 'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache'}
+            for alias, config in settings.CACHES.items()
+        }
+
+    def test_local_memory_cache_runs_single_worker(self):
+        self.assertEqual(local_caches(), ['default', 'sessions'])
+        self.assertEqual(default_workers(), 1)
+        with self.assertRaisesMessage(CommandError, '로컬 메모리 캐시(default, sessions)'):
+            with override_settings(SECRET_KEY='serve-test-secret'):
+                call_command('serve', '--server', 'gunicorn', '--workers', '3', '--no-collectstatic', stderr=StringIO())
+        # 캐시를 쓰지 않는 세션 저장소면 카탈로그 캐시만 확인
+        with override_settings(SESSION_ENGINE=settings.SESSION_BACKENDS['signed_cookies']):
+            self.assertEqual(local_caches(), ['default'])
+
+    def test_refuses_development_secret_key(self):
+        with self.assertRaisesMessage(CommandError, '개발용 SECRET_KEY'):
+            with override_settings(SECRET_KEY=settings.INSECURE_SECRET_KEY, CACHES=self.shared_caches()):
+                call_command('serve', '--workers', '1', '--no-collectstatic', stderr=StringIO())
+
+    def test_shared_cache_uses_multiple_workers(self):
+        with override_settings(CACHES=self.shared_caches()):
+            self.assertEqual(local_caches(), [])
+            self.assertGreater(default_workers(), 1)
+
+
+@skipIf(connection.vendor != 'sqlite', 'SQLite 전용')
+class SQLitePragmaTestCase(TestCase):
+    """SQLite 연결 PRAGMA와 serve 시작 시 WAL 전환 확인"""
+
+    def pragma(self, wrapper, name):
+        with wrapper.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_connection_pragmas(self):
+        self.assertEqual(self.pragma(connection, 'temp_store'), 2)  # MEMORY
+        self.assertEqual(self.pragma(connection, 'cache_size'), settings.SQLITE_PRAGMAS['cache_size'])
+
+    def test_journal_mode_only_from_serve(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'pragma.sqlite3')
+        wrapper = type(connections['default'])({**connection.settings_dict, 'NAME': path}, alias='pragma_test')
+        try:
+            # 일반 연결은 DB 파일의 저널 모드를 바꾸지 않음
+            self.assertEqual(self.pragma(wrapper, 'journal_mode'), 'delete')
+            self.assertEqual(self.pragma(wrapper, 'synchronous'), 2)  # FULL
+            self.assertFalse(os.path.exists(path + '-wal'))
+
+            self.assertEqual(set_journal_mode(wrapper), 'wal')
+            wrapper.close()
+            # WAL로 전환된 파일은 다시 연결해도 유지되고 synchronous=NORMAL 적용
+            self.assertEqual(self.pragma(wrapper, 'journal_mode'), 'wal')
+            self.assertEqual(self.pragma(wrapper, 'synchronous'), 1)  # NORMAL
+            self.assertEqual(self.pragma(wrapper, 'temp_store'), 2)
+        finally:
+            wrapper.close()
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            os.rmdir(directory)
+
+
+class SessionBackendTestCase(TestCase):
+    """세션 저장소별 제공자 로그인과 요청당 세션 조회 확인"""
+
+    def setUp(self):
+        self.provider = ServiceProvider.objects.create(
+            name='김태호', username='kimtaeho', password=make_password('password123'),
+        )
+        service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        Reservation.objects.create(
+            user=User.objects.create_user('customer'), service=service, provider=self.provider,
+            date=timezone.localdate() + timedelta(days=1), time=time(10),
+        )
+
+    def test_provider_login_without_session_queries(self):
+        for backend in ('cached_db', 'signed_cookies'):
+            with self.subTest(backend=backend), override_settings(SESSION_ENGINE=settings.SESSION_BACKENDS[backend]):
+                caches[settings.SESSION_CACHE_ALIAS].clear()
+                client = Client()
+                response = client.post(
+                    '/api/provider/login/', {'username': 'kimtaeho', 'password': 'password123'},
+                    content_type='application/json',
+                )
+                self.assertEqual(response.status_code, 200)
+                with CaptureQueriesContext(connection) as context:
+                    response = client.get('/api/provider-reservations/')
+                self.assertEqual(len(response.json()['results']), 1)
+                self.assertFalse(any('django_session' in query['sql'] for query in context.captured_queries))
+
+                client.post('/api/provider/logout/')
+                self.assertEqual(client.get('/api/provider-reservations/').json()['results'], [])
+
+
+class TokenAuthTestCase(TestCase):
+    """접근 토큰 인증 (사용자/제공자), 갱신, 폐기와 요청당 인증 쿼리 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(
+            name='김태호', username='kimtaeho', password=make_password('password123'),
+        )
+        service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        Reservation.objects.create(
+            user=self.user, service=service, provider=self.provider,
+            date=timezone.localdate() + timedelta(days=1), time=time(10),
+        )
+
+    def obtain(self, url, username):
+        response = self.client.post(
+            url, {'username': username, 'password': 'password123'}, content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def get(self, url, access):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_AUTHORIZATION=f'Bearer {access}')
+        auth_queries = [
+            query['sql'] for query in context.captured_queries
+            if 'django_session' in query['sql'] or 'FROM "auth_user"' in query['sql']
+            or 'FROM "booking_serviceprovider"' in query['sql']
+        ]
+        self.assertEqual(auth_queries, [])
+        return response
+
+    def test_user_and_provider_tokens(self):
+        pair = self.obtain('/api/token/', 'customer')
+        self.assertEqual(len(self.get('/api/reservations/', pair['access']).json()['results']), 1)
+
+        provider_pair = self.obtain('/api/provider/token/', 'kimtaeho')
+        self.assertEqual(len(self.get('/api/provider-reservations/', provider_pair['access']).json()['results']), 1)
+        # 사용자 토큰으로는 제공자 예약을 볼 수 없음
+        self.assertEqual(self.get('/api/provider-reservations/', pair['access']).json()['results'], [])
+
+    def test_refresh_and_revoke(self):
+        pair = self.obtain('/api/token/', 'customer')
+        response = self.client.post('/api/token/refresh/', {'refresh': pair['refresh']}, content_type='application/json')
+        access = response.json()['access']
+        self.assertEqual(self.get('/api/reservations/', access).status_code, 200)
+
+        response = self.client.post(
+            '/api/token/revoke/', {'refresh': pair['refresh']}, content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {access}',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get('/api/reservations/', access).status_code, 401)
+        response = self.client.post('/api/token/refresh/', {'refresh': pair['refresh']}, content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+
+        # 비밀번호를 바꾸면 이전 갱신 토큰은 사용할 수 없음
+        pair = self.obtain('/api/token/', 'customer')
+        self.user.set_password('changed-password')
+        self.user.save()
+        response = self.client.post('/api/token/refresh/', {'refresh': pair['refresh']}, content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_revocation_survives_cache_loss(self):
+        access = self.obtain('/api/token/', 'customer')['access']
+        token = tokens.verify(access)
+        RevokedToken.objects.create(jti='expired', expires_at=timezone.now() - timedelta(seconds=1))
+        response = self.client.post('/api/token/revoke/', HTTP_AUTHORIZATION=f'Bearer {access}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(RevokedToken.objects.values_list('jti', flat=True)), [token.jti])
+
+        # 캐시를 공유하지 않는 다른 프로세스나 재시작 후에도 DB의 폐기 목록을 읽음
+        catalog.get_cache().clear()
+        self.assertTrue(tokens.RevocationList().is_revoked(token.jti))
+        self.assertEqual(self.get('/api/reservations/', access).status_code, 401)
+
+    def test_expired_and_tampered(self):
+        with override_settings(ACCESS_TOKEN_LIFETIME=-1):
+            expired = self.obtain('/api/token/', 'customer')['access']
+        self.assertEqual(self.get('/api/reservations/', expired).status_code, 401)
+        access = self.obtain('/api/token/', 'customer')['access']
+        self.assertEqual(self.get('/api/reservations/', access[:-2] + 'xx').status_code, 401)
+
+
+def reference_available_times(open_time, close_time, duration, booked, intervals=None):
+    """기존(비트맵 이전) 30분 단위 반복 계산에 근무 구간 검사를 더한 기준 구현"""
+    def minutes(value):
+        return value.hour * 60 + value.minute
+
+    open_minutes, close_minutes = minutes(open_time), minutes(close_time)
+    booked = {minutes(value) for value in booked}
+
+    def working(start):
+        if intervals is None:
+            return True
+        end = min(start + 30, close_minutes)
+        return any(low <= start and end <= high for low, high in intervals)
+
+    times = []
+    current = open_minutes
+    while current < close_minutes:
+        service_end = current + duration
+        if service_end <= close_minutes:
+            check = current
+            while check < service_end and check not in booked and working(check):
+                check += 30
+            if check >= service_end:
+                times.append('%02d:%02d' % divmod(current, 60))
+        current += 30
+    return times
+
+
+class BenchmarkApiTestCase(TestCase):
+    """benchmark_api 명령의 데이터 생성, 측정, 기준 비교 확인 (작은 데이터셋)"""
+
+    def setUp(self):
+        catalog.clear()
+        self.command = ApiBenchmark(stdout=StringIO(), stderr=StringIO())
+
+    def test_seed_and_measure(self):
+        dataset = self.command.seed({'users': 20, 'reservations': 200, 'months': 1})
+        self.assertEqual(dataset['user_count'], User.objects.count())
+        self.assertEqual(dataset['reservation_count'], 200)
+        self.assertGreater(dataset['review_count'], 0)
+        # bulk_create 이후 점유 현황과 평점 집계를 다시 계산
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+        results = self.command.run_benchmarks(dataset, 3)
+        self.assertEqual(set(results), {
+            'services', 'available_times', 'reservations_history', 'reservations_history_expanded',
+            'provider_reservations', 'provider_reservations_expanded', 'service_reviews', 'reservation_create',
+        })
+        for name, result in results.items():
+            self.assertIn(result['status'], (200, 201), name)
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'], name)
+        self.assertEqual(results['reservation_create']['status'], 201)
+
+    def test_compare_with_baseline(self):
+        options = {'max_query_increase': 1, 'max_latency_regression': 0.5}
+        baseline = {'endpoints': {'services': {'queries': 2, 'p95_ms': 10.0}}}
+        within = {'endpoints': {'services': {'queries': 3, 'p95_ms': 15.0}, 'new': {'queries': 9, 'p95_ms': 1.0}}}
+        self.assertEqual(self.command.compare(baseline, within, options), [])
+
+        slower = {'endpoints': {'services': {'queries': 4, 'p95_ms': 15.1}}}
+        regressions = self.command.compare(baseline, slower, options)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(all(line.startswith('services:') for line in regressions))
+
+
+class ExplainQueriesTestCase(TestCase):
+    """예약 조회 핫 쿼리가 복합 인덱스를 사용하는지 확인 (explain_queries)"""
+
+    def setUp(self):
+        user = User.objects.create_user('customer', password='password123')
+        provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        service = Service.objects.create(name='레슨', description='설명', price=50000, duration=60, provider=provider)
+        Reservation.objects.create(
+            user=user, service=service, provider=provider, date=timezone.localdate(), time=time(10),
+        )
+
+    def test_all_hot_queries_use_indexes(self):
+        out = StringIO()
+        call_command('explain_queries', '--strict', '--verbose-plans', stdout=out)
+        output = out.getvalue()
+        self.assertNotIn('[SCAN]', output)
+        for index in ['reservation_provider_date_idx', 'reservation_service_date_idx', 'reservation_user_date_idx']:
+            self.assertIn(index, output)
+        self.assertIn('총 11개 쿼리 중 11개가 인덱스를 사용합니다.', output)
+
+    def test_plan_patterns(self):
+        def classify(plan):
+            indexes = {match for pattern in INDEX_PATTERNS for match in pattern.findall(plan)}
+            return sorted(indexes), any(pattern.search(plan) for pattern in FULL_SCAN_PATTERNS)
+
+        self.assertEqual(
+            classify('SEARCH booking_reservation USING INDEX reservation_user_date_idx (user_id=?)'),
+            (['reservation_user_date_idx'], False),
+        )
+        self.assertEqual(
+            classify('SCAN booking_reservation USING COVERING INDEX reservation_date_status_idx'),
+            (['reservation_date_status_idx'], False),
+        )
+        self.assertEqual(classify('SCAN booking_reservation'), ([], True))
+        self.assertEqual(classify('Seq Scan on booking_reservation  (cost=0.00..1.00)'), ([], True))
+        self.assertEqual(
+            classify('Index Scan Backward using reservation_provider_date_idx on booking_reservation'),
+            (['reservation_provider_date_idx'], False),
+        )
+
+
+class SlotEngineTestCase(TestCase):
+    """비트맵 예약 가능 시간 계산이 기존 반복 계산과 같은 결과인지 확인"""
+
+    def assertParity(self, open_time, close_time, duration, booked=(), intervals=None):
+        day = DaySlots(open_time, close_time).restrict(intervals).occupy_all(booked)
+        self.assertEqual(
+            day.available_times(duration),
+            reference_available_times(open_time, close_time, duration, booked, intervals),
+            (open_time, close_time, duration, booked, intervals),
+        )
+
+    def test_parity_with_reference(self):
+        rng = Random(7)
+        slots = [time(hour, minute) for hour in range(7, 20) for minute in (0, 30)]
+        for _ in range(300):
+            open_time, close_time = sorted(rng.sample(slots, 2))
+            # 마감 시간이 슬롯 경계가 아닌 경우 포함
+            if rng.random() < 0.3:
+                close_time = time(close_time.hour, close_time.minute + 15)
+            intervals = None
+            if rng.random() < 0.5:
+                # 근무시간에서 휴게시간을 뺀 구간 (분 단위)
+                start, end = sorted(rng.sample(range(7 * 60, 20 * 60, 30), 2))
+                intervals = subtract_intervals([(start, end)], [(start + 60, start + 90)])
+            self.assertParity(
+                open_time, close_time, rng.choice([30, 45, 60, 90, 120]),
+                rng.sample(slots, rng.randrange(6)), intervals,
+            )
+
+    def test_edges(self):
+        # 서비스가 마감 시간에 정확히 끝나는 시작 시간은 허용, 넘치면 제외
+        self.assertEqual(DaySlots(time(9), time(11, 45)).available_times(30)[-1], '11:00')
+        self.assertEqual(DaySlots(time(9), time(12)).available_times(60)[-1], '11:00')
+        # 소요시간이 예약 슬롯과 겹치면 그 앞 시작 시간도 제외
+        self.assertEqual(
+            DaySlots(time(9), time(12)).occupy_all([time(10, 30)]).available_times(90), ['09:00']
+        )
+        self.assertEqual(DaySlots(time(9), time(10)).available_times(120), [])
+        self.assertParity(time(9), time(12), 90, [time(10, 30)])
+
+    def test_load_day_with_breaks_and_exceptions(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(9), close_time=time(18))
+        provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        target = timezone.localdate() + timedelta(days=2)
+        ProviderSchedule.objects.create(provider=provider, day=target.weekday(), start_time=time(9), end_time=time(15))
+        ProviderBreak.objects.create(provider=provider, day=target.weekday(), start_time=time(12), end_time=time(13))
+        BusinessHoursException.objects.create(date=target, is_closed=False, open_time=time(10), close_time=time(14))
+        user = User.objects.create_user('customer')
+        service = Service.objects.create(name='레슨', description='설명', price=1, duration=60, provider=provider)
+        Reservation.objects.create(user=user, service=service, provider=provider, date=target, time=time(10, 30))
+
+        self.assertEqual(
+            load_day(target, provider_id=provider.id).available_times(60),
+            reference_available_times(
+                time(10), time(14), 60, [time(10, 30)], [(540, 720), (780, 900)]
+            ),
+        )
+        BusinessHoursException.objects.create(date=target + timedelta(days=1), reason='휴무')
+        self.assertIsNone(load_day(target + timedelta(days=1), provider_id=provider.id))
+
+
+class AvailabilityRangeTestCase(TestCase):
+    """기간별 예약 가능 시간 조회의 입력 검증, 휴무일, 예외 날짜 확인"""
+
+    def setUp(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(9), close_time=time(11), is_closed=day == 6)
+        provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=provider, max_advance_booking=10,
+        )
+        self.today = timezone.localdate()
+        self.url = f'/api/services/{self.service.id}/available_times_range/'
+        provider_calendar.invalidate()
+
+    def get(self, query):
+        return self.client.get(self.url + query)
+
+    def test_invalid_and_oversized_ranges(self):
+        self.assertEqual(self.get('?start=2024-13-01').status_code, 400)
+        self.assertEqual(self.get('?start=tomorrow').status_code, 400)
+        end = self.today + timedelta(days=3)
+        self.assertEqual(self.get(f'?start={end}&end={self.today}').status_code, 400)
+        # 지난 기간은 빈 맵, 최대 예약 가능 일수를 넘는 기간은 잘라서 응답
+        past = self.today - timedelta(days=30)
+        self.assertEqual(self.get(f'?start={past}&end={past + timedelta(days=3)}').json(), {})
+        data = self.get(f'?start={past}&end={self.today + timedelta(days=365)}').json()
+        self.assertEqual(min(data), str(self.today))
+        self.assertEqual(max(data), str(self.today + timedelta(days=10)))
+        self.assertEqual(len(data), 11)
+
+    def test_closed_days_and_exceptions(self):
+        start = self.today + timedelta(days=1)
+        end = start + timedelta(days=6)
+        sunday = next(start + timedelta(days=offset) for offset in range(7) if (start + timedelta(days=offset)).weekday() == 6)
+        special = next(day for day in (start + timedelta(days=offset) for offset in range(7)) if day != sunday)
+        BusinessHoursException.objects.create(date=special, is_closed=False, open_time=time(14), close_time=time(16))
+
+        with CaptureQueriesContext(connection) as context:
+            data = self.get(f'?start={start}&end={end}').json()
+        self.assertEqual(len(data), 7)
+        self.assertEqual(data[str(sunday)], [])
+        self.assertEqual(data[str(special)], ['14:00', '14:30', '15:00'])
+        for target, times in data.items():
+            if target not in (str(sunday), str(special)):
+                self.assertEqual(times, ['09:00', '09:30', '10:00'], target)
+        # 날짜 수와 관계없이 점유 현황은 한 번의 쿼리로 조회
+        self.assertEqual(sum('booking_providerdayslots' in query['sql'] for query in context.captured_queries), 1)
+
+
+class AvailabilityETagTestCase(TestCase):
+    """예약 가능 시간 조회의 조건부 요청(If-None-Match) 확인"""
+
+    def setUp(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(9), close_time=time(12))
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        self.date = timezone.localdate() + timedelta(days=1)
+        provider_calendar.invalidate()
+
+    def test_not_modified_until_reservation_changes(self):
+        for action in ['available_times', 'check_time_updates']:
+            url = f'/api/services/{self.service.id}/{action}/?date={self.date}'
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200, action)
+            repeated = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+            self.assertEqual(repeated.status_code, 304, action)
+            self.assertEqual(repeated['ETag'], first['ETag'], action)
+            self.assertEqual(repeated.content, b'', action)
+
+            reservation = Reservation.objects.create(
+                user=self.user, service=self.service, provider=self.provider, date=self.date, time=time(10),
+            )
+            changed = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+            self.assertEqual(changed.status_code, 200, action)
+            self.assertNotEqual(changed['ETag'], first['ETag'], action)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=changed['ETag']).status_code, 304, action)
+
+            # 취소하면 점유가 풀려 처음 응답과 같은 ETag
+            reservation.status = 'cancelled'
+            reservation.save()
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=changed['ETag']).status_code, 200, action)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304, action)
+            reservation.delete()
+
+    def test_etag_depends_on_service_and_user(self):
+        url = f'/api/services/{self.service.id}/available_times/?date={self.date}'
+        etag = self.client.get(url)['ETag']
+        self.service.duration = 90
+        self.service.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        etag = self.client.get(url)['ETag']
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class BusinessCalendarTestCase(TestCase):
+    """영업 캘린더의 예외 날짜 처리와 무쿼리 조회 확인"""
+
+    def setUp(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(9), close_time=time(12), is_closed=day == 6)
+        self.date = timezone.localdate() + timedelta(days=1)
+        while self.date.weekday() == 6:
+            self.date += timedelta(days=1)
+
+    def test_weekly_and_exceptions(self):
+        business_calendar.hours_for(self.date)
+        with CaptureQueriesContext(connection) as context:
+            hours = business_calendar.hours_for(self.date)
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual((hours.open_time, hours.close_time), (time(9), time(12)))
+
+        BusinessHoursException.objects.create(date=self.date, reason='공휴일')
+        self.assertIsNone(business_calendar.hours_for(self.date))
+
+        BusinessHoursException.objects.filter(date=self.date).delete()
+        BusinessHoursException.objects.create(
+            date=self.date, is_closed=False, open_time=time(13), close_time=time(15)
+        )
+        hours = business_calendar.hours_for(self.date)
+        self.assertEqual((hours.open_time, hours.close_time), (time(13), time(15)))
+        self.assertIsNotNone(business_calendar.hours_for(self.date + timedelta(days=7)))
+
+    def test_range_reads_state_once(self):
+        end = self.date + timedelta(days=60)
+        with mock.patch.object(business_calendar, '_generation', wraps=business_calendar._generation) as generation:
+            days = load_range(self.date, end)
+            self.assertEqual(generation.call_count, 1)
+            bookable_slot_count(self.date, end)
+            self.assertEqual(generation.call_count, 2)
+        self.assertEqual(len(days), 61)
+        self.assertTrue(all((day is None) == (target.weekday() == 6) for target, day in days.items()))
+
+
+class ProviderScheduleTestCase(TestCase):
+    """제공자 근무시간/휴게시간이 예약 가능 시간에 반영되는지 확인"""
+
+    def setUp(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(7), close_time=time(19))
+        self.morning = ServiceProvider.objects.create(name='오전 프로', username='morning', password='x')
+        self.afternoon = ServiceProvider.objects.create(name='오후 프로', username='afternoon', password='x')
+        self.date = timezone.localdate() + timedelta(days=1)
+        weekday = self.date.weekday()
+        ProviderSchedule.objects.create(provider=self.morning, day=weekday, start_time=time(7), end_time=time(12))
+        ProviderBreak.objects.create(provider=self.morning, day=weekday, start_time=time(9), end_time=time(10))
+        ProviderSchedule.objects.create(provider=self.afternoon, day=weekday, start_time=time(13), end_time=time(19))
+        ProviderSchedule.objects.create(
+            provider=self.afternoon, day=(weekday + 1) % 7, start_time=time(7), end_time=time(19)
+        )
+
+    def available(self, provider):
+        service = Service.objects.create(
+            name=f'{provider.name} 레슨', description='설명', price=50000, duration=60, provider=provider,
+        )
+        response = self.client.get(f'/api/services/{service.id}/available_times/?date={self.date}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_working_hours_and_breaks(self):
+        self.assertEqual(self.available(self.morning), ['07:00', '07:30', '08:00', '10:00', '10:30', '11:00'])
+        self.assertEqual(self.available(self.afternoon)[0], '13:00')
+        self.assertEqual(self.available(self.afternoon)[-1], '18:00')
+
+    def test_day_off_and_unscheduled_provider(self):
+        ProviderSchedule.objects.filter(provider=self.afternoon, day=self.date.weekday()).delete()
+        self.assertEqual(self.available(self.afternoon), [])
+        free = ServiceProvider.objects.create(name='자유 프로', username='free', password='x')
+        self.assertIsNone(provider_calendar.working_intervals(free.id, self.date.weekday()))
+        self.assertEqual(len(self.available(free)), 23)
+
+    def test_schedule_edit_changes_availability(self):
+        provider_calendar.invalidate()
+        self.assertEqual(self.available(self.afternoon)[0], '13:00')
+        schedule = ProviderSchedule.objects.get(provider=self.afternoon, day=self.date.weekday())
+        schedule.start_time = time(15)
+        schedule.save()
+        self.assertEqual(self.available(self.afternoon)[0], '15:00')
+        ProviderBreak.objects.create(
+            provider=self.afternoon, day=self.date.weekday(), start_time=time(15), end_time=time(16)
+        )
+        self.assertEqual(self.available(self.afternoon)[0], '16:00')
+
+        # 시그널 없이 바뀐 근무시간(세대 번호를 공유하지 않는 다른 프로세스의 변경)은 최대 유지 시간 뒤 반영
+        ProviderSchedule.objects.filter(id=schedule.id).update(start_time=time(17))
+        self.assertEqual(self.available(self.afternoon)[0], '16:00')
+        with override_settings(CALENDAR_STATE_MAX_AGE=0):
+            self.assertEqual(self.available(self.afternoon)[0], '17:00')
+
+    def test_range_reads_schedule_once(self):
+        end = self.date + timedelta(days=30)
+        with mock.patch.object(provider_calendar, '_generation', wraps=provider_calendar._generation) as generation:
+            days = load_range(self.date, end, provider_id=self.morning.id)
+            bookable = bookable_slot_count(self.date, end, provider_id=self.morning.id)
+        self.assertEqual(generation.call_count, 2)
+        # 근무 요일(주 1회)에만 오전 근무시간 - 휴게시간의 슬롯이 남음
+        self.assertEqual(bookable, sum(
+            day.slot_count - bin(day.blocked).count('1') for day in days.values() if day is not None
+        ))
+        self.assertEqual(bookable, 8 * len([target for target in days if target.weekday() == self.date.weekday()]))
+
+
+class ReservationConflictTestCase(TestCase):
+    """같은 시간대 중복 예약이 DB 제약 조건으로 차단되어 409로 응답하는지 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('customer', password='password123')
+        self.other = User.objects.create_user('other', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        self.second_service = Service.objects.create(
+            name='심화 레슨', description='설명', price=70000, duration=60, provider=self.provider,
+        )
+        self.date = timezone.localdate() + timedelta(days=1)
+
+    def create(self, user, service=None, slot='10:00', **extra):
+        self.client.force_login(user)
+        return self.client.post('/api/reservations/', {
+            'service_id': (service or self.service).id, 'date': str(self.date), 'time': slot, **extra,
+        }, content_type='application/json')
+
+    def test_duplicate_create(self):
+        self.assertEqual(self.create(self.user).status_code, 201)
+        # 제공자를 지정하지 않으면 서비스의 담당 제공자로 예약
+        self.assertEqual(Reservation.objects.get().provider_id, self.provider.id)
+
+        response = self.create(self.user)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['error'], '이미 동일한 서비스에 대해 같은 날짜와 시간에 예약이 있습니다.')
+        self.assertEqual(self.create(self.other).status_code, 409)
+        # 같은 제공자의 다른 서비스도 같은 시간대에는 예약할 수 없음
+        response = self.create(self.other, self.second_service, provider_id=self.provider.id)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['error'], '해당 쌤의 시간에 이미 예약이 있습니다.')
+        self.assertEqual(self.create(self.other, slot='11:00').status_code, 201)
+        self.assertEqual(Reservation.objects.count(), 2)
+
+    def test_update_into_taken_slot(self):
+        self.create(self.user)
+        self.create(self.other, slot='11:00')
+        reservation = Reservation.objects.get(user=self.other)
+        url = f'/api/reservations/{reservation.id}/'
+
+        # 자기 자신의 시간대를 그대로 저장하는 수정은 허용
+        response = self.client.patch(url, {'notes': '메모', 'time': '11:00'}, content_type='application/json')
+        self.assertEqual(response.status_code, 200, response.content)
+
+        response = self.client.patch(url, {'time': '10:00'}, content_type='application/json')
+        self.assertEqual(response.status_code, 409)
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.time, time(11))
+
+    def test_revive_cancelled_into_taken_slot(self):
+        self.create(self.user)
+        first = Reservation.objects.get()
+        first.status = 'cancelled'
+        first.save()
+        self.assertEqual(self.create(self.other).status_code, 201)
+
+        session = self.client.session
+        session['provider_id'] = self.provider.id
+        session.save()
+        url = f'/api/provider-reservations/{first.id}/update_status/'
+        response = self.client.post(url, {'status': 'confirmed'}, content_type='application/json')
+        self.assertEqual(response.status_code, 409)
+        first.refresh_from_db()
+        self.assertEqual(first.status, 'cancelled')
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+    def test_confirm_cancelled_into_taken_slot(self):
+        self.create(self.user)
+        first = Reservation.objects.get()
+        first.status = 'cancelled'
+        first.save()
+        self.assertEqual(self.create(self.other).status_code, 201)
+
+        self.client.force_login(User.objects.create_user('staff', is_staff=True))
+        response = self.client.post(f'/api/reservations/{first.id}/confirm/')
+        self.assertEqual(response.status_code, 409)
+        first.refresh_from_db()
+        self.assertEqual(first.status, 'cancelled')
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+
+class ProviderDaySlotsTestCase(TestCase):
+    """예약 변경 시 제공자 일별 점유 현황이 갱신되는지 확인"""
+
+    def setUp(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(9), close_time=time(12))
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider, stock_quantity=5,
+        )
+        self.date = timezone.localdate() + timedelta(days=1)
+
+    def occupied(self, target_date=None):
+        row = ProviderDaySlots.objects.filter(provider=self.provider, date=target_date or self.date).first()
+        return row.occupied if row else []
+
+    def test_incremental_updates(self):
+        self.client.force_login(self.user)
+        response = self.client.post('/api/reservations/', {
+            'service_id': self.service.id, 'provider_id': self.provider.id, 'date': str(self.date), 'time': '10:00',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(self.occupied(), [600])
+
+        reservation = Reservation.objects.get()
+        self.client.logout()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(f'/api/services/{self.service.id}/available_times/?date={self.date}')
+        self.assertEqual(response.json(), ['09:00', '10:30', '11:00'])
+        self.assertEqual(
+            sum('booking_reservation' in query['sql'] for query in context.captured_queries), 0
+        )
+
+        # 날짜 변경은 이전 날짜와 새 날짜 모두 갱신
+        reservation.date = self.date + timedelta(days=1)
+        reservation.save()
+        self.assertEqual(self.occupied(), [])
+        self.assertEqual(self.occupied(reservation.date), [600])
+
+        reservation.status = 'cancelled'
+        reservation.save()
+        self.assertEqual(self.occupied(reservation.date), [])
+
+        reservation.delete()
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+    def test_rebuild_and_check(self):
+        Reservation.objects.bulk_create([
+            Reservation(user=self.user, service=self.service, provider=self.provider, date=self.date, time=time(9)),
+        ])
+        self.assertEqual(len(day_slots.find_mismatches()), 1)
+        self.assertEqual(day_slots.rebuild(), {'created': 1, 'updated': 0})
+        self.assertEqual(self.occupied(), [540])
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+
+class SlotEventStream:
+    """별도 스레드의 이벤트 루프에서 실행하는 /api/events/slots/ 구독 (ASGI 수준)"""
+
+    def __init__(self, query=''):
+        self.messages = queue.Queue()
+        self.connected = threading.Event()
+        self.loop = asyncio.new_event_loop()
+        self.scope = {'type': 'http', 'method': 'GET', 'path': events.SLOT_EVENTS_PATH,
+                      'query_string': query.encode()}
+        self.thread = threading.Thread(target=self.loop.run_until_complete, args=(self.run(),))
+        self.thread.start()
+        self.connected.wait(5)
+
+    async def run(self):
+        self.disconnect = self.loop.create_future()
+
+        async def receive():
+            return await asyncio.shield(self.disconnect)
+
+        async def send(message):
+            if message.get('body', b'').startswith(b': connected'):
+                self.connected.set()
+            elif message.get('body'):
+                self.messages.put(message['body'].decode())
+
+        await events.SlotEventRouter(None)(self.scope, receive, send)
+
+    def next_event(self):
+        name, data = self.messages.get(timeout=5).strip().split('\n')
+        assert name == 'event: time_slot_update', name
+        return json.loads(data.split(': ', 1)[1])
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.disconnect.set_result, {'type': 'http.disconnect'})
+        self.thread.join(5)
+        self.loop.close()
+
+
+class SlotEventsTestCase(TestCase):
+    """예약 변경이 커밋된 뒤 이벤트 스트림 구독자에게 전달되는지 확인"""
+
+    def setUp(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(9), close_time=time(12))
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        self.date = timezone.localdate() + timedelta(days=1)
+        self.client.force_login(self.user)
+        self.stream = SlotEventStream()
+        self.addCleanup(self.stream.close)
+
+    def test_events_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post('/api/reservations/', {
+                'service_id': self.service.id, 'provider_id': self.provider.id,
+                'date': str(self.date), 'time': '10:00',
+            }, content_type='application/json')
+            self.assertEqual(response.status_code, 201, response.content)
+            # 커밋 전에는 발행하지 않음
+            self.assertTrue(self.stream.messages.empty())
+        self.assertEqual(len(callbacks), 1)
+        event = self.stream.next_event()
+        self.assertEqual(
+            (event['date'], event['provider_id'], event['status']), (str(self.date), self.provider.id, 'pending')
+        )
+        self.assertIsNotNone(timezone.datetime.fromisoformat(event['timestamp']).tzinfo)
+
+        # 날짜 변경은 이전 날짜와 새 날짜 모두 알림
+        reservation_id = Reservation.objects.get().id
+        new_date = self.date + timedelta(days=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                f'/api/reservations/{reservation_id}/', {'date': str(new_date), 'time': '10:00'},
+                content_type='application/json',
+            )
+            self.assertEqual(response.status_code, 200, response.content)
+        dates = {self.stream.next_event()['date'], self.stream.next_event()['date']}
+        self.assertEqual(dates, {str(self.date), str(new_date)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f'/api/reservations/{reservation_id}/')
+            self.assertEqual(response.status_code, 204)
+        self.assertFalse(Reservation.objects.exists())
+        self.assertEqual(self.stream.next_event()['date'], str(new_date))
+
+    def test_filtered_subscription(self):
+        other = SlotEventStream(f'date={self.date + timedelta(days=3)}')
+        self.addCleanup(other.close)
+        reservation = Reservation(user=self.user, service=self.service, provider=self.provider, date=self.date, time=time(9))
+        with self.captureOnCommitCallbacks(execute=True):
+            reservation.save()
+            events.publish_slot_change(reservation)
+        self.assertEqual(self.stream.next_event()['date'], str(self.date))
+        self.assertTrue(other.messages.empty())
+
+
+class UpdateReservationProvidersTestCase(TestCase):
+    """update_reservation_providers 명령의 배치 업데이트, 충돌 건너뛰기, 점유 현황 갱신 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        self.second_service = Service.objects.create(
+            name='심화 레슨', description='설명', price=70000, duration=60, provider=self.provider,
+        )
+        self.unassigned = Service.objects.create(name='자유 레슨', description='설명', price=30000, duration=60)
+        self.date = timezone.localdate() + timedelta(days=1)
+        # 제공자 정보가 없는 예전 예약 (bulk_create는 시그널을 보내지 않음)
+        Reservation.objects.bulk_create([
+            Reservation(user=self.user, service=self.service, date=self.date + timedelta(days=offset), time=time(10))
+            for offset in range(5)
+        ] + [
+            Reservation(user=self.user, service=self.unassigned, date=self.date, time=time(11)),
+            Reservation(user=self.user, service=self.service, date=self.date, time=time(9), status='completed'),
+        ])
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('update_reservation_providers', *args, stdout=out)
+        return out.getvalue()
+
+    def test_batched_backfill(self):
+        with self.assertRaises(CommandError):
+            self.run_command('--batch-size', '0')
+
+        output = self.run_command('--dry-run')
+        self.assertIn('업데이트 대상 예약: 6개', output)
+        self.assertEqual(Reservation.objects.filter(provider=None).count(), 7)
+
+        output = self.run_command('--batch-size', '2')
+        self.assertIn('총 6개의 예약이 업데이트되었습니다!', output)
+        self.assertEqual(output.count('처리 ('), 3)
+        self.assertEqual(
+            list(Reservation.objects.filter(provider=None).values_list('service_id', flat=True)), [self.unassigned.id]
+        )
+        self.assertEqual(ProviderDaySlots.objects.filter(provider=self.provider).count(), 5)
+        self.assertEqual(day_slots.find_mismatches(), [])
+        self.assertIn('총 0개의 예약이 업데이트되었습니다!', self.run_command())
+
+    def test_skips_conflicting_rows(self):
+        Reservation.objects.bulk_create([
+            Reservation(user=self.user, service=self.second_service, date=self.date, time=time(10)),
+        ])
+        output = self.run_command('--batch-size', '3')
+        conflicting = Reservation.objects.filter(provider=None, service=self.second_service).get()
+        self.assertIn(f'예약 #{conflicting.id}: 같은 제공자의 같은 시간에 활성 예약이 있어 건너뜀', output)
+        self.assertIn('건너뜀 1개', output)
+        self.assertEqual(Reservation.objects.filter(provider=self.provider).count(), 6)
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+
+class ImportReservationsTestCase(TestCase):
+    """import_reservations 명령의 배치 등록, 오류 처리, 점유 현황 일치 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        self.date = timezone.localdate() + timedelta(days=1)
+
+    def write(self, rows):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, directory)
+        path = os.path.join(directory, 'reservations.csv')
+        self.addCleanup(os.remove, path)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('user,service,date,time,status\n')
+            for row in rows:
+                f.write(','.join(row) + '\n')
+        return path
+
+    def row(self, days=0, slot='10:00', user='customer', status='pending'):
+        return [user, '레슨', str(self.date + timedelta(days=days)), slot, status]
+
+    def run_command(self, *args):
+        out, err = StringIO(), StringIO()
+        call_command('import_reservations', *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_strict_keeps_committed_batches_consistent(self):
+        path = self.write([self.row(), ['customer', '레슨', '2024-02-30', '10:00', 'pending']])
+        with self.assertRaisesMessage(CommandError, '2번째 행: 올바른 날짜 형식이 아닙니다.'):
+            self.run_command(path, '--batch-size', '1', '--strict')
+        # 첫 배치는 점유 현황과 함께 커밋됨
+        self.assertEqual(Reservation.objects.count(), 1)
+        self.assertEqual(ProviderDaySlots.objects.get(provider=self.provider, date=self.date).occupied, [600])
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+    def test_partial_failure(self):
+        path = self.write([
+            self.row(), self.row(user='nobody'), self.row(slot='10:00'), self.row(days=1, slot='11:00'),
+            self.row(days=2, status='cancelled'), self.row(days=1, slot='25:00'),
+        ])
+        out, err = self.run_command(path, '--batch-size', '2')
+        self.assertIn('6행 중 3건 등록, 3건 오류', out)
+        self.assertIn('2번째 행: 사용자를 찾을 수 없습니다: nobody', err)
+        self.assertIn('3번째 행: 같은 시간에 이미 활성 예약이 있습니다.', err)
+        self.assertIn('6번째 행: 올바른 시간 형식이 아닙니다.', err)
+        self.assertEqual(Reservation.objects.filter(provider=self.provider).count(), 3)
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+        out, _ = self.run_command(self.write([self.row(days=3)]), '--dry-run')
+        self.assertIn('[dry-run] 1행 중 1건 등록', out)
+        self.assertEqual(Reservation.objects.count(), 3)
+
+    def test_conflict_at_insert(self):
+        Reservation.objects.create(
+            user=self.user, service=self.service, provider=self.provider, date=self.date, time=time(10),
+        )
+        path = self.write([self.row(days=1), self.row(), self.row(days=2)])
+        # 중복 확인 이후 다른 요청이 같은 시간대를 예약한 경우 (DB 제약 조건이 차단)
+        with mock.patch.object(ImportReservations, 'taken_slots', return_value=set()):
+            out, err = self.run_command(path)
+        self.assertIn('3행 중 2건 등록, 1건 오류', out)
+        self.assertIn('2번째 행: 같은 시간에 이미 활성 예약이 있습니다.', err)
+        self.assertEqual(Reservation.objects.count(), 3)
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+        with mock.patch.object(ImportReservations, 'taken_slots', return_value=set()):
+            with self.assertRaises(CommandError):
+                self.run_command(self.write([self.row(days=5), self.row()]), '--strict')
+        # 실패한 배치는 통째로 롤백
+        self.assertEqual(Reservation.objects.count(), 3)
+        self.assertEqual(day_slots.find_mismatches(), [])
+
+
+    def test_refreshes_only_touched_slots(self):
+        other = ServiceProvider.objects.create(name='이수진', username='leesujin', password='x')
+        # 배치 날짜 범위 안에 있지만 등록과 무관한 행은 다시 계산하지 않음
+        ProviderDaySlots.objects.create(provider=other, date=self.date + timedelta(days=1), occupied=[540])
+        path = self.write([self.row(), self.row(days=2, slot='11:00'), self.row(days=2, slot='12:00')])
+        with mock.patch.object(day_slots, 'rebuild', side_effect=AssertionError):
+            out, _ = self.run_command(path)
+        self.assertIn('3행 중 3건 등록', out)
+        self.assertEqual(ProviderDaySlots.objects.get(provider=self.provider, date=self.date).occupied, [600])
+        self.assertEqual(
+            ProviderDaySlots.objects.get(provider=self.provider, date=self.date + timedelta(days=2)).occupied,
+            [660, 720],
+        )
+        self.assertEqual(ProviderDaySlots.objects.get(provider=other).occupied, [540])
+        self.assertEqual(ProviderDaySlots.objects.count(), 3)
+
+
+class ReservationExportTestCase(TestCase):
+    """예약 내보내기 형식, 필터, 스트리밍 응답 확인"""
+
+    def setUp(self):
+        self.staff = User.objects.create_user('staff', password='password123', is_staff=True)
+        self.user = User.objects.create_user('customer', password='password123', first_name='홍길동')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        other = ServiceProvider.objects.create(name='이수진', username='leesujin', password='x')
+        service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        other_service = Service.objects.create(
+            name='심화 레슨', description='설명', price=70000, duration=60, provider=other,
+        )
+        self.date = timezone.localdate() + timedelta(days=1)
+        for offset, reserved_service, status in [
+            (0, service, 'pending'), (1, service, 'cancelled'),
+            (2, other_service, 'confirmed'), (5, service, 'completed'),
+        ]:
+            Reservation.objects.create(
+                user=self.user, service=reserved_service, provider=reserved_service.provider,
+                date=self.date + timedelta(days=offset), time=time(10), status=status, notes='메모, "인용"',
+            )
+        self.client.force_login(self.staff)
+
+    def export(self, query=''):
+        response = self.client.get('/api/reservations-export/' + query)
+        self.assertEqual(response.status_code, 200, response.content if not response.streaming else '')
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.is_async)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_csv_and_jsonl(self):
+        content = self.export()
+        self.assertTrue(content.startswith('\ufeffid,date,time,status,username'))
+        rows = list(csv.reader(StringIO(content.lstrip('\ufeff'))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[1][1:5], [str(self.date), '10:00:00', 'pending', 'customer'])
+        self.assertEqual(rows[1][10], '메모, "인용"')
+
+        lines = self.export('?output=jsonl').splitlines()
+        self.assertEqual(len(lines), 4)
+        first = json.loads(lines[0])
+        self.assertEqual((first['user_name'], first['service'], first['price']), ('홍길동', '레슨', '50000.00'))
+        self.assertEqual(first['provider'], '김태호')
+
+    def test_filters_and_errors(self):
+        end = self.date + timedelta(days=2)
+        lines = self.export(f'?output=jsonl&start={self.date}&end={end}&status=pending,confirmed').splitlines()
+        self.assertEqual([json.loads(line)['status'] for line in lines], ['pending', 'confirmed'])
+        lines = self.export(f'?output=jsonl&provider={self.provider.id}').splitlines()
+        self.assertEqual({json.loads(line)['provider'] for line in lines}, {'김태호'})
+        self.assertEqual(len(lines), 3)
+
+        self.assertEqual(self.client.get('/api/reservations-export/?output=xml').status_code, 400)
+        self.assertEqual(self.client.get('/api/reservations-export/?start=2024/01/01').status_code, 400)
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get('/api/reservations-export/').status_code, 403)
+
+    async def test_asgi_streams_async_iterator(self):
+        client = AsyncClient()
+        await sync_to_async(client.force_login)(self.staff)
+        response = await client.get('/api/reservations-export/?output=jsonl')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        lines = b''.join(chunks).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(json.loads(lines[-1])['status'], 'completed')
+
+
+class ProviderStatsTestCase(TestCase):
+    """제공자 통계가 집계 쿼리로 계산되고 캐시되는지 확인"""
+
+    def setUp(self):
+        for day in range(7):
+            BusinessHours.objects.create(day=day, open_time=time(9), close_time=time(12))
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        today = timezone.localdate()
+        for hour, status in [(9, 'pending'), (10, 'confirmed'), (11, 'completed'), (11, 'cancelled')]:
+            Reservation.objects.create(
+                user=self.user, service=self.service, provider=self.provider,
+                date=today, time=time(hour), status=status,
+            )
+        session = self.client.session
+        session['provider_id'] = self.provider.id
+        session.save()
+        catalog.get_cache().delete(catalog.cache_key(f'provider_stats:{self.provider.id}'))
+        # 롤백으로 재사용된 ID에 이전 테스트의 근무시간이 남지 않도록 다시 읽게 함
+        provider_calendar.invalidate()
+
+    def test_stats(self):
+        with CaptureQueriesContext(connection) as context:
+            data = self.client.get('/api/provider-reservations/stats/').json()
+        self.assertEqual(
+            sum('booking_reservation' in query['sql'] for query in context.captured_queries), 1
+        )
+        self.assertEqual(data['by_status'], {'pending': 1, 'confirmed': 1, 'completed': 1, 'cancelled': 1})
+        self.assertEqual((data['total'], data['today'], data['this_month']), (4, 3, 3))
+        self.assertEqual(data['revenue'], 50000)
+        self.assertEqual(data['expected_revenue'], 100000)
+
+        today = timezone.localdate()
+        month_end = (today.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        self.assertEqual(data['bookable_slots'], 6 * month_end.day)
+        self.assertEqual(data['utilization'], round(3 * 100 / data['bookable_slots'], 1))
+
+        # 짧은 시간 동안은 캐시된 통계를 반환
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.client.get('/api/provider-reservations/stats/').json(), data)
+        self.assertFalse(any('booking_reservation' in query['sql'] for query in context.captured_queries))
+
+    def test_requires_provider_login(self):
+        self.client.logout()
+        self.assertEqual(self.client.get('/api/provider-reservations/stats/').status_code, 401)
+
+
+class RatingAggregateTestCase(TestCase):
+    """리뷰 작성/삭제 시 서비스와 제공자 평점이 갱신되는지 확인"""
+
+    def setUp(self):
+        catalog.clear()
+        self.user = User.objects.create_user('customer', password='password123')
+        self.provider = ServiceProvider.objects.create(name='김태호', username='kimtaeho', password='x')
+        self.service = Service.objects.create(
+            name='레슨', description='설명', price=50000, duration=60, provider=self.provider,
+        )
+        self.reservations = [
+            Reservation.objects.create(
+                user=self.user, service=self.service, provider=provider, status='completed',
+                date=timezone.localdate() - timedelta(days=1), time=time(9 + index),
+            )
+            # 제공자가 지정되지 않은 예약은 서비스의 제공자 기준으로 집계
+            for index, provider in enumerate([self.provider, None])
+        ]
+
+    def ratings(self):
+        self.service.refresh_from_db()
+        self.provider.refresh_from_db()
+        return [
+            (self.service.rating_avg, self.service.rating_count),
+            (self.provider.rating_avg, self.provider.rating_count),
+        ]
+
+    def test_create_and_delete(self):
+        self.client.force_login(self.user)
+        for reservation, rating in zip(self.reservations, [5, 2]):
+            response = self.client.post('/api/reviews/', {
+                'reservation': reservation.id, 'rating': rating, 'comment': '좋아요',
+            }, content_type='application/json')
+            self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(self.ratings(), [(3.5, 2), (3.5, 2)])
+
+        # 목록 응답에 포함되고 카탈로그 캐시도 갱신됨
+        service = self.client.get('/api/services/').json()[0]
+        self.assertEqual((service['rating_avg'], service['rating_count']), (3.5, 2))
+        provider = self.client.get('/api/providers/active/').json()[0]
+        self.assertEqual((provider['rating_avg'], provider['rating_count']), (3.5, 2))
+
+        Review.objects.get(rating=2).delete()
+        self.assertEqual(self.ratings(), [(5.0, 1), (5.0, 1)])
+        self.reservations[0].delete()
+        self.assertEqual(self.ratings(), [(0.0, 0), (0.0, 0)])
+
+    def test_reassigned_reservation_moves_ratings(self):
+        for reservation, rating in zip(self.reservations, [5, 2]):
+            Review.objects.create(reservation=reservation, rating=rating, comment='좋아요')
+        other = ServiceProvider.objects.create(name='이수진', username='leesujin', password='x')
+        other_service = Service.objects.create(
+            name='심화 레슨', description='설명', price=70000, duration=60, provider=other,
+        )
+
+        def other_ratings():
+            other.refresh_from_db()
+            other_service.refresh_from_db()
+            return [(other_service.rating_avg, other_service.rating_count), (other.rating_avg, other.rating_count)]
+
+        # 예약의 서비스/제공자를 바꾸면 이전 대상과 새 대상을 모두 갱신
+        first = self.reservations[0]
+        first.service, first.provider = other_service, other
+        first.save()
+        self.assertEqual(self.ratings(), [(2.0, 1), (2.0, 1)])
+        self.assertEqual(other_ratings(), [(5.0, 1), (5.0, 1)])
+
+        # 서비스의 제공자가 바뀌면 제공자가 지정되지 않은 예약의 리뷰도 옮겨감
+        self.service.provider = other
+        self.service.save()
+        self.assertEqual(self.ratings(), [(2.0, 1), (0.0, 0)])
+        self.assertEqual(other_ratings(), [(5.0, 1), (3.5, 2)])
+
+        # 제공자가 없는 예약에 서비스의 제공자를 채워도 집계 대상은 그대로
+        call_command('update_reservation_providers', stdout=StringIO())
+        self.assertEqual(Reservation.objects.get(pk=self.reservations[1].pk).provider_id, other.id)
+        self.assertEqual(self.ratings(), [(2.0, 1), (0.0, 0)])
+        self.assertEqual(other_ratings(), [(5.0, 1), (3.5, 2)])
+        ratings.rebuild()
+        self.assertEqual(self.ratings(), [(2.0, 1), (0.0, 0)])
+        self.assertEqual(other_ratings(), [(5.0, 1), (3.5, 2)])
@@ -0,0 +1,150 @@
+"""
+API 접근 토큰 (사용자 / 서비스 제공자)
+
+SECRET_KEY로 서명한 토큰에 주체 정보(종류, ID, 사용자 이름, 관리자 여부)와 만료 시각을 담아
+요청마다 DB나 세션을 조회하지 않고 서명, 만료, 폐기 여부만 확인합니다.
+접근 토큰은 짧게(ACCESS_TOKEN_LIFETIME) 유지하고 갱신 토큰으로 다시 발급하며,
+갱신 토큰은 발급 당시의 비밀번호 해시에 묶여 비밀번호를 바꾸면 더 이상 사용할 수 없습니다.
+폐기한 토큰 ID는 DB(RevokedToken)에 기록해 재시작이나 캐시 축출 후에도 유지하고, 각 프로세스는
+세대 번호가 바뀌거나 CALENDAR_STATE_MAX_AGE가 지났을 때만 메모리의 폐기 목록을 다시 읽습니다.
+"""
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from . import catalog
+from .business_calendar import GenerationCachedState
+from .models import RevokedToken, ServiceProvider
+
+
+SALT = 'booking.tokens'
+ACCESS = 'access'
+REFRESH = 'refresh'
+USER = 'user'
+PROVIDER = 'provider'
+
+RevocationState = namedtuple('RevocationState', ['generation', 'revoked'])
+
+
+class InvalidToken(Exception):
+    """서명, 형식, 만료, 폐기 검사에 실패한 토큰"""
+
+
+class AccessToken:
+    """검증된 토큰의 내용 (DRF request.auth)"""
+
+    def __init__(self, claims):
+        self.claims = claims
+        self.token_type = claims['t']
+        self.kind = claims['k']
+        self.subject_id = claims['id']
+        self.jti = claims['j']
+        self.expires_at = claims['exp']
+
+    def user(self):
+        """토큰 정보로 만든 사용자 (DB 조회 없음, ID/사용자 이름/권한만 포함)"""
+        user = User(
+            id=self.subject_id, username=self.claims['n'],
+            is_staff=self.claims['s'], is_superuser=self.claims['su'], is_active=True,
+        )
+        user._state.adding = False
+        user._state.db = 'default'
+        return user
+
+
+class RevocationList(GenerationCachedState):
+    """폐기한 토큰 ID (만료되지 않은 RevokedToken)"""
+
+    generation_key = catalog.CACHE_PREFIX + 'token_revocation_generation'
+
+    def _load(self, generation):
+        revoked = RevokedToken.objects.filter(expires_at__gt=timezone.now()).values_list('jti', flat=True)
+        return RevocationState(generation, frozenset(revoked))
+
+    def revoke(self, token):
+        expires_at = datetime.fromtimestamp(token.expires_at, tz=dt_timezone.utc)
+        # 만료된 항목은 폐기 목록에 둘 필요가 없으므로 함께 정리
+        RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        RevokedToken.objects.get_or_create(jti=token.jti, defaults={'expires_at': expires_at})
+        self.invalidate()
+
+    def is_revoked(self, jti):
+        return jti in self.state().revoked
+
+
+revocations = RevocationList()
+
+
+def _auth_hash(kind, password):
+    """비밀번호 해시에서 파생한 값 (비밀번호를 바꾸면 달라짐)"""
+    return salted_hmac(SALT + '.' + kind, password, algorithm='sha256').hexdigest()[:16]
+
+
+def _sign(claims):
+    return signing.Signer(salt=SALT).sign_object(claims, compress=True)
+
+
+def _claims(token_type, kind, subject_id, username, is_staff=False, is_superuser=False):
+    lifetime = settings.ACCESS_TOKEN_LIFETIME if token_type == ACCESS else settings.REFRESH_TOKEN_LIFETIME
+    return {
+        't': token_type, 'k': kind, 'id': subject_id, 'n': username, 's': is_staff, 'su': is_superuser,
+        'j': uuid.uuid4().hex, 'exp': int(time.time()) + lifetime,
+    }
+
+
+def _principal(kind, subject):
+    if kind == USER:
+        return subject.id, subject.username, subject.is_staff, subject.is_superuser
+    return subject.id, subject.username, False, False
+
+
+def issue_access(kind, subject):
+    """접근 토큰 발급"""
+    return _sign(_claims(ACCESS, kind, *_principal(kind, subject)))
+
+
+def issue_pair(kind, subject):
+    """접근/갱신 토큰과 접근 토큰 유효 시간(초)"""
+    refresh = _claims(REFRESH, kind, *_principal(kind, subject))
+    refresh['h'] = _auth_hash(kind, subject.password)
+    return {
+        'access': issue_access(kind, subject),
+        'refresh': _sign(refresh),
+        'token_type': 'Bearer',
+        'expires_in': settings.ACCESS_TOKEN_LIFETIME,
+    }
+
+
+def verify(value, token_type=ACCESS):
+    """서명/만료/폐기 확인 후 AccessToken 반환 (폐기 목록을 다시 읽을 때 외에는 DB 조회 없음)"""
+    try:
+        claims = signing.Signer(salt=SALT).unsign_object(value)
+    except (signing.BadSignature, ValueError):
+        raise InvalidToken('유효하지 않은 토큰입니다.')
+    if not isinstance(claims, dict) or claims.get('t') != token_type or claims.get('k') not in (USER, PROVIDER):
+        raise InvalidToken('유효하지 않은 토큰입니다.')
+    if claims['exp'] <= time.time():
+        raise InvalidToken('만료된 토큰입니다.')
+    token = AccessToken(claims)
+    if revocations.is_revoked(token.jti):
+        raise InvalidToken('폐기된 토큰입니다.')
+    return token
+
+
+def refresh_access(value):
+    """갱신 토큰으로 새 접근 토큰 발급 (주체의 활성 상태와 비밀번호 변경 여부 확인)"""
+    token = verify(value, REFRESH)
+    model = User if token.kind == USER else ServiceProvider
+    subject = model.objects.filter(id=token.subject_id, is_active=True).first()
+    if subject is None or not constant_time_compare(
+        token.claims.get('h', ''), _auth_hash(token.kind, subject.password)
+    ):
+        raise InvalidToken('유효하지 않은 토큰입니다.')
+    return issue_access(token.kind, subject)
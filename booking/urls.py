@@ -29,5 +29,10 @@ urlpatterns = [
     path('api/profile/update/', views.ProfileUpdateView.as_view(), name='profile_update'),
     path('api/provider/login/', views.ServiceProviderLoginView.as_view(), name='provider_login'),
     path('api/provider/logout/', views.ServiceProviderLogoutView.as_view(), name='provider_logout'),
-    path('api/services/<int:service_id>/check_time_updates/', views.check_time_updates, name='check_time_updates'),
+    path('api/provider/token/', views.ServiceProviderTokenObtainView.as_view(), name='provider_token'),
+    path('api/token/', views.TokenObtainView.as_view(), name='token_obtain'),
+    path('api/token/refresh/', views.TokenRefreshView.as_view(), name='token_refresh'),
+    path('api/token/revoke/', views.TokenRevokeView.as_view(), name='token_revoke'),
+    path('api/catalog-cache/stats/', views.CatalogCacheStatsView.as_view(), name='catalog_cache_stats'),
+    path('api/reservations-export/', views.ReservationExportView.as_view(), name='reservation_export'),
 ] 
\ No newline at end of file
@@ -1,18 +1,38 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth.hashers import check_password
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 from datetime import datetime, timedelta
 from .models import Service, Reservation, Review, BusinessHours, Category, ServiceProvider, Notice
+from .availability import (
+    ACTIVE_STATUSES, availability_etag, available_times_for, available_times_for_range, bookable_slot_count,
+    get_business_hours, load_day
+)
+from . import catalog, tokens
+from .authentication import provider_id_for
+from .conditional import conditional_response, make_etag, queryset_version
+from .events import publish_slot_change, slot_event
+from .exports import FORMATS, aexport_lines, export_lines, export_queryset
+from .fast_serializers import fast_data, fast_list
+from .pagination import (
+    ReservationCursorPagination, ReviewCursorPagination, UpcomingReservationCursorPagination
+)
 from .serializers import (
     ServiceSerializer, ReservationSerializer, ReviewSerializer,
     BusinessHoursSerializer, UserSerializer, ReservationCreateSerializer,
     UserRegistrationSerializer, CategorySerializer, ServiceProviderSerializer,
-    ServiceProviderLoginSerializer, ServiceProviderReservationSerializer, NoticeSerializer
+    ServiceProviderLoginSerializer, ServiceProviderReservationSerializer, NoticeSerializer, requested_paths
 )
 
 
@@ -138,6 +158,9 @@ class ProfileUpdateView(APIView):
     
     def put(self, request):
         user = request.user
+        if isinstance(request.auth, tokens.AccessToken):
+            # 토큰 사용자는 ID/권한 정보만 가지므로 저장 전에 전체 필드를 조회
+            user = User.objects.get(pk=user.pk)
         data = request.data.copy()
         
         # 비밀번호 변경이 있는 경우
@@ -184,6 +207,12 @@ class CategoryViewSet(viewsets.ModelViewSet):
             return [permissions.IsAdminUser()]
         return [permissions.IsAuthenticated()]
 
+    def list(self, request, *args, **kwargs):
+        """카테고리 목록 조회 (카탈로그 캐시)"""
+        return catalog.cached_response(
+            request, 'categories', lambda: self.get_serializer(self.get_queryset(), many=True).data
+        )
+
 
 class ServiceProviderViewSet(viewsets.ModelViewSet):
     """서비스 제공자 관리 API"""
@@ -205,10 +234,11 @@ class ServiceProviderViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def active(self, request):
-        """활성화된 서비스 제공자 조회"""
-        providers = ServiceProvider.objects.filter(is_active=True)
-        serializer = self.get_serializer(providers, many=True)
-        return Response(serializer.data)
+        """활성화된 서비스 제공자 조회 (카탈로그 캐시, 변경이 없으면 304)"""
+        return catalog.cached_response(
+            request, 'providers_active',
+            lambda: self.get_serializer(ServiceProvider.objects.filter(is_active=True), many=True).data
+        )
 
 
 class ServiceProviderLoginView(APIView):
@@ -223,7 +253,6 @@ class ServiceProviderLoginView(APIView):
             
             try:
                 provider = ServiceProvider.objects.get(username=username, is_active=True)
-                from django.contrib.auth.hashers import check_password
                 if check_password(password, provider.password):
                     # 세션에 제공자 정보 저장
                     request.session['provider_id'] = provider.id
@@ -252,41 +281,137 @@ class ServiceProviderLogoutView(APIView):
         return Response({'message': '로그아웃 성공'})
 
 
+class TokenObtainView(APIView):
+    """사용자 접근/갱신 토큰 발급 API"""
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        user = authenticate(username=request.data.get('username'), password=request.data.get('password'))
+        if user is None:
+            return Response(
+                {'error': '사용자명 또는 비밀번호가 올바르지 않습니다.'}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        return Response(tokens.issue_pair(tokens.USER, user))
+
+
+class ServiceProviderTokenObtainView(APIView):
+    """서비스 제공자 접근/갱신 토큰 발급 API"""
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        serializer = ServiceProviderLoginSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        provider = ServiceProvider.objects.filter(
+            username=serializer.validated_data['username'], is_active=True
+        ).first()
+        if provider is None or not check_password(serializer.validated_data['password'], provider.password):
+            return Response(
+                {'error': '아이디 또는 비밀번호가 올바르지 않습니다.'}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        return Response(tokens.issue_pair(tokens.PROVIDER, provider))
+
+
+class TokenRefreshView(APIView):
+    """갱신 토큰으로 접근 토큰 재발급 API"""
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        try:
+            access = tokens.refresh_access(str(request.data.get('refresh', '')))
+        except tokens.InvalidToken as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_401_UNAUTHORIZED)
+        return Response({'access': access, 'token_type': 'Bearer', 'expires_in': settings.ACCESS_TOKEN_LIFETIME})
+
+
+class TokenRevokeView(APIView):
+    """토큰 폐기 API (본문의 갱신 토큰과 요청에 사용한 접근 토큰)"""
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request):
+        revoked = []
+        if request.data.get('refresh'):
+            try:
+                revoked.append(tokens.verify(str(request.data['refresh']), tokens.REFRESH))
+            except tokens.InvalidToken as exc:
+                return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        if isinstance(request.auth, tokens.AccessToken):
+            revoked.append(request.auth)
+        if not revoked:
+            return Response({'error': '폐기할 토큰이 없습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        for token in revoked:
+            tokens.revocations.revoke(token)
+        return Response({'message': '토큰이 폐기되었습니다.'})
+
+
+class ReservationConflict(APIException):
+    """같은 시간대에 이미 활성 예약이 있음"""
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = '해당 시간에 이미 예약이 있습니다.'
+    default_code = 'conflict'
+
+
 class ServiceProviderReservationViewSet(viewsets.ReadOnlyModelViewSet):
     """서비스 제공자용 예약 관리 API"""
     serializer_class = ServiceProviderReservationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ReservationCursorPagination
 
     def get_queryset(self):
         """로그인한 제공자의 예약만 조회"""
-        provider_id = self.request.session.get('provider_id')
+        provider_id = provider_id_for(self.request)
         if not provider_id:
             return Reservation.objects.none()
-        return Reservation.objects.filter(provider_id=provider_id)
+        _, expand = requested_paths(self.request)
+        return Reservation.objects.filter(provider_id=provider_id).select_related(
+            *ServiceProviderReservationSerializer.related_paths(expand)
+        )
 
     def get_permissions(self):
         """세션 기반 인증"""
         return [permissions.AllowAny()]
 
+    def list(self, request, *args, **kwargs):
+        """예약 목록 (values() 행을 바로 직렬화)"""
+        return fast_list(self, self.filter_queryset(self.get_queryset()))
+
+    def filter_queryset(self, queryset):
+        """상태별 조회 (?status=)"""
+        queryset = super().filter_queryset(queryset)
+        status_filter = self.request.query_params.get('status')
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        return queryset
+
     @action(detail=True, methods=['post'])
     def update_status(self, request, pk=None):
         """예약 상태 업데이트"""
-        provider_id = request.session.get('provider_id')
+        provider_id = provider_id_for(request)
         if not provider_id:
             return Response({'error': '로그인이 필요합니다.'}, status=401)
         
         try:
-            reservation = Reservation.objects.get(id=pk, provider_id=provider_id)
+            reservation = self.get_queryset().get(id=pk)
             old_status = reservation.status
             new_status = request.data.get('status')
             
             if new_status in ['pending', 'confirmed', 'completed', 'cancelled']:
                 reservation.status = new_status
-                reservation.save()
+                try:
+                    with transaction.atomic():
+                        reservation.save()
+                except IntegrityError:
+                    # 취소/완료된 예약을 되살릴 때 같은 시간대에 다른 활성 예약이 있는 경우
+                    return Response({'error': '해당 시간에 이미 예약이 있습니다.'}, status=409)
                 
                 # 상태가 '확정'으로 변경되거나 '확정'에서 다른 상태로 변경될 때
                 # 해당 시간대의 예약 가능 여부가 변경됨을 알림
                 status_changed = old_status != new_status
+                if status_changed:
+                    # 제공자 본인의 대시보드 통계는 바로 다시 계산
+                    catalog.get_cache().delete(catalog.cache_key(f'provider_stats:{provider_id}'))
                 time_slot_affected = old_status in ['pending', 'confirmed'] or new_status in ['pending', 'confirmed']
                 
                 serializer = self.get_serializer(reservation)
@@ -294,63 +419,19 @@ class ServiceProviderReservationViewSet(viewsets.ReadOnlyModelViewSet):
                 
                 if status_changed and time_slot_affected:
                     response_data['time_slot_updated'] = True
+                    publish_slot_change(reservation)
                     response_data['message'] = f'예약 상태가 {reservation.get_status_display()}로 변경되었습니다.'
                     
                     # 해당 날짜의 예약 가능한 시간대를 다시 계산하여 제공
-                    if reservation.service.provider:
-                        from datetime import datetime, timedelta
-                        from .models import BusinessHours
+                    service = reservation.service
+                    if service.provider_id:
+                        available_times = available_times_for(service, reservation.date)
                         
-                        target_date = reservation.date
-                        weekday = target_date.weekday()
-                        business_hours = BusinessHours.objects.filter(day=weekday).first()
-                        
-                        if business_hours and not business_hours.is_closed:
-                            # 해당 쌤의 예약된 시간 조회
-                            booked_times = Reservation.objects.filter(
-                                date=target_date,
-                                status__in=['pending', 'confirmed'],
-                                provider=reservation.service.provider
-                            ).values_list('time', flat=True)
-                            
-                            # 30분 간격으로 가능한 시간 생성
-                            available_times = []
-                            current_time = business_hours.open_time
-                            end_time = business_hours.close_time
-                            
-                            while current_time < end_time:
-                                # 서비스 소요시간을 고려하여 예약 가능한지 확인
-                                service_end_time = (
-                                    datetime.combine(target_date, current_time) + 
-                                    timedelta(minutes=reservation.service.duration)
-                                ).time()
-                                
-                                if service_end_time <= end_time:
-                                    # 해당 시간대에 예약이 없는지 확인
-                                    is_available = True
-                                    check_time = current_time
-                                    
-                                    while check_time < service_end_time:
-                                        if check_time in booked_times:
-                                            is_available = False
-                                            break
-                                        check_time = (
-                                            datetime.combine(target_date, check_time) + 
-                                            timedelta(minutes=30)
-                                        ).time()
-                                    
-                                    if is_available:
-                                        available_times.append(current_time.strftime('%H:%M'))
-                                
-                                current_time = (
-                                    datetime.combine(target_date, current_time) + 
-                                    timedelta(minutes=30)
-                                ).time()
-                            
+                        if available_times is not None:
                             response_data['available_times'] = available_times
-                            response_data['date'] = target_date.strftime('%Y-%m-%d')
-                            response_data['provider_id'] = reservation.service.provider.id
-                            response_data['service_id'] = reservation.service.id
+                            response_data['date'] = reservation.date.strftime('%Y-%m-%d')
+                            response_data['provider_id'] = service.provider_id
+                            response_data['service_id'] = service.id
                 
                 return Response(response_data)
             else:
@@ -361,82 +442,102 @@ class ServiceProviderReservationViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def time_slot_updates(self, request):
         """시간대 업데이트 정보 조회 (메인 페이지용)"""
-        provider_id = request.session.get('provider_id')
+        provider_id = provider_id_for(request)
         if not provider_id:
             return Response({'error': '로그인이 필요합니다.'}, status=401)
         
         # 최근 상태 변경된 예약들 조회 (1시간 이내)
-        from django.utils import timezone
-        from datetime import timedelta
-        
         recent_time = timezone.now() - timedelta(hours=1)
         recent_reservations = Reservation.objects.filter(
             provider_id=provider_id,
             updated_at__gte=recent_time,
             status__in=['pending', 'confirmed']
-        ).order_by('-updated_at')
+        ).select_related('service').order_by('-updated_at')
+        
+        # 같은 날짜의 점유 비트맵은 한 번만 조회 (영업시간은 영업 캘린더에서 쿼리 없이 조회)
+        days = {}
         
         updates = []
         for reservation in recent_reservations:
-            # 해당 날짜의 예약 가능한 시간대 계산
             target_date = reservation.date
-            weekday = target_date.weekday()
-            business_hours = BusinessHours.objects.filter(day=weekday).first()
+            service = reservation.service
             
-            if business_hours and not business_hours.is_closed:
-                from datetime import datetime
-                
-                # 해당 쌤의 예약된 시간 조회
-                booked_times = Reservation.objects.filter(
-                    date=target_date,
-                    status__in=['pending', 'confirmed'],
-                    provider=reservation.service.provider
-                ).values_list('time', flat=True)
-                
-                # 30분 간격으로 가능한 시간 생성
-                available_times = []
-                current_time = business_hours.open_time
-                end_time = business_hours.close_time
-                
-                while current_time < end_time:
-                    # 서비스 소요시간을 고려하여 예약 가능한지 확인
-                    service_end_time = (
-                        datetime.combine(target_date, current_time) + 
-                        timedelta(minutes=reservation.service.duration)
-                    ).time()
-                    
-                    if service_end_time <= end_time:
-                        # 해당 시간대에 예약이 없는지 확인
-                        is_available = True
-                        check_time = current_time
-                        
-                        while check_time < service_end_time:
-                            if check_time in booked_times:
-                                is_available = False
-                                break
-                            check_time = (
-                                datetime.combine(target_date, check_time) + 
-                                timedelta(minutes=30)
-                            ).time()
-                        
-                        if is_available:
-                            available_times.append(current_time.strftime('%H:%M'))
-                    
-                    current_time = (
-                        datetime.combine(target_date, current_time) + 
-                        timedelta(minutes=30)
-                    ).time()
-                
-                updates.append({
-                    'date': target_date.strftime('%Y-%m-%d'),
-                    'available_times': available_times,
-                    'provider_id': reservation.service.provider.id,
-                    'service_id': reservation.service.id,
-                    'updated_at': reservation.updated_at.isoformat()
-                })
+            business_hours = get_business_hours(target_date)
+            if business_hours is None:
+                continue
+            
+            key = (service.provider_id, target_date)
+            if key not in days:
+                days[key] = load_day(
+                    target_date, provider_id=service.provider_id, business_hours=business_hours
+                )
+            
+            updates.append({
+                'date': target_date.strftime('%Y-%m-%d'),
+                'available_times': days[key].available_times(service.duration),
+                'provider_id': service.provider_id,
+                'service_id': service.id,
+                'updated_at': reservation.updated_at.isoformat()
+            })
         
         return Response(updates)
 
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        """대시보드 통계 (상태별 건수, 기간별 건수, 매출, 이번 달 가동률)"""
+        provider_id = provider_id_for(request)
+        if not provider_id:
+            return Response({'error': '로그인이 필요합니다.'}, status=401)
+        
+        cache = catalog.get_cache()
+        cache_key = catalog.cache_key(f'provider_stats:{provider_id}')
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.compute_stats(provider_id)
+            cache.set(cache_key, data, getattr(settings, 'PROVIDER_STATS_CACHE_TIMEOUT', 60))
+        return Response(data)
+
+    def compute_stats(self, provider_id):
+        """한 번의 집계 쿼리로 통계 계산 (가동률 분모는 영업/근무시간에서 쿼리 없이 계산)"""
+        today = timezone.localdate()
+        week_start = today - timedelta(days=today.weekday())
+        month_start = today.replace(day=1)
+        month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        
+        # 취소되지 않은 예약 (대기중/확정/완료)
+        booked = ~Q(status='cancelled')
+        aggregates = {
+            status_value: Count('id', filter=Q(status=status_value))
+            for status_value, _ in Reservation.STATUS_CHOICES
+        }
+        aggregates.update(
+            total=Count('id'),
+            today=Count('id', filter=booked & Q(date=today)),
+            this_week=Count('id', filter=booked & Q(date__range=(week_start, week_start + timedelta(days=6)))),
+            this_month=Count('id', filter=booked & Q(date__range=(month_start, month_end))),
+            revenue=Sum('service__price', filter=Q(status='completed')),
+            month_revenue=Sum('service__price', filter=Q(status='completed', date__range=(month_start, month_end))),
+            expected_revenue=Sum('service__price', filter=Q(status__in=ACTIVE_STATUSES)),
+        )
+        result = Reservation.objects.filter(provider_id=provider_id).aggregate(**aggregates)
+        
+        bookable = bookable_slot_count(month_start, month_end, provider_id=provider_id)
+        return {
+            'by_status': {
+                status_value: result[status_value] for status_value, _ in Reservation.STATUS_CHOICES
+            },
+            'total': result['total'],
+            'today': result['today'],
+            'this_week': result['this_week'],
+            'this_month': result['this_month'],
+            'revenue': result['revenue'] or 0,
+            'month_revenue': result['month_revenue'] or 0,
+            'expected_revenue': result['expected_revenue'] or 0,
+            'bookable_slots': bookable,
+            'utilization': round(result['this_month'] * 100 / bookable, 1) if bookable else 0,
+            'generated_at': timezone.now().isoformat(),
+        }
+
 
 class ServiceViewSet(viewsets.ModelViewSet):
     """서비스 관리 API"""
@@ -446,9 +547,11 @@ class ServiceViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """권한에 따른 쿼리셋"""
+        _, expand = requested_paths(self.request)
+        queryset = Service.objects.select_related(*ServiceSerializer.related_paths(expand))
         if self.request.user.is_staff:
-            return Service.objects.all()
-        return Service.objects.filter(is_active=True)
+            return queryset
+        return queryset.filter(is_active=True)
 
     def get_permissions(self):
         """권한 설정"""
@@ -456,6 +559,22 @@ class ServiceViewSet(viewsets.ModelViewSet):
             return [permissions.IsAdminUser()]
         return [permissions.AllowAny()]
 
+    def list(self, request, *args, **kwargs):
+        """서비스 목록 조회 (변경이 없으면 304)"""
+        # 일반 사용자용 활성 서비스 목록은 카탈로그 캐시에서 응답
+        if not request.user.is_staff:
+            return catalog.cached_response(
+                request, 'services',
+                lambda: fast_data(self, self.filter_queryset(self.get_queryset()))
+            )
+        
+        queryset = self.filter_queryset(self.get_queryset())
+        etag = make_etag(
+            'services', request.user.is_staff, request.GET.get('fields'), request.GET.get('expand'),
+            queryset_version(queryset, 'category', 'provider')
+        )
+        return conditional_response(request, etag, lambda: fast_list(self, queryset))
+
     @action(detail=True, methods=['get'])
     def available_times(self, request, pk=None):
         """특정 서비스의 예약 가능한 시간 조회"""
@@ -477,78 +596,66 @@ class ServiceViewSet(viewsets.ModelViewSet):
             )
         
         # 영업시간 확인
-        weekday = target_date.weekday()
-        business_hours = BusinessHours.objects.filter(day=weekday).first()
-        
-        if not business_hours or business_hours.is_closed:
-            return Response([])
-        
-        # 현재 사용자의 기존 예약 조회 (로그인한 경우에만)
-        user_booked_times = []
-        if request.user.is_authenticated:
-            user_booked_times = Reservation.objects.filter(
-                user=request.user,
-                date=target_date,
-                status__in=['pending', 'confirmed']
-            ).values_list('time', flat=True)
-        
-        # 해당 서비스의 제공자(쌤)가 예약된 시간 조회
+        business_hours = get_business_hours(target_date)
+        
+        # 현재 사용자의 기존 예약도 점유로 처리 (로그인한 경우에만)
         # 서비스에 직접 연결된 제공자가 있으면 해당 제공자의 예약만 확인
         # 서비스에 제공자가 없으면 모든 예약 확인
-        if service.provider:
-            # 특정 쌤의 예약만 확인
-            provider_booked_times = Reservation.objects.filter(
-                date=target_date,
-                status__in=['pending', 'confirmed'],
-                provider=service.provider
-            ).values_list('time', flat=True)
-        else:
-            # 모든 예약 확인 (기존 로직)
-            provider_booked_times = Reservation.objects.filter(
-                date=target_date,
-                status__in=['pending', 'confirmed']
-            ).values_list('time', flat=True)
-        
-        # 30분 간격으로 가능한 시간 생성
-        available_times = []
-        current_time = business_hours.open_time
-        end_time = business_hours.close_time
-        
-        while current_time < end_time:
-            # 서비스 소요시간을 고려하여 예약 가능한지 확인
-            service_end_time = (
-                datetime.combine(target_date, current_time) + 
-                timedelta(minutes=service.duration)
-            ).time()
-            
-            if service_end_time <= end_time:
-                # 해당 시간대에 예약이 없는지 확인
-                is_available = True
-                check_time = current_time
-                
-                while check_time < service_end_time:
-                    # 다른 사용자의 예약 확인
-                    if check_time in provider_booked_times:
-                        is_available = False
-                        break
-                    # 현재 사용자의 예약 확인
-                    if check_time in user_booked_times:
-                        is_available = False
-                        break
-                    check_time = (
-                        datetime.combine(target_date, check_time) + 
-                        timedelta(minutes=30)
-                    ).time()
-                
-                if is_available:
-                    available_times.append(current_time.strftime('%H:%M'))
-            
-            current_time = (
-                datetime.combine(target_date, current_time) + 
-                timedelta(minutes=30)
-            ).time()
+        user = request.user if request.user.is_authenticated else None
         
-        return Response(available_times)
+        day = None
+        if business_hours is not None:
+            day = load_day(
+                target_date, provider_id=service.provider_id, user=user, business_hours=business_hours
+            )
+        
+        def respond():
+            # 영업하지 않는 날
+            if day is None:
+                return Response([])
+            return Response(day.available_times(service.duration))
+        
+        # 점유 현황이 바뀌지 않았으면 재계산 없이 304
+        etag = availability_etag(service, target_date, day, user=user)
+        return conditional_response(request, etag, respond)
+
+    @action(detail=True, methods=['get'])
+    def available_times_range(self, request, pk=None):
+        """특정 서비스의 기간별 예약 가능한 시간 조회 (날짜별 맵)"""
+        service = self.get_object()
+        today = timezone.localdate()
+        last_date = today + timedelta(days=service.max_advance_booking)
+
+        try:
+            start_str = request.query_params.get('start')
+            end_str = request.query_params.get('end')
+            start_date = datetime.strptime(start_str, '%Y-%m-%d').date() if start_str else today
+            end_date = datetime.strptime(end_str, '%Y-%m-%d').date() if end_str else last_date
+        except ValueError:
+            return Response(
+                {"error": "올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if start_date > end_date:
+            return Response(
+                {"error": "start는 end보다 늦을 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 오늘부터 최대 예약 가능 일수까지만 조회
+        start_date = max(start_date, today)
+        end_date = min(end_date, last_date)
+        if start_date > end_date:
+            return Response({})
+
+        user = request.user if request.user.is_authenticated else None
+        availability = available_times_for_range(service, start_date, end_date, user=user)
+
+        return Response({
+            target_date.strftime('%Y-%m-%d'): available_times
+            for target_date, available_times in availability.items()
+        })
 
     @action(detail=True, methods=['get'])
     def check_time_updates(self, request, pk=None):
@@ -571,83 +678,39 @@ class ServiceViewSet(viewsets.ModelViewSet):
             )
         
         # 해당 서비스의 제공자가 있는 경우에만 확인
-        if not service.provider:
+        if not service.provider_id:
             return Response({"message": "서비스에 연결된 제공자가 없습니다."})
         
         # 영업시간 확인
-        weekday = target_date.weekday()
-        business_hours = BusinessHours.objects.filter(day=weekday).first()
+        business_hours = get_business_hours(target_date)
         
-        if not business_hours or business_hours.is_closed:
+        if business_hours is None:
             return Response({"message": "해당 날짜는 영업하지 않습니다."})
         
-        # 현재 사용자의 기존 예약 조회 (로그인한 경우에만)
-        user_booked_times = []
-        if request.user.is_authenticated:
-            user_booked_times = Reservation.objects.filter(
-                user=request.user,
-                date=target_date,
-                status__in=['pending', 'confirmed']
-            ).values_list('time', flat=True)
-        
-        # 해당 쌤의 예약된 시간 조회
-        provider_booked_times = Reservation.objects.filter(
-            date=target_date,
-            status__in=['pending', 'confirmed'],
-            provider=service.provider
-        ).values_list('time', flat=True)
-        
-        # 30분 간격으로 가능한 시간 생성
-        available_times = []
-        current_time = business_hours.open_time
-        end_time = business_hours.close_time
-        
-        while current_time < end_time:
-            # 서비스 소요시간을 고려하여 예약 가능한지 확인
-            service_end_time = (
-                datetime.combine(target_date, current_time) + 
-                timedelta(minutes=service.duration)
-            ).time()
-            
-            if service_end_time <= end_time:
-                # 해당 시간대에 예약이 없는지 확인
-                is_available = True
-                check_time = current_time
-                
-                while check_time < service_end_time:
-                    # 다른 사용자의 예약 확인
-                    if check_time in provider_booked_times:
-                        is_available = False
-                        break
-                    # 현재 사용자의 예약 확인
-                    if check_time in user_booked_times:
-                        is_available = False
-                        break
-                    check_time = (
-                        datetime.combine(target_date, check_time) + 
-                        timedelta(minutes=30)
-                    ).time()
-                
-                if is_available:
-                    available_times.append(current_time.strftime('%H:%M'))
-            
-            current_time = (
-                datetime.combine(target_date, current_time) + 
-                timedelta(minutes=30)
-            ).time()
+        # 현재 사용자의 기존 예약도 점유로 처리 (로그인한 경우에만)
+        user = request.user if request.user.is_authenticated else None
         
-        return Response({
-            'date': date_str,
-            'available_times': available_times,
-            'provider_id': service.provider.id,
-            'service_id': service.id,
-            'last_updated': timezone.now().isoformat()
-        })
+        day = load_day(
+            target_date, provider_id=service.provider_id, user=user, business_hours=business_hours
+        )
+        
+        def respond():
+            return Response({
+                'date': date_str,
+                'available_times': day.available_times(service.duration),
+                'provider_id': service.provider_id,
+                'service_id': service.id,
+                'last_updated': timezone.now().isoformat()
+            })
+        
+        # 점유 현황이 바뀌지 않았으면 재계산 없이 304
+        etag = availability_etag(service, target_date, day, user=user)
+        return conditional_response(request, etag, respond)
 
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """추천 서비스 조회"""
-        services = Service.objects.filter(is_active=True, is_featured=True)
+        services = self.get_queryset().filter(is_active=True, is_featured=True)
         serializer = self.get_serializer(services, many=True)
         return Response(serializer.data)
 
@@ -655,10 +718,9 @@ class ServiceViewSet(viewsets.ModelViewSet):
     def by_category(self, request):
         """카테고리별 서비스 조회"""
         category_id = request.query_params.get('category_id')
+        services = self.get_queryset().filter(is_active=True)
         if category_id:
-            services = Service.objects.filter(is_active=True, category_id=category_id)
-        else:
-            services = Service.objects.filter(is_active=True)
+            services = services.filter(category_id=category_id)
         serializer = self.get_serializer(services, many=True)
         return Response(serializer.data)
 
@@ -667,12 +729,16 @@ class ReservationViewSet(viewsets.ModelViewSet):
     """예약 관리 API"""
     serializer_class = ReservationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ReservationCursorPagination
 
     def get_queryset(self):
         """사용자별 예약 조회"""
+        # 리뷰 ID와 ?expand=로 펼친 관계만 한 번의 조인으로 조회
+        _, expand = requested_paths(self.request)
+        queryset = Reservation.objects.select_related('review', *ReservationSerializer.related_paths(expand))
         if self.request.user.is_staff:
-            return Reservation.objects.all()
-        return Reservation.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
 
     def get_serializer_class(self):
         """액션에 따른 시리얼라이저 선택"""
@@ -680,82 +746,74 @@ class ReservationViewSet(viewsets.ModelViewSet):
             return ReservationCreateSerializer
         return ReservationSerializer
 
+    def list(self, request, *args, **kwargs):
+        """예약 목록 (values() 행을 바로 직렬화)"""
+        return fast_list(self, self.filter_queryset(self.get_queryset()))
+
     def create(self, request, *args, **kwargs):
         """예약 생성 시 중복 예약 방지"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # 예약 데이터 추출
-        service_id = serializer.validated_data['service_id']
-        service = Service.objects.get(id=service_id)
-        date = serializer.validated_data['date']
-        time = serializer.validated_data['time']
-        provider_id = serializer.validated_data.get('provider_id')
-        
-        # 1. 같은 사용자가 같은 서비스에 대해 같은 날짜/시간에 중복 예약하는지 확인
-        user_duplicate = Reservation.objects.filter(
-            user=request.user,
-            service=service,
-            date=date,
-            time=time,
-            status__in=['pending', 'confirmed']
-        ).first()
+        # 같은 서비스/제공자의 같은 날짜/시간 중복 예약은 DB 제약 조건이 INSERT 한 번으로 차단
+        # (동시 요청 간 경쟁 상태도 DB에서 판정)
+        try:
+            with transaction.atomic():
+                reservation = serializer.save(user=request.user)
+        except IntegrityError:
+            return self.conflict_response(serializer.validated_data)
         
-        if user_duplicate:
+        publish_slot_change(reservation)
+        
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def conflict_response(self, data):
+        """예약 생성 실패 원인 확인 (실패한 경우에만 조회)"""
+        if not Service.objects.filter(id=data['service_id']).exists():
             return Response(
-                {"error": "이미 동일한 서비스에 대해 같은 날짜와 시간에 예약이 있습니다."}, 
+                {"error": "존재하지 않는 서비스입니다."}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 2. 같은 서비스에 대해 같은 날짜/시간에 다른 사용자가 이미 예약했는지 확인
-        service_duplicate = Reservation.objects.filter(
-            service=service,
-            date=date,
-            time=time,
-            status__in=['pending', 'confirmed']
-        ).first()
-        
-        if service_duplicate:
+        provider_id = data.get('provider_id')
+        if provider_id and not ServiceProvider.objects.filter(id=provider_id).exists():
             return Response(
-                {"error": "해당 시간에 이미 예약이 있습니다."}, 
+                {"error": "존재하지 않는 서비스 제공자입니다."}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 3. provider_id가 제공된 경우, 해당 제공자의 중복 예약 확인
-        if provider_id:
-            try:
-                provider = ServiceProvider.objects.get(id=provider_id)
-                provider_duplicate = Reservation.objects.filter(
-                    provider=provider,
-                    date=date,
-                    time=time,
-                    status__in=['pending', 'confirmed']
-                ).first()
-                
-                if provider_duplicate:
-                    return Response(
-                        {"error": "해당 쌤의 시간에 이미 예약이 있습니다."}, 
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-            except ServiceProvider.DoesNotExist:
-                return Response(
-                    {"error": "존재하지 않는 서비스 제공자입니다."}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        
-        # 예약 생성
-        reservation = serializer.save(user=request.user)
+        active = Reservation.objects.filter(
+            date=data['date'],
+            time=data['time'],
+            status__in=['pending', 'confirmed']
+        )
         
-        # provider_id가 제공된 경우 해당 제공자로 설정
-        if provider_id:
-            try:
-                provider = ServiceProvider.objects.get(id=provider_id)
-                reservation.provider = provider
-                reservation.save()
-            except ServiceProvider.DoesNotExist:
-                pass  # 제공자가 존재하지 않으면 무시
+        # 1. 같은 사용자가 같은 서비스에 대해 같은 날짜/시간에 중복 예약
+        if active.filter(user=self.request.user, service_id=data['service_id']).exists():
+            error = "이미 동일한 서비스에 대해 같은 날짜와 시간에 예약이 있습니다."
+        # 2. 해당 제공자의 같은 날짜/시간에 다른 예약
+        elif provider_id and active.filter(provider_id=provider_id).exists():
+            error = "해당 쌤의 시간에 이미 예약이 있습니다."
+        # 3. 같은 서비스에 대해 같은 날짜/시간에 다른 사용자의 예약
+        else:
+            error = "해당 시간에 이미 예약이 있습니다."
         
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response({"error": error}, status=status.HTTP_409_CONFLICT)
+
+    def perform_update(self, serializer):
+        """예약 수정 시 시간대 변경 알림 (날짜가 바뀌면 이전 날짜도 알림)"""
+        previous = slot_event(serializer.instance)
+        try:
+            with transaction.atomic():
+                reservation = serializer.save()
+        except IntegrityError:
+            raise ReservationConflict()
+        publish_slot_change(reservation, previous)
+
+    def perform_destroy(self, instance):
+        """예약 삭제 시 시간대 변경 알림"""
+        instance.delete()
+        publish_slot_change(instance)
 
     @action(detail=True, methods=['post'])
     def cancel(self, request, pk=None):
@@ -770,6 +828,7 @@ class ReservationViewSet(viewsets.ModelViewSet):
         
         reservation.status = 'cancelled'
         reservation.save()
+        publish_slot_change(reservation)
         
         return Response({"message": "예약이 취소되었습니다."})
 
@@ -783,8 +842,16 @@ class ReservationViewSet(viewsets.ModelViewSet):
             )
         
         reservation = self.get_object()
+        old_status = reservation.status
         reservation.status = 'confirmed'
-        reservation.save()
+        try:
+            with transaction.atomic():
+                reservation.save()
+        except IntegrityError:
+            # 취소/완료된 예약을 되살릴 때 같은 시간대에 다른 활성 예약이 있는 경우
+            return Response({'error': '해당 시간에 이미 예약이 있습니다.'}, status=status.HTTP_409_CONFLICT)
+        if old_status != reservation.status:
+            publish_slot_change(reservation)
         
         return Response({"message": "예약이 확정되었습니다."})
 
@@ -798,8 +865,11 @@ class ReservationViewSet(viewsets.ModelViewSet):
             )
         
         reservation = self.get_object()
+        old_status = reservation.status
         reservation.status = 'completed'
         reservation.save()
+        if old_status != reservation.status:
+            publish_slot_change(reservation)
         
         return Response({"message": "예약이 완료되었습니다."})
 
@@ -810,17 +880,14 @@ class ReservationViewSet(viewsets.ModelViewSet):
         upcoming_reservations = self.get_queryset().filter(
             date__gte=today,
             status__in=['pending', 'confirmed']
-        ).order_by('date', 'time')
+        )
         
-        serializer = self.get_serializer(upcoming_reservations, many=True)
-        return Response(serializer.data)
+        return fast_list(self, upcoming_reservations, paginator=UpcomingReservationCursorPagination())
 
     @action(detail=False, methods=['get'])
     def history(self, request):
         """예약 내역 조회"""
-        reservations = self.get_queryset().order_by('-date', '-time')
-        serializer = self.get_serializer(reservations, many=True)
-        return Response(serializer.data)
+        return fast_list(self, self.get_queryset())
 
 
 class ReviewViewSet(viewsets.ModelViewSet):
@@ -830,9 +897,11 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """사용자별 리뷰 조회"""
+        _, expand = requested_paths(self.request)
+        queryset = Review.objects.select_related('reservation__service', *ReviewSerializer.related_paths(expand))
         if self.request.user.is_staff:
-            return Review.objects.all()
-        return Review.objects.filter(reservation__user=self.request.user)
+            return queryset
+        return queryset.filter(reservation__user=self.request.user)
 
     def perform_create(self, serializer):
         """리뷰 생성 시 예약 완료 여부 확인"""
@@ -848,7 +917,13 @@ class ReviewViewSet(viewsets.ModelViewSet):
         if Review.objects.filter(reservation=reservation).exists():
             raise permissions.PermissionDenied("이미 리뷰를 작성했습니다.")
         
-        serializer.save()
+        # 리뷰와 서비스/제공자 평점을 함께 커밋
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
 
     @action(detail=False, methods=['get'])
     def service_reviews(self, request):
@@ -860,9 +935,15 @@ class ReviewViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        reviews = Review.objects.filter(reservation__service_id=service_id)
-        serializer = self.get_serializer(reviews, many=True)
-        return Response(serializer.data)
+        _, expand = requested_paths(request)
+        reviews = Review.objects.select_related(
+            'reservation__service', *ReviewSerializer.related_paths(expand)
+        ).filter(reservation__service_id=service_id)
+        
+        paginator = ReviewCursorPagination()
+        page = paginator.paginate_queryset(reviews, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class BusinessHoursViewSet(viewsets.ReadOnlyModelViewSet):
@@ -871,6 +952,12 @@ class BusinessHoursViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = BusinessHoursSerializer
     permission_classes = [permissions.AllowAny]
 
+    def list(self, request, *args, **kwargs):
+        """영업시간 목록 조회 (카탈로그 캐시)"""
+        return catalog.cached_response(
+            request, 'business_hours', lambda: self.get_serializer(self.get_queryset(), many=True).data
+        )
+
 
 class NoticeViewSet(viewsets.ReadOnlyModelViewSet):
     """공지사항 조회 API"""
@@ -882,6 +969,63 @@ class NoticeViewSet(viewsets.ReadOnlyModelViewSet):
         """활성화된 공지사항만 반환, 상단 고정 우선"""
         return Notice.objects.filter(is_active=True).order_by('-is_pinned', '-priority', '-created_at')
 
+    def list(self, request, *args, **kwargs):
+        """공지사항 목록 조회 (카탈로그 캐시, 변경이 없으면 304)"""
+        return catalog.cached_response(
+            request, 'notices', lambda: self.get_serializer(self.get_queryset(), many=True).data
+        )
+
+
+class CatalogCacheStatsView(APIView):
+    """카탈로그 캐시 적중/실패 통계 API (관리자)"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(catalog.stats.snapshot())
+
+    def delete(self, request):
+        """캐시와 통계 초기화"""
+        catalog.clear()
+        catalog.stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ReservationExportView(APIView):
+    """예약 내보내기 API (관리자, CSV/JSONL 스트리밍)"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        params = request.query_params
+        # ?format=은 DRF 렌더러 선택에 쓰이므로 ?output=으로 형식 지정
+        fmt = params.get('output', 'csv')
+        if fmt not in FORMATS:
+            return Response(
+                {"error": "output은 csv 또는 jsonl이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            start_date = datetime.strptime(params['start'], '%Y-%m-%d').date() if params.get('start') else None
+            end_date = datetime.strptime(params['end'], '%Y-%m-%d').date() if params.get('end') else None
+            provider_id = int(params['provider']) if params.get('provider') else None
+        except ValueError:
+            return Response(
+                {"error": "올바른 필터 형식이 아닙니다. (start/end: YYYY-MM-DD, provider: ID)"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        statuses = [value for value in params.get('status', '').split(',') if value]
+
+        queryset = export_queryset(start_date, end_date, provider_id, statuses)
+        # ASGI에서는 동기 제너레이터가 전부 버퍼링되므로 비동기 이터레이터로 스트리밍
+        if isinstance(request._request, ASGIRequest):
+            lines = aexport_lines(queryset, fmt)
+        else:
+            lines = export_lines(queryset, fmt)
+        response = StreamingHttpResponse(lines, content_type=FORMATS[fmt])
+        filename = f'reservations_{timezone.localdate():%Y%m%d}.{fmt}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
     """사용자 정보 조회 API"""
@@ -891,64 +1035,3 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         """자신의 정보만 조회 가능"""
         return User.objects.filter(id=self.request.user.id)
-
-
-def check_time_updates(request, service_id):
-    """시간대 업데이트 확인 API"""
-    from rest_framework.decorators import api_view
-    from rest_framework.response import Response
-    from rest_framework import status
-    
-    date = request.GET.get('date')
-    if not date:
-        return Response({'error': '날짜가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
-    
-    try:
-        service = Service.objects.get(id=service_id)
-        
-        # 해당 날짜의 예약 가능한 시간 계산
-        available_times = []
-        
-        # 기본 영업시간 가져오기
-        business_hours = BusinessHours.objects.filter(
-            day_of_week=datetime.strptime(date, '%Y-%m-%d').weekday()
-        ).first()
-        
-        if business_hours:
-            # 영업시간 내의 시간대 생성 (30분 단위)
-            start_time = business_hours.open_time
-            end_time = business_hours.close_time
-            
-            current_time = start_time
-            while current_time < end_time:
-                time_str = current_time.strftime('%H:%M')
-                
-                # 해당 시간에 이미 확정된 예약이 있는지 확인
-                confirmed_reservation = Reservation.objects.filter(
-                    service=service,
-                    date=date,
-                    time=time_str,
-                    status='confirmed'
-                ).exists()
-                
-                # 해당 시간에 대기 중인 예약이 있는지 확인
-                pending_reservation = Reservation.objects.filter(
-                    service=service,
-                    date=date,
-                    time=time_str,
-                    status='pending'
-                ).exists()
-                
-                # 확정된 예약이 없고, 대기 중인 예약만 있거나 없는 경우에만 예약 가능
-                if not confirmed_reservation:
-                    available_times.append(time_str)
-                
-                # 30분씩 증가
-                current_time = (datetime.combine(datetime.today(), current_time) + timedelta(minutes=30)).time()
-        
-        return Response({'available_times': available_times})
-        
-    except Service.DoesNotExist:
-        return Response({'error': '서비스를 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
-    except Exception as e:
-        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -6,9 +6,19 @@ import socket
 import sys
 import os
 import time
+import secrets
 import subprocess
 import threading
 
+
+def ensure_secret_key_file(path):
+    """운영 모드용 SECRET_KEY 파일이 없으면 한 번 생성 (재시작해도 세션/토큰 유지)"""
+    if not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(secrets.token_urlsafe(50))
+    return path
+
+
 class DjangoService(win32serviceutil.ServiceFramework):
     _svc_name_ = "DjangoReservationSystem"
     _svc_display_name_ = "Django Reservation System"
@@ -38,10 +48,14 @@ class DjangoService(win32serviceutil.ServiceFramework):
         # Django 서버 실행
         while self.running:
             try:
-                # Django 서버 시작
+                # Django 서버 시작 (운영 모드: waitress 멀티 스레드, DEBUG 끔)
+                env = dict(os.environ)
+                env.setdefault('DJANGO_DEBUG', '0')
+                if not env.get('DJANGO_SECRET_KEY') and not env.get('DJANGO_SECRET_KEY_FILE'):
+                    env['DJANGO_SECRET_KEY_FILE'] = ensure_secret_key_file(r'C:\tempodiall\secret_key.txt')
                 process = subprocess.Popen([
-                    sys.executable, 'manage.py', 'runserver', '0.0.0.0:8000'
-                ], cwd=r'C:\tempodiall')
+                    sys.executable, 'manage.py', 'serve', '--host', '0.0.0.0', '--port', '8000'
+                ], cwd=r'C:\tempodiall', env=env)
                 
                 # 서비스가 중지될 때까지 대기
                 while self.running and process.poll() is None:
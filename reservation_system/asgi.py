@@ -13,4 +13,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'reservation_system.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# 예약 시간대 변경 이벤트 스트림(/api/events/slots/)은 ASGI에서 직접 처리
+from booking.events import SlotEventRouter  # noqa: E402
+
+application = SlotEventRouter(django_application)
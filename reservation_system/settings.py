@@ -10,22 +10,59 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
+from importlib.util import find_spec
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
+def env_bool(name, default):
+    """환경 변수의 참/거짓 값 (1, true, yes, on)"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return default if value in (None, '') else int(value)
+
+
+def env_list(name, default):
+    """쉼표로 구분한 환경 변수 목록"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
 
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-ey7cf9+fk*mn)5l23fh(81h^3euqg2ln#ihv9=lr4yv+6t&m(a'
-
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# 운영 모드(python manage.py serve)에서는 DJANGO_DEBUG=0으로 실행
+DEBUG = env_bool('DJANGO_DEBUG', True)
 
-ALLOWED_HOSTS = ['localhost', '127.0.0.1', '192.168.0.2', '221.153.1.152', '*']
+# SECURITY WARNING: keep the secret key used in production secret!
+# 세션과 API 접근 토큰(booking.tokens)의 서명 키이므로 운영 모드에서는 반드시 지정
+# (DJANGO_SECRET_KEY 또는 키를 담은 파일 경로 DJANGO_SECRET_KEY_FILE)
+INSECURE_SECRET_KEY = 'django-insecure-ey7cf9+fk*mn)5l23fh(81h^3euqg2ln#ihv9=lr4yv+6t&m(a'
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', '')
+if not SECRET_KEY and os.environ.get('DJANGO_SECRET_KEY_FILE'):
+    SECRET_KEY = Path(os.environ['DJANGO_SECRET_KEY_FILE']).read_text(encoding='utf-8').strip()
+if not SECRET_KEY:
+    if not DEBUG:
+        raise ImproperlyConfigured(
+            '운영 모드(DJANGO_DEBUG=0)에서는 DJANGO_SECRET_KEY 또는 DJANGO_SECRET_KEY_FILE을 지정해야 합니다.'
+        )
+    SECRET_KEY = INSECURE_SECRET_KEY
+
+ALLOWED_HOSTS = env_list('DJANGO_ALLOWED_HOSTS', ['localhost', '127.0.0.1', '192.168.0.2', '221.153.1.152', '*'])
 
 
 # Application definition
@@ -45,6 +82,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'booking.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -77,13 +116,76 @@ WSGI_APPLICATION = 'reservation_system.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
+# DJANGO_DB_ENGINE으로 선택 (sqlite: 단일 서버 설치용, postgresql: 동시 예약이 많은 사이트용)
+DB_ENGINE = os.environ.get('DJANGO_DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DJANGO_DB_NAME', 'reservation_system'),
+            'USER': os.environ.get('DJANGO_DB_USER', ''),
+            'PASSWORD': os.environ.get('DJANGO_DB_PASSWORD', ''),
+            'HOST': os.environ.get('DJANGO_DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DJANGO_DB_PORT', '5432'),
+            # 요청마다 새로 연결하지 않고 재사용 (끊긴 연결은 요청 시작 시 확인 후 다시 연결)
+            'CONN_MAX_AGE': env_int('DJANGO_DB_CONN_MAX_AGE', 600),
+            'CONN_HEALTH_CHECKS': True,
+            # PgBouncer 트랜잭션 풀링을 사용할 때는 서버 측 커서(iterator) 비활성화
+            'DISABLE_SERVER_SIDE_CURSORS': env_bool('DJANGO_DB_DISABLE_SERVER_SIDE_CURSORS', False),
+            'OPTIONS': {'connect_timeout': env_int('DJANGO_DB_CONNECT_TIMEOUT', 5)},
+        }
+    }
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DJANGO_DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'CONN_MAX_AGE': env_int('DJANGO_DB_CONN_MAX_AGE', 60),
+            'CONN_HEALTH_CHECKS': True,
+            # 쓰기 잠금을 기다리는 최대 시간(초, busy timeout)
+            'OPTIONS': {'timeout': env_int('DJANGO_DB_BUSY_TIMEOUT', 20)},
+        }
+    }
+else:
+    raise ImproperlyConfigured(f'지원하지 않는 DJANGO_DB_ENGINE입니다: {DB_ENGINE} (sqlite, postgresql)')
+
+# SQLite 연결마다 적용하는 PRAGMA (booking.db)
+SQLITE_PRAGMAS = {
+    'temp_store': 'MEMORY',
+    'cache_size': -16000,  # 16MB
+    'mmap_size': 128 * 1024 * 1024,
+}
+# serve 명령이 시작할 때 DB 파일에 적용하는 저널 모드 (파일에 유지됨)
+# WAL 모드에서는 쓰기 중에도 읽기가 막히지 않으며, WAL 파일의 연결에는 synchronous=NORMAL을 적용
+SQLITE_JOURNAL_MODE = os.environ.get('DJANGO_SQLITE_JOURNAL_MODE', 'WAL')
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# 여러 워커로 운영할 때는 프로세스 간에 공유되는 캐시를 지정
+# (예: DJANGO_CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache,
+#      DJANGO_CACHE_LOCATION=/var/tmp/reservation-cache)
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', 'reservation-system'),
     }
 }
 
+# 공개 카탈로그 캐시 (booking.catalog)
+# 로컬 메모리 캐시는 프로세스별이므로 여러 워커로 운영할 때는 공유 캐시(Redis 등)를 지정
+CATALOG_CACHE_ALIAS = 'default'
+CATALOG_CACHE_TIMEOUT = 3600  # 시그널을 거치지 않는 일괄 수정(update)에 대비한 만료 시간(초)
+
+# 영업 캘린더/제공자 근무시간 프로세스 메모리 상태의 최대 유지 시간(초) (booking.business_calendar)
+# 세대 번호를 공유하지 않는 캐시(로컬 메모리)로 여러 프로세스를 운영해도 이 시간 안에 다른 프로세스의 변경이 반영됨
+CALENDAR_STATE_MAX_AGE = env_int('DJANGO_CALENDAR_STATE_MAX_AGE', 60)
+
+# 제공자 대시보드 통계 캐시 만료 시간(초)
+PROVIDER_STATS_CACHE_TIMEOUT = 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -120,10 +222,32 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/4.2/howto/static-files/
 
 STATIC_URL = 'static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# 운영 모드의 정적 파일은 WhiteNoise가 압축본(gzip/brotli)과 함께 제공하며,
+# 해시가 붙은 파일명(collectstatic)은 1년 캐시 헤더로 응답
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
+WHITENOISE_MANIFEST_STRICT = False
+
+# 개발 모드(runserver가 정적 파일 제공)이거나 WhiteNoise가 설치되지 않은 환경에서는 미들웨어를 빼고 기본 저장소 사용
+if DEBUG or find_spec('whitenoise') is None:
+    MIDDLEWARE.remove('whitenoise.middleware.WhiteNoiseMiddleware')
+    STORAGES['staticfiles']['BACKEND'] = 'django.contrib.staticfiles.storage.StaticFilesStorage'
 
 # Media files (Uploaded files)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# 별도 웹 서버 없이 운영할 때 업로드 파일도 Django가 제공 (캐시 헤더 포함)
+SERVE_MEDIA = env_bool('DJANGO_SERVE_MEDIA', True)
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24  # 1일 (업로드 파일명에는 해시가 없으므로 짧게)
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -148,21 +272,72 @@ SESSION_COOKIE_SAMESITE = 'Lax'
 SESSION_COOKIE_AGE = 1209600  # 2주
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
 
+# 세션 저장소 (DJANGO_SESSION_BACKEND)
+# cached_db: 캐시에서 읽고 변경 시 DB에도 기록 (캐시 실패 시 DB에서 조회)
+# signed_cookies: 서명된 쿠키에 저장 (DB/캐시 조회 없음, 로그아웃 전에 복사된 쿠키는 만료 시까지 유효)
+# db: 요청마다 DB에서 조회
+SESSION_BACKENDS = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+SESSION_BACKEND = os.environ.get('DJANGO_SESSION_BACKEND', 'cached_db')
+if SESSION_BACKEND not in SESSION_BACKENDS:
+    raise ImproperlyConfigured(
+        f'지원하지 않는 DJANGO_SESSION_BACKEND입니다: {SESSION_BACKEND} ({", ".join(SESSION_BACKENDS)})'
+    )
+SESSION_ENGINE = SESSION_BACKENDS[SESSION_BACKEND]
+
+# 세션 캐시는 카탈로그 캐시와 분리 (세션이 많아져도 카탈로그 항목이 밀려나지 않음)
+# 여러 워커로 운영할 때는 공유 캐시를 지정하거나 DJANGO_SESSION_BACKEND=db/signed_cookies 사용
+# (serve 명령은 로컬 메모리 세션 캐시로 여러 워커를 실행하지 않음)
+SESSION_CACHE_ALIAS = 'sessions'
+CACHES[SESSION_CACHE_ALIAS] = {
+    'BACKEND': os.environ.get('DJANGO_SESSION_CACHE_BACKEND', CACHES['default']['BACKEND']),
+    'LOCATION': os.environ.get('DJANGO_SESSION_CACHE_LOCATION', CACHES['default']['LOCATION'] + '-sessions'),
+    'TIMEOUT': SESSION_COOKIE_AGE,
+}
+if CACHES[SESSION_CACHE_ALIAS]['BACKEND'].endswith(('LocMemCache', 'FileBasedCache')):
+    CACHES[SESSION_CACHE_ALIAS]['OPTIONS'] = {'MAX_ENTRIES': env_int('DJANGO_SESSION_CACHE_MAX_ENTRIES', 10000)}
+
 # REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        # Authorization: Bearer <접근 토큰> (키오스크/스크립트용, booking.tokens)
+        # 첫 번째 인증 방식의 WWW-Authenticate로 인증 실패 시 401 응답
+        'booking.authentication.AccessTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
+    # orjson이 설치되어 있으면 사용 (없으면 표준 json, booking.renderers)
+    'DEFAULT_RENDERER_CLASSES': [
+        'booking.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'booking.renderers.JSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
+    # 예약/리뷰 목록 커서 페이지네이션의 기본/최대 페이지 크기 (booking.pagination)
+    'PAGE_SIZE': env_int('DJANGO_PAGE_SIZE', 50),
+    'MAX_PAGE_SIZE': env_int('DJANGO_MAX_PAGE_SIZE', 200),
 }
 
+# API 접근 토큰 유효 시간(초) (booking.tokens)
+ACCESS_TOKEN_LIFETIME = env_int('DJANGO_ACCESS_TOKEN_LIFETIME', 15 * 60)
+REFRESH_TOKEN_LIFETIME = env_int('DJANGO_REFRESH_TOKEN_LIFETIME', 7 * 24 * 60 * 60)
+
+# 응답 압축 (booking.middleware): 이 크기(바이트) 미만의 응답은 압축하지 않음
+COMPRESSION_MIN_SIZE = env_int('DJANGO_COMPRESSION_MIN_SIZE', 1024)
+# brotli 압축 수준 (0~11, 동적 응답은 속도를 위해 중간 수준)
+COMPRESSION_BROTLI_QUALITY = env_int('DJANGO_COMPRESSION_BROTLI_QUALITY', 5)
+
+# 페이지네이션은 뷰별로 지정하고 PAGE_SIZE만 전역 설정하므로 DRF 안내에 따라 경고를 끔
+SILENCED_SYSTEM_CHECKS = ['rest_framework.W001']
+
 # Admin 사이트 설정
 ADMIN_SITE_HEADER = "GolfPro 관리"
 ADMIN_SITE_TITLE = "GolfPro 관리"
@@ -14,10 +14,14 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_control
+from django.views.static import serve
 from rest_framework.authtoken import views as auth_views
 
 # Admin 사이트 설정
@@ -35,3 +39,12 @@ urlpatterns = [
 # Media files serving in development
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+elif settings.SERVE_MEDIA:
+    # 운영 모드에서 별도 웹 서버 없이 업로드 파일 제공 (If-Modified-Since 304, 캐시 헤더)
+    urlpatterns += [
+        re_path(
+            r'^%s(?P<path>.*)$' % re.escape(settings.MEDIA_URL.lstrip('/')),
+            cache_control(public=True, max_age=settings.MEDIA_CACHE_MAX_AGE)(serve),
+            {'document_root': settings.MEDIA_ROOT},
+        ),
+    ]